@@ -0,0 +1,189 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from constants import *
+from game import COLLISION_MODES
+from headless import POLICIES, create_headless_game
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+COLUMNS = ['tuning', 'seed', 'difficulty', 'policy', 'collision_mode', 'score', 'level', 'frames', 'seconds_survived', 'game_over',
+           'boss_kill_frame', 'mothership_kill_frame']
+SPAWN_KEYS = ('enemy_spawn_base', 'enemy_spawn_per_level', 'enemy_spawn_min')
+DIFFICULTIES = ('easy', 'normal', 'hard')
+PLAYER_STATS = ('health', 'speed', 'ammo')
+
+
+def check_tuning_key(key):
+    parts = key.split('.')
+    if key in SPAWN_KEYS:
+        return
+    if len(parts) == 2 and parts[0] in ('multiplier', 'power_up_rate') and parts[1] in DIFFICULTIES:
+        return
+    if len(parts) == 3 and parts[0] == 'player' and parts[1] in DIFFICULTIES and parts[2] in PLAYER_STATS:
+        return
+    raise ValueError(f"Unknown tuning key '{key}'")
+
+
+def apply_tuning(game, tuning):
+    game.difficulty_multipliers = dict(game.difficulty_multipliers)
+    game.power_up_rates = dict(game.power_up_rates)
+    game.player_settings = {difficulty: dict(settings) for difficulty, settings in game.player_settings.items()}
+
+    for key, value in tuning.items():
+        parts = key.split('.')
+        if key in SPAWN_KEYS:
+            setattr(game, key, int(value))
+        elif parts[0] == 'multiplier':
+            game.difficulty_multipliers[parts[1]] = float(value)
+        elif parts[0] == 'power_up_rate':
+            game.power_up_rates[parts[1]] = int(value)
+        elif parts[0] == 'player':
+            game.player_settings[parts[1]][parts[2]] = int(value)
+
+
+def parse_tuning(assignments):
+    keys = []
+    choices = []
+    for assignment in assignments:
+        key, _, values = assignment.partition('=')
+        check_tuning_key(key)
+        keys.append(key)
+        try:
+            choices.append([float(value) for value in values.split(',')])
+        except ValueError:
+            raise ValueError(f"Tuning '{key}' needs comma-separated numbers, got '{values}'")
+    return [dict(zip(keys, combination)) for combination in itertools.product(*choices)]
+
+
+def run_tuned_session(task):
+    tuning, seed, difficulty, policy, collision_mode, max_frames = task
+    game = create_headless_game(difficulty, seed, POLICIES[policy], collision_mode)
+    apply_tuning(game, tuning)
+    game.reset_game(seed)
+
+    boss_kill_frame = None
+    mothership_kill_frame = None
+    frames = 0
+    while game.state == 'playing' and frames < max_frames:
+        had_boss = game.boss is not None
+        had_mothership = game.alien_mothership is not None
+        level = game.level
+        game.update_game()
+        frames += 1
+
+        if had_boss and game.boss is None and game.level > level and boss_kill_frame is None:
+            boss_kill_frame = frames
+        if had_mothership and game.alien_mothership is None and mothership_kill_frame is None:
+            mothership_kill_frame = frames
+
+    return {
+        'tuning': json.dumps(tuning, sort_keys=True),
+        'seed': seed,
+        'difficulty': difficulty,
+        'policy': policy,
+        'collision_mode': collision_mode,
+        'score': game.score,
+        'level': game.level,
+        'frames': frames,
+        'seconds_survived': frames / FPS,
+        'game_over': game.state == 'game_over',
+        'boss_kill_frame': boss_kill_frame,
+        'mothership_kill_frame': mothership_kill_frame
+    }
+
+
+class ResultWriter:
+    def __init__(self, path, batch_size=256):
+        self.path = path
+        self.batch_size = batch_size
+        self.rows = []
+        self.parquet_writer = None
+        self.csv_file = None
+        self.csv_writer = None
+
+        if not path.endswith('.parquet'):
+            self.csv_file = open(path, 'w', newline='')
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=COLUMNS)
+            self.csv_writer.writeheader()
+
+    def write(self, row):
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(row)
+            return
+
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        table = pyarrow.Table.from_pydict({column: [row[column] for row in self.rows] for column in COLUMNS})
+        if self.parquet_writer is None:
+            self.parquet_writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.parquet_writer.write_table(table)
+        self.rows = []
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+        else:
+            self.flush()
+            if self.parquet_writer is not None:
+                self.parquet_writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run seeded headless sessions in parallel for difficulty tuning.")
+    parser.add_argument('--sessions', type=int, default=100, help="sessions per tuning combination")
+    parser.add_argument('--difficulty', choices=DIFFICULTIES, default='normal')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='autopilot')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-frames', type=int, default=36000)
+    parser.add_argument('--collisions', choices=COLLISION_MODES, default='discrete')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--set', dest='assignments', action='append', default=[], metavar='KEY=V1[,V2...]',
+                        help="override a tuning value, e.g. multiplier.hard=1.3 or player.hard.health=3,4,5; "
+                             "several values sweep every combination")
+    parser.add_argument('--output', default='batch_results.parquet' if pyarrow else 'batch_results.csv')
+    args = parser.parse_args()
+
+    try:
+        tunings = parse_tuning(args.assignments)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.output.endswith('.parquet') and pyarrow is None:
+        parser.error("writing .parquet needs pyarrow; install it or pass a .csv --output")
+
+    tasks = [(tuning, args.seed + i, args.difficulty, args.policy, args.collisions, args.max_frames)
+             for tuning in tunings for i in range(args.sessions)]
+    chunksize = max(1, len(tasks) // (args.workers * 8))
+
+    start = time.perf_counter()
+    total_frames = 0
+    writer = ResultWriter(args.output)
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            for result in executor.map(run_tuned_session, tasks, chunksize=chunksize):
+                writer.write(result)
+                total_frames += result['frames']
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(tasks)} sessions on {args.workers} workers, {total_frames} frames in {elapsed:.2f}s "
+          f"({len(tasks) / max(elapsed, 1e-9):.1f} sessions/s, {total_frames / max(elapsed, 1e-9):.0f} frames/s) "
+          f"-> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import pygame
+import numpy as np
+from constants import *
+from controls import idle_policy, autopilot_policy
+from headless import create_headless_game
+from game import COLLISION_MODES
+from pipeline import FramePipeline, pipeline_supported, usable_cpus
+from profiler import percentile
+from quality import QUALITY_TIERS
+from bullets import BulletPool
+from effects import PowerUpNotification, ParticleEmitter
+from entities import EnemySwarm, Boss, AlienMothership, PowerUp, Player
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks')
+REPORTED_STAGES = ['update', 'update.collisions', 'draw', 'frame']
+
+
+def fill_enemies(game, rng, count=500):
+    while len(game.enemies) < count:
+        x = rng.randint(50, GAME_AREA_WIDTH - 50)
+        y = rng.randint(-50, SCREEN_HEIGHT // 2)
+        game.enemies.spawn(x, y, rng.choice(['basic', 'basic', 'heavy', 'fast']))
+
+
+def fill_bullets(game, rng, count=2000):
+    while len(game.player_bullets) < count // 2:
+        game.player_bullets.spawn(rng.randint(0, GAME_AREA_WIDTH), rng.randint(0, SCREEN_HEIGHT), (0, -10),
+                                  CYAN, 2, 1.3)
+    while len(game.enemy_bullets) < count // 2:
+        game.enemy_bullets.spawn(rng.randint(0, GAME_AREA_WIDTH), rng.randint(0, SCREEN_HEIGHT),
+                                 (rng.uniform(-2, 2), 5), RED, 1, 1.0)
+
+
+def fill_mothership(game, rng):
+    if not game.alien_mothership:
+        game.alien_mothership = AlienMothership(GAME_AREA_WIDTH // 2, 150)
+    game.alien_mothership.health = 10
+    game.alien_mothership.shoot_timer = 26
+
+
+def fill_particles(game, rng, count=1000):
+    quality = game.quality
+    while len(game.particles) < count:
+        if quality.max_particles is not None and len(game.particles) >= quality.max_particles:
+            break
+        game.particles.burst(rng, rng.randint(0, GAME_AREA_WIDTH), rng.randint(0, SCREEN_HEIGHT), 50, 3, 12,
+                             palette=[ORANGE, YELLOW, RED], density=quality.particle_density,
+                             limit=quality.max_particles)
+
+
+def fill_notifications(game, rng, count=12):
+    while len(game.power_up_notifications) < count:
+        power_type = rng.choice(['triple_shot', 'shield', 'heal', 'speed', 'ammo', 'mothership_spawned'])
+        game.power_up_notifications.append(
+            PowerUpNotification(power_type, rng.randint(100, GAME_AREA_WIDTH - 100), rng.randint(200, 700))
+        )
+
+
+def fill_worst_case(game, rng):
+    fill_enemies(game, rng)
+    fill_bullets(game, rng)
+    fill_mothership(game, rng)
+    fill_particles(game, rng)
+    fill_notifications(game, rng)
+
+
+SCENARIOS = {
+    'enemies_500': fill_enemies,
+    'bullets_2000': fill_bullets,
+    'mothership_phase3': fill_mothership,
+    'particles_1000': fill_particles,
+    'notifications': fill_notifications,
+    'worst_case': fill_worst_case
+}
+
+
+SESSIONS = {
+    'session_idle': idle_policy,
+    'session_autopilot': autopilot_policy
+}
+
+
+def prepare_frame(game, rng, populate):
+    game.state = 'playing'
+    game.mothership_spawned = True
+    game.level_timer = 0
+    game.player.power_ups['shield'] = 1000
+    game.player.ammo = game.player.max_ammo
+    populate(game, rng)
+
+
+def create_game(seed, policy, collision_mode, quality_tier):
+    game = create_headless_game('normal', seed, policy, collision_mode)
+    game.quality.set_tier(quality_tier)
+    return game
+
+
+def run_scenario(name, frames=300, warmup=30, seed=0, collision_mode='discrete', pipelined=False, quality_tier=0):
+    game = create_game(seed, idle_policy, collision_mode, quality_tier)
+    game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rng = random.Random(seed)
+    populate = SCENARIOS[name]
+    profiler = game.profiler
+    profiler.enable()
+    pipeline = FramePipeline(game) if pipelined else None
+
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            profiler.reset()
+        prepare_frame(game, rng, populate)
+        profiler.begin_frame()
+        if pipeline is not None:
+            pipeline.run_frame(1, 1.0)
+        else:
+            with profiler.section('update'):
+                game.update_game()
+            with profiler.section('draw'):
+                game.draw_game()
+        profiler.end_frame(game.profile_counts())
+
+    if pipeline is not None:
+        pipeline.close()
+
+    profiler.disable()
+    stages = profiler.summary()
+    counts = {key: value for key, value in profiler.frames[-1].items() if key.startswith('count.')}
+    return {
+        'frames': frames,
+        'fps': 1000 / max(stages['frame']['mean'], 1e-9),
+        'stages': stages,
+        'counts': counts
+    }
+
+
+def run_session(name, frames=300, warmup=30, seed=0, collision_mode='discrete', quality_tier=0):
+    policy = SESSIONS[name]
+    game = create_game(seed, policy, collision_mode, quality_tier)
+    samples = []
+
+    for frame in range(warmup + frames):
+        if game.state != 'playing':
+            seed += 1
+            game = create_game(seed, policy, collision_mode, quality_tier)
+        start = time.perf_counter()
+        game.update_game()
+        if frame >= warmup:
+            samples.append((time.perf_counter() - start) * 1000)
+
+    ordered = sorted(samples)
+    update = {
+        'p50': percentile(ordered, 0.50),
+        'p95': percentile(ordered, 0.95),
+        'p99': percentile(ordered, 0.99),
+        'mean': sum(ordered) / len(ordered)
+    }
+    return {
+        'frames': frames,
+        'fps': 1000 / max(update['mean'], 1e-9),
+        'stages': {'update': update},
+        'counts': game.profile_counts()
+    }
+
+
+MEMORY_ENTITIES = [
+    (PowerUp, lambda i: (i % GAME_AREA_WIDTH, -30, 'shield'), ('colors',)),
+    (Boss, lambda i: (GAME_AREA_WIDTH // 2, 150), ()),
+    (AlienMothership, lambda i: (GAME_AREA_WIDTH // 2, 150), ()),
+    (Player, lambda i: (GAME_AREA_WIDTH // 2, SCREEN_HEIGHT - 150, 'normal'), ()),
+    (PowerUpNotification, lambda i: ('shield', i % GAME_AREA_WIDTH, 450), ('messages', 'colors'))
+]
+
+
+def dict_based(cls, per_instance_tables):
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in cls.__slots__ and key not in ('__slots__', '__dict__', '__weakref__')}
+    init = cls.__init__
+
+    def __init__(self, *args):
+        init(self, *args)
+        for name in per_instance_tables:
+            setattr(self, name, dict(getattr(cls, name)))
+
+    namespace['__init__'] = __init__
+    return type(cls.__name__, (), namespace)
+
+
+def bytes_per_entity(factory, arguments, count):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [factory(*arguments(i)) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start - sys.getsizeof(objects)
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+
+def run_memory(count=10000):
+    results = {}
+    for cls, arguments, per_instance_tables in MEMORY_ENTITIES:
+        results[cls.__name__] = {
+            'dict': bytes_per_entity(dict_based(cls, per_instance_tables), arguments, count),
+            'slots': bytes_per_entity(cls, arguments, count)
+        }
+    for name, pool in (('EnemySwarm', EnemySwarm(count)), ('BulletPool', BulletPool(count)),
+                       ('ParticleEmitter', ParticleEmitter(count))):
+        results[name] = {'slots': sum(array.itemsize for array in pool.arrays)}
+    return results
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'local'
+
+
+def compare(baseline, results):
+    print(f"\nCompared with {baseline['commit']}:")
+    for name, result in results['scenarios'].items():
+        previous = baseline['scenarios'].get(name)
+        if previous is None:
+            continue
+        changes = []
+        for stage in REPORTED_STAGES:
+            if stage in result['stages'] and stage in previous['stages']:
+                old = previous['stages'][stage]['p50']
+                new = result['stages'][stage]['p50']
+                change = (new - old) / old * 100 if old else 0.0
+                changes.append(f"{stage} {change:+.1f}%")
+        print(f"  {name:<18} " + "  ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time update_game, handle_collisions and draw_game on synthetic worst-case states "
+                                                 "and update_game on ordinary headless sessions.")
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help=f"any of {', '.join(list(SCENARIOS) + list(SESSIONS))} (default: all)")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--session-frames', type=int, default=3600,
+                        help="frames to time for each session_* scenario")
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="results file (default: benchmarks/<commit>.json)")
+    parser.add_argument('--compare', metavar='FILE', help="earlier results file to diff against")
+    parser.add_argument('--collisions', choices=COLLISION_MODES, default='discrete',
+                        help="collision mode for every scenario")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="also run each scenario with the update overlapped on a worker thread and report the ratio")
+    parser.add_argument('--quality', choices=[tier['name'] for tier in QUALITY_TIERS], default='high',
+                        help="effect quality tier to hold for the whole run")
+    parser.add_argument('--memory-count', type=int, default=10000, help="live entities for the memory benchmark")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS and name not in SESSIONS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    names = args.scenarios or list(SCENARIOS) + list(SESSIONS)
+    commit = current_commit()
+    quality_tier = [tier['name'] for tier in QUALITY_TIERS].index(args.quality)
+    if args.pipeline and not pipeline_supported():
+        print("Warning: only one CPU is available, so the pipeline can only add overhead here.")
+
+    results = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'collisions': args.collisions,
+        'pipeline': args.pipeline,
+        'cpus': usable_cpus(),
+        'quality': args.quality,
+        'scenarios': {}
+    }
+
+    print(f"{'scenario':<18} {'fps':>8} " + " ".join(f"{stage + ' p50/p95 ms':>26}" for stage in REPORTED_STAGES))
+    for name in names:
+        if name in SESSIONS:
+            result = run_session(name, args.session_frames, args.warmup, args.seed, args.collisions, quality_tier)
+        else:
+            result = run_scenario(name, args.frames, args.warmup, args.seed, args.collisions, quality_tier=quality_tier)
+            if args.pipeline:
+                result['pipelined'] = run_scenario(name, args.frames, args.warmup, args.seed, args.collisions, True,
+                                                   quality_tier)
+        results['scenarios'][name] = result
+        stages = result['stages']
+        columns = [f"{stages[stage]['p50']:.3f}/{stages[stage]['p95']:.3f}" if stage in stages else '-'
+                   for stage in REPORTED_STAGES]
+        print(f"{name:<18} {result['fps']:>8.1f} " + " ".join(f"{column:>26}" for column in columns))
+
+    if args.pipeline:
+        print(f"\n{'scenario':<18} {'serial p50':>11} {'pipelined p50':>14} {'speedup':>8}  ({results['cpus']} usable CPUs)")
+        for name, result in results['scenarios'].items():
+            if 'pipelined' in result:
+                serial = result['stages']['frame']['p50']
+                pipelined = result['pipelined']['stages']['frame']['p50']
+                print(f"{name:<18} {serial:>11.3f} {pipelined:>14.3f} {serial / pipelined:>7.2f}x")
+
+    results['memory'] = run_memory(args.memory_count)
+    print(f"\n{'entity':<20} {'dict bytes':>11} {'slots bytes':>12}  ({args.memory_count} live)")
+    for name, sizes in results['memory'].items():
+        dict_bytes = f"{sizes['dict']:.0f}" if 'dict' in sizes else '-'
+        print(f"{name:<20} {dict_bytes:>11} {sizes['slots']:>12.0f}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=1)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+import pygame
+import math
+import numpy as np
+from constants import *
+from pooling import ColumnPool
+
+
+def round_half_away(values):
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5))
+
+
+def round_half_away_scalar(value):
+    return math.floor(value + 0.5) if value >= 0 else math.ceil(value - 0.5)
+
+
+def sweep_times(left, top, width, height, vx, vy, target_left, target_top, target_right, target_bottom):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        enter_x, exit_x = slab(left, width, vx, target_left, target_right)
+        enter_y, exit_y = slab(top, height, vy, target_top, target_bottom)
+    enter = np.maximum(enter_x, enter_y)
+    leave = np.minimum(exit_x, exit_y)
+    return np.where((enter < leave) & (enter < 1) & (leave > 0), np.maximum(enter, 0), np.inf)
+
+
+def slab(start, size, velocity, target_start, target_end):
+    first = (target_start - size - start) / velocity
+    second = (target_end - start) / velocity
+    inside = (start < target_end) & (target_start < start + size)
+    moving = velocity != 0
+    enter = np.where(moving, np.minimum(first, second), np.where(inside, -np.inf, np.inf))
+    leave = np.where(moving, np.maximum(first, second), np.where(inside, np.inf, -np.inf))
+    return enter, leave
+
+
+def sweep_time(left, top, width, height, vx, vy, target_left, target_top, target_right, target_bottom):
+    enter_x, exit_x = slab_scalar(left, width, vx, target_left, target_right)
+    enter_y, exit_y = slab_scalar(top, height, vy, target_top, target_bottom)
+    enter = max(enter_x, enter_y)
+    leave = min(exit_x, exit_y)
+    if enter < leave and enter < 1 and leave > 0:
+        return max(enter, 0)
+    return math.inf
+
+
+def slab_scalar(start, size, velocity, target_start, target_end):
+    if velocity != 0:
+        first = (target_start - size - start) / velocity
+        second = (target_end - start) / velocity
+        return min(first, second), max(first, second)
+    if start < target_end and target_start < start + size:
+        return -math.inf, math.inf
+    return math.inf, -math.inf
+
+
+class BulletPool(ColumnPool):
+    columns = (('x', float), ('y', float), ('prev_x', float), ('prev_y', float), ('vx', float), ('vy', float),
+               ('left', np.int64), ('top', np.int64), ('width', np.int64), ('height', np.int64),
+               ('damage', np.int32), ('size', float), ('color_index', np.int16), ('serial', np.int64))
+
+    def __init__(self, capacity=4096):
+        super().__init__(capacity)
+        self.next_serial = 0
+        self.colors = []
+        self.color_indices = {}
+
+    def copy_from(self, pool):
+        super().copy_from(pool)
+        self.colors = list(pool.colors)
+
+    def color_index_of(self, color):
+        color_index = self.color_indices.get(color)
+        if color_index is None:
+            color_index = len(self.colors)
+            self.colors.append(color)
+            self.color_indices[color] = color_index
+        return color_index
+
+    def spawn(self, x, y, velocity, color=WHITE, damage=1, size=1.0):
+        if self.count >= self.capacity:
+            return False
+
+        x = float(x)
+        y = float(y)
+        size = float(size)
+        self.add((x, y, x, y, float(velocity[0]), float(velocity[1]), int(x), int(y), int(6 * size),
+                  int(12 * size), int(damage), size, self.color_index_of(color), self.next_serial))
+        self.next_serial += 1
+        return True
+
+    def spawn_batch(self, x, y, vx, vy, damage, size, palette, palette_index):
+        count = min(len(x), self.capacity - self.count)
+        if count <= 0:
+            return 0
+
+        color_indices = [self.color_index_of(color) for color in palette]
+        if not self.vectorized:
+            for row in zip(x[:count], y[:count], vx[:count], vy[:count], damage[:count], size[:count],
+                           palette_index[:count]):
+                self.spawn(row[0], row[1], (row[2], row[3]), palette[row[6]], row[4], row[5])
+            return count
+
+        batch = slice(self.count, self.count + count)
+        x = np.asarray(x[:count], dtype=float)
+        y = np.asarray(y[:count], dtype=float)
+        size = np.asarray(size[:count], dtype=float)
+        self.x[batch] = x
+        self.y[batch] = y
+        self.prev_x[batch] = x
+        self.prev_y[batch] = y
+        self.vx[batch] = vx[:count]
+        self.vy[batch] = vy[:count]
+        self.width[batch] = (6 * size).astype(np.int64)
+        self.height[batch] = (12 * size).astype(np.int64)
+        self.left[batch] = x.astype(np.int64)
+        self.top[batch] = y.astype(np.int64)
+        self.damage[batch] = damage[:count]
+        self.size[batch] = size
+        self.color_index[batch] = np.array(color_indices, dtype=np.int16)[palette_index[:count]]
+        self.serial[batch] = np.arange(self.next_serial, self.next_serial + count)
+        self.next_serial += count
+        self.count += count
+        return count
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        if not self.vectorized:
+            x = self.x
+            y = self.y
+            vx = self.vx
+            vy = self.vy
+            left = self.left
+            top = self.top
+            width = self.width
+            height = self.height
+            self.prev_x[:] = x
+            self.prev_y[:] = y
+            for i in range(n):
+                x[i] += vx[i]
+                y[i] += vy[i]
+                left[i] = round_half_away_scalar(x[i]) - width[i] // 2
+                top[i] = round_half_away_scalar(y[i]) - height[i] // 2
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        y += self.vy[:n]
+        x += self.vx[:n]
+        self.left[:n] = round_half_away(x) - self.width[:n] // 2
+        self.top[:n] = round_half_away(y) - self.height[:n] // 2
+
+    def cull(self, min_y=None, max_y=None):
+        n = self.count
+        if n == 0:
+            return
+        if not self.vectorized:
+            low = -math.inf if min_y is None else min_y
+            high = math.inf if max_y is None else max_y
+            offscreen = [i for i, (x, y) in enumerate(zip(self.x, self.y))
+                         if not 0 <= x <= GAME_AREA_WIDTH or not low <= y <= high]
+            if offscreen:
+                self.remove(offscreen)
+            return
+
+        x = self.x[:n]
+        offscreen = (x < 0) | (x > GAME_AREA_WIDTH)
+        if min_y is not None:
+            offscreen |= self.y[:n] < min_y
+        if max_y is not None:
+            offscreen |= self.y[:n] > max_y
+        self.remove_mask(offscreen)
+
+    def compact(self, mask):
+        n = self.count
+        removed = int(np.count_nonzero(mask))
+        if removed == 0:
+            return
+        keep = n - removed
+        holes = np.flatnonzero(mask[:keep])
+        if len(holes):
+            fillers = keep + np.flatnonzero(~mask[keep:n])
+            for array in self.arrays:
+                array[holes] = array[fillers]
+        self.count = keep
+
+    def order(self):
+        if not self.vectorized:
+            return np.arange(self.count)
+        return np.argsort(self.serial[:self.count], kind='stable')
+
+    def overlap_mask(self, rect):
+        n = self.count
+        left = self.left[:n]
+        top = self.top[:n]
+        return ((left < rect.right) & (rect.left < left + self.width[:n]) &
+                (top < rect.bottom) & (rect.top < top + self.height[:n]))
+
+    def overlapping(self, rect):
+        if not self.vectorized:
+            rect_left, rect_top, rect_right, rect_bottom = rect.left, rect.top, rect.right, rect.bottom
+            return [i for i, (left, top, width, height) in enumerate(zip(self.left, self.top, self.width, self.height))
+                    if left < rect_right and rect_left < left + width and top < rect_bottom and rect_top < top + height]
+
+        hits = np.flatnonzero(self.overlap_mask(rect))
+        if len(hits) > 1:
+            hits = hits[np.argsort(self.serial[hits], kind='stable')]
+        return hits.tolist()
+
+    def start_corners(self):
+        width = self.column('width')
+        height = self.column('height')
+        return (round_half_away(self.column('prev_x')) - width // 2,
+                round_half_away(self.column('prev_y')) - height // 2)
+
+    def swept_bounds(self):
+        start_left, start_top = self.start_corners()
+        left = self.column('left')
+        top = self.column('top')
+        right = np.maximum(start_left, left).astype(np.int64) + self.column('width')
+        bottom = np.maximum(start_top, top).astype(np.int64) + self.column('height')
+        return (np.minimum(start_left, left).astype(np.int64), np.minimum(start_top, top).astype(np.int64),
+                right, bottom)
+
+    def swept(self, rect, dx=0.0, dy=0.0):
+        target_left = rect.left - dx
+        target_top = rect.top - dy
+        target_right = rect.right - dx
+        target_bottom = rect.bottom - dy
+        if not self.vectorized:
+            region = (math.floor(min(rect.left, target_left)) - 1, math.floor(min(rect.top, target_top)) - 1,
+                      math.ceil(max(rect.right, target_right)) + 1, math.ceil(max(rect.bottom, target_bottom)) + 1)
+            return [i for i in self.reaching(*region)
+                    if self.sweep_row(i, target_left, target_top, target_right, target_bottom, dx, dy) < math.inf]
+
+        n = self.count
+        start_left, start_top = self.start_corners()
+        times = sweep_times(start_left, start_top, self.width[:n], self.height[:n],
+                            self.left[:n] - start_left - dx, self.top[:n] - start_top - dy,
+                            target_left, target_top, target_right, target_bottom)
+        hits = np.flatnonzero(np.isfinite(times))
+        if len(hits) > 1:
+            hits = hits[np.argsort(self.serial[hits], kind='stable')]
+        return hits.tolist()
+
+    def reaching(self, region_left, region_top, region_right, region_bottom):
+        return [i for i, (vx, vy, left, top, width, height) in enumerate(zip(
+                    self.vx, self.vy, self.left, self.top, self.width, self.height))
+                if left - abs(vx) - width < region_right and region_left < left + 2 * width + abs(vx) and
+                top - abs(vy) - height < region_bottom and region_top < top + 2 * height + abs(vy)]
+
+    def sweep_row(self, i, target_left, target_top, target_right, target_bottom, dx=0.0, dy=0.0):
+        width = self.width[i]
+        height = self.height[i]
+        start_left = round_half_away_scalar(self.prev_x[i]) - width // 2
+        start_top = round_half_away_scalar(self.prev_y[i]) - height // 2
+        return sweep_time(start_left, start_top, width, height, self.left[i] - start_left - dx,
+                          self.top[i] - start_top - dy, target_left, target_top, target_right, target_bottom)
+
+    def draw(self, screen, alpha=1.0):
+        if not self.vectorized:
+            if alpha < 1:
+                lefts = [round_half_away_scalar(prev_x + (x - prev_x) * alpha) - width // 2
+                         for prev_x, x, width in zip(self.prev_x, self.x, self.width)]
+                tops = [round_half_away_scalar(prev_y + (y - prev_y) * alpha) - height // 2
+                        for prev_y, y, height in zip(self.prev_y, self.y, self.height)]
+            else:
+                lefts = self.left
+                tops = self.top
+            widths = self.width
+            heights = self.height
+            color_indices = self.color_index
+        else:
+            order = self.order()
+            if alpha < 1:
+                x = self.prev_x[order] + (self.x[order] - self.prev_x[order]) * alpha
+                y = self.prev_y[order] + (self.y[order] - self.prev_y[order]) * alpha
+                lefts = (round_half_away(x) - self.width[order] // 2).astype(np.int64).tolist()
+                tops = (round_half_away(y) - self.height[order] // 2).astype(np.int64).tolist()
+            else:
+                lefts = self.left[order].tolist()
+                tops = self.top[order].tolist()
+            widths = self.width[order].tolist()
+            heights = self.height[order].tolist()
+            color_indices = self.color_index[order].tolist()
+        colors = self.colors
+
+        rects = []
+        for left, top, width, height, color_index in zip(lefts, tops, widths, heights, color_indices):
+            rects.append(pygame.draw.ellipse(screen, colors[color_index], (left, top, width, height)))
+            pygame.draw.ellipse(screen, WHITE, (left + 2, top + 2, width - 4, height - 4))
+        return rects
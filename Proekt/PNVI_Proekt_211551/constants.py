@@ -1,13 +1,10 @@
-import pygame
-
-pygame.init()
-pygame.mixer.init()
-
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 900
 GAME_AREA_WIDTH = 900
 INFO_PANEL_WIDTH = 300
 FPS = 60
+MAX_RENDER_FPS = 120
+MAX_CATCHUP_STEPS = 5
 
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
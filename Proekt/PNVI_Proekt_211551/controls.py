@@ -0,0 +1,65 @@
+import pygame
+from constants import *
+
+
+class InputState:
+    def __init__(self, left=False, right=False, up=False, down=False, shoot=False, mothership=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.shoot = shoot
+        self.mothership = mothership
+
+
+class KeyboardInput:
+    def poll(self, game):
+        keys = pygame.key.get_pressed()
+        return InputState(
+            left=keys[pygame.K_LEFT],
+            right=keys[pygame.K_RIGHT],
+            up=keys[pygame.K_UP],
+            down=keys[pygame.K_DOWN],
+            shoot=keys[pygame.K_SPACE],
+            mothership=keys[pygame.K_m]
+        )
+
+
+class ScriptedInput:
+    def __init__(self, policy):
+        self.policy = policy
+
+    def poll(self, game):
+        return self.policy(game)
+
+
+def idle_policy(game):
+    return InputState()
+
+
+def autopilot_policy(game):
+    player = game.player
+    bullets = game.enemy_bullets
+    n = len(bullets)
+    threats = any(abs(x - player.x) < 40 and 0 < player.y - y < 150 for x, y in zip(bullets.x[:n], bullets.y[:n]))
+
+    target_x = None
+    if game.alien_mothership:
+        target_x = game.alien_mothership.x
+    elif game.boss:
+        target_x = game.boss.x
+    elif len(game.enemies):
+        target_x = min(game.enemies.x[:len(game.enemies)], key=lambda x: abs(x - player.x))
+
+    left = right = False
+    if threats:
+        if player.x > GAME_AREA_WIDTH // 2:
+            left = True
+        else:
+            right = True
+    elif target_x is not None:
+        left = target_x < player.x - 5
+        right = target_x > player.x + 5
+
+    return InputState(left=left, right=right, shoot=True)
+
@@ -0,0 +1,178 @@
+import json
+import math
+import os
+import numpy as np
+import constants
+from graphics import ENEMY_HULLS
+
+DEFINITIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'enemies.json')
+
+
+class DefinitionError(Exception):
+    pass
+
+
+def straight_movement(vertical):
+    def move(x, y, player_x, speed):
+        return x, y + speed * vertical
+    return move, move
+
+
+def zigzag_movement(vertical, amplitude, frequency):
+    def move(x, y, player_x, speed):
+        y = y + speed * vertical
+        return x + np.sin(y * frequency) * amplitude, y
+
+    def step(x, y, player_x, speed):
+        y = y + speed * vertical
+        return x + math.sin(y * frequency) * amplitude, y
+    return move, step
+
+
+def track_movement(horizontal, vertical):
+    def move(x, y, player_x, speed):
+        step = speed * horizontal
+        return np.where(x < player_x, x + step, np.where(x > player_x, x - step, x)), y + speed * vertical
+
+    def step(x, y, player_x, speed):
+        offset = speed * horizontal
+        if x < player_x:
+            x = x + offset
+        elif x > player_x:
+            x = x - offset
+        return x, y + speed * vertical
+    return move, step
+
+
+MOVEMENT_PATTERNS = {
+    'straight': straight_movement,
+    'zigzag': zigzag_movement,
+    'track': track_movement
+}
+
+
+class EnemyType:
+    __slots__ = ('name', 'health', 'speed', 'hull', 'move', 'step', 'base_interval', 'min_interval', 'bullet_speed',
+                 'offset_x', 'offset_y', 'color', 'damage', 'size')
+
+    def __init__(self, name, spec, fire):
+        self.name = name
+        self.health = spec['health']
+        self.speed = spec['speed']
+        self.hull = spec.get('hull', name)
+        if self.hull not in ENEMY_HULLS:
+            raise DefinitionError(f"Enemy '{name}' uses unknown hull '{self.hull}'")
+
+        movement = dict(spec['movement'])
+        pattern = movement.pop('pattern')
+        if pattern not in MOVEMENT_PATTERNS:
+            raise DefinitionError(f"Enemy '{name}' uses unknown movement pattern '{pattern}'")
+        try:
+            self.move, self.step = MOVEMENT_PATTERNS[pattern](**movement)
+        except TypeError as error:
+            raise DefinitionError(f"Enemy '{name}' has bad '{pattern}' movement settings: {error}")
+
+        fire = dict(fire, **spec.get('fire', {}))
+        self.base_interval = fire['base_interval']
+        self.min_interval = fire['min_interval']
+        self.bullet_speed = fire['bullet_speed']
+        self.offset_x, self.offset_y = fire['offset']
+        self.color = resolve_color(fire['color'])
+        self.damage = fire['damage']
+        self.size = fire['size']
+
+
+class PhaseDefinition:
+    __slots__ = ('number', 'enter_below', 'above', 'interval', 'volley', 'color', 'damage', 'size')
+
+    def __init__(self, number, spec):
+        self.number = number
+        self.enter_below = spec.get('enter_below')
+        self.above = spec['above'] if spec.get('above') is not None else -math.inf
+        self.interval = spec['interval']
+        self.color = resolve_color(spec['color'])
+        self.damage = spec['damage']
+        self.size = spec['size']
+        self.volley = compile_volley(spec)
+
+
+def resolve_color(color):
+    if isinstance(color, str):
+        if not hasattr(constants, color):
+            raise DefinitionError(f"Unknown color '{color}'")
+        return getattr(constants, color)
+    return tuple(color)
+
+
+def compile_volley(spec):
+    try:
+        volley = [(shot['offset'][0], shot['offset'][1], shot['velocity'][0], shot['velocity'][1])
+                  for shot in spec.get('volley', [])]
+    except (TypeError, IndexError):
+        raise DefinitionError(f"Malformed volley {spec['volley']}: every shot needs an offset and a velocity pair")
+
+    spread = spec.get('spread')
+    if spread:
+        half = spread['count'] // 2
+        for i in range(-half, spread['count'] - half):
+            angle = i * spread['angle_step']
+            volley.append((i * spread['spacing'], spread['offset_y'],
+                           math.sin(angle) * spread['speed'],
+                           spread['vertical'] + abs(i) * spread['vertical_step']))
+
+    if not volley:
+        raise DefinitionError("Phase fires no bullets")
+    return volley
+
+
+class Definitions:
+    def __init__(self, data):
+        try:
+            self.enemy_types = {name: EnemyType(name, spec, data['enemy_fire'])
+                                for name, spec in data['enemies'].items()}
+
+            waves = data['waves']
+            self.spawn_table = list(waves['spawn_table'])
+            self.spawn_interval = dict(waves['spawn_interval'])
+            self.boss_after_frames = waves['boss_after_frames']
+
+            self.boss_health = data['boss']['health']
+            self.boss_phases = [PhaseDefinition(i + 1, spec) for i, spec in enumerate(data['boss']['phases'])]
+            self.mothership_health = data['mothership']['health']
+            self.mothership_phases = [PhaseDefinition(i + 1, spec)
+                                      for i, spec in enumerate(data['mothership']['phases'])]
+        except KeyError as error:
+            raise DefinitionError(f"Missing definition field {error}")
+
+        unknown = [name for name in self.spawn_table if name not in self.enemy_types]
+        if unknown:
+            raise DefinitionError(f"Spawn table references unknown enemy types: {', '.join(unknown)}")
+
+        check_boss_phases(self.boss_phases)
+        check_mothership_phases(self.mothership_phases)
+
+
+def check_boss_phases(phases):
+    previous = 1
+    for phase in phases[1:]:
+        if phase.enter_below is None or not 0 < phase.enter_below < previous:
+            raise DefinitionError(f"Boss phase {phase.number} needs an enter_below between 0 and {previous}")
+        previous = phase.enter_below
+
+
+def check_mothership_phases(phases):
+    previous = math.inf
+    for phase in phases:
+        if not phase.above < previous:
+            raise DefinitionError(f"Mothership phase {phase.number} must have a lower 'above' than the phase before it")
+        previous = phase.above
+    if phases and phases[-1].above != -math.inf:
+        raise DefinitionError("The last mothership phase must not have an 'above' threshold")
+
+
+def load_definitions(path=DEFINITIONS_PATH):
+    with open(path) as f:
+        return Definitions(json.load(f))
+
+
+definitions = load_definitions()
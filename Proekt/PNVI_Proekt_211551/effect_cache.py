@@ -0,0 +1,51 @@
+import pygame
+from text_cache import render_text
+
+SCALE_STEP = 0.05
+
+
+class EffectCache:
+    def __init__(self):
+        self.rings = {}
+        self.frames = {}
+
+    def glow_rings(self, color):
+        rings = self.rings.get(color)
+        if rings is None:
+            rings = []
+            for r in range(30, 15, -3):
+                ring_alpha = int(40 * (30 - r) / 15)
+                glow_surface = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (*color[:3], ring_alpha), (r, r), r)
+                rings.append((glow_surface, r))
+            self.rings[color] = rings
+        return rings
+
+    def notification_frame(self, message, color, scale):
+        bucket = int(round(scale / SCALE_STEP))
+        key = (message, color, bucket)
+        frame = self.frames.get(key)
+        if frame is not None:
+            return frame
+
+        text_surface = render_text(message, 48, color)
+        scaled_width = int(text_surface.get_width() * bucket * SCALE_STEP)
+        scaled_height = int(text_surface.get_height() * bucket * SCALE_STEP)
+        if scaled_width <= 0 or scaled_height <= 0:
+            frame = None
+        else:
+            scaled_surface = pygame.transform.scale(text_surface, (scaled_width, scaled_height))
+            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
+            for i in range(5):
+                glow_surface.blit(scaled_surface, (10 + i, 10 + i))
+            frame = (glow_surface, scaled_surface)
+
+        self.frames[key] = frame
+        return frame
+
+    def retain_notifications(self, messages):
+        for key in [key for key in list(self.frames) if key[0] not in messages]:
+            del self.frames[key]
+
+
+effect_cache = EffectCache()
@@ -1,38 +1,48 @@
 import pygame
 import math
+import numpy as np
 from constants import *
+from graphics import interpolate
+from effect_cache import effect_cache
+from quality import QUALITY_TIERS
 
 
 class PowerUpNotification:
+    __slots__ = ('power_type', 'x', 'y', 'prev_y', 'life', 'max_life', 'scale', 'message', 'color')
+
+    messages = {
+        'triple_shot': 'TRIPLE SHOT!',
+        'shield': 'SHIELD UP!',
+        'heal': 'HEALTH BOOST!',
+        'speed': 'SPEED BOOST!',
+        'ammo': 'AMMO REFILL!',
+        'mothership_spawned': 'MOTHERSHIP INCOMING!',
+        'mothership_destroyed': 'MOTHERSHIP DESTROYED!'
+    }
+
+    colors = {
+        'triple_shot': CYAN,
+        'shield': GREEN,
+        'heal': RED,
+        'speed': YELLOW,
+        'ammo': ORANGE,
+        'mothership_spawned': GREEN,
+        'mothership_destroyed': YELLOW
+    }
+
     def __init__(self, power_type, x, y):
         self.power_type = power_type
         self.x = x
         self.y = y
+        self.prev_y = y
         self.life = 120
         self.max_life = 120
         self.scale = 0.1
-
-        self.messages = {
-            'triple_shot': 'TRIPLE SHOT!',
-            'shield': 'SHIELD UP!',
-            'heal': 'HEALTH BOOST!',
-            'speed': 'SPEED BOOST!',
-            'ammo': 'AMMO REFILL!',
-            'mothership_spawned': 'MOTHERSHIP INCOMING!',
-            'mothership_destroyed': 'MOTHERSHIP DESTROYED!'
-        }
-
-        self.colors = {
-            'triple_shot': CYAN,
-            'shield': GREEN,
-            'heal': RED,
-            'speed': YELLOW,
-            'ammo': ORANGE,
-            'mothership_spawned': GREEN,
-            'mothership_destroyed': YELLOW
-        }
+        self.message = self.messages.get(power_type, f'{power_type.upper().replace("_", " ")}!')
+        self.color = self.colors.get(power_type, WHITE)
 
     def update(self):
+        self.prev_y = self.y
         self.life -= 1
 
         if self.life > 90:
@@ -44,53 +54,143 @@ class PowerUpNotification:
 
         self.y -= 1
 
-    def draw(self, screen, font):
+    def draw(self, screen, alpha=1.0, glow=QUALITY_TIERS[0]['notification_glow']):
         if self.life <= 0:
-            return
-
-        alpha = min(255, int(255 * (self.life / self.max_life)))
-        color = self.colors.get(self.power_type, WHITE)
-
-        message = self.messages.get(self.power_type, f'{self.power_type.upper().replace("_", " ")}!')
-        text_surface = font.render(message, True, color)
-
-        scaled_width = int(text_surface.get_width() * self.scale)
-        scaled_height = int(text_surface.get_height() * self.scale)
-
-        if scaled_width > 0 and scaled_height > 0:
-            scaled_surface = pygame.transform.scale(text_surface, (scaled_width, scaled_height))
-
-            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-            for i in range(5):
-                glow_alpha = max(0, min(255, alpha // (i + 1)))
-                glow_color = (*color[:3], glow_alpha)
-                glow_text = font.render(message, True, glow_color[:3])
-                if glow_text.get_width() > 0 and glow_text.get_height() > 0:
-                    glow_scaled = pygame.transform.scale(glow_text, (scaled_width, scaled_height))
-                    glow_surface.blit(glow_scaled, (10 + i, 10 + i))
-
-            screen.blit(glow_surface, (self.x - scaled_width // 2 - 10, self.y - scaled_height // 2 - 10))
-            screen.blit(scaled_surface, (self.x - scaled_width // 2, self.y - scaled_height // 2))
-
-
-class Particle:
-    def __init__(self, x, y, color, velocity):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.life = 30
-        self.max_life = 30
+            return None
+
+        y = interpolate(self.prev_y, self.y, alpha)
+        frame = effect_cache.notification_frame(self.message, self.color, self.scale)
+
+        if frame is None:
+            return None
+
+        glow_surface, scaled_surface = frame
+        scaled_width, scaled_height = scaled_surface.get_size()
+        if not glow:
+            return screen.blit(scaled_surface, (self.x - scaled_width // 2, y - scaled_height // 2))
+
+        rect = screen.blit(glow_surface, (self.x - scaled_width // 2 - 10, y - scaled_height // 2 - 10))
+        screen.blit(scaled_surface, (self.x - scaled_width // 2, y - scaled_height // 2))
+        return rect
+
+
+class ParticleEmitter:
+    def __init__(self, capacity=4096, life=30):
+        self.capacity = capacity
+        self.max_life = life
+        self.start = 0
+        self.count = 0
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int16)
+        self.arrays = [self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.life, self.color_index]
+
+        self.colors = []
+        self.color_indices = {}
+        self.sprites = {}
+
+    def __len__(self):
+        return sum(int(np.count_nonzero(self.life[a:b] > 0)) for a, b in self.segments())
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+    def segments(self):
+        end = self.start + self.count
+        if end <= self.capacity:
+            return [(self.start, end)]
+        return [(self.start, self.capacity), (0, end - self.capacity)]
+
+    def copy_from(self, emitter):
+        self.start = emitter.start
+        self.count = emitter.count
+        for a, b in self.segments():
+            for array, source in ((self.x, emitter.x), (self.y, emitter.y), (self.prev_x, emitter.prev_x),
+                                  (self.prev_y, emitter.prev_y), (self.life, emitter.life),
+                                  (self.color_index, emitter.color_index)):
+                array[a:b] = source[a:b]
+        self.colors = list(emitter.colors)
+        self.sprites = emitter.sprites
+
+    def emit(self, x, y, color, velocity):
+        color_index = self.color_indices.get(color)
+        if color_index is None:
+            color_index = len(self.colors)
+            self.colors.append(color)
+            self.color_indices[color] = color_index
+
+        if self.count == self.capacity:
+            i = self.start
+            self.start = (self.start + 1) % self.capacity
+        else:
+            i = (self.start + self.count) % self.capacity
+            self.count += 1
+
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_x[i] = x
+        self.prev_y[i] = y
+        self.vx[i] = velocity[0]
+        self.vy[i] = velocity[1]
+        self.life[i] = self.max_life
+        self.color_index[i] = color_index
+
+    def burst(self, rng, x, y, amount, min_speed, max_speed, color=None, palette=None, density=1.0, limit=None):
+        emitted = 0
+        for i in range(amount):
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(min_speed, max_speed)
+            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
+            if palette is not None:
+                color = rng.choice(palette)
+            if (i + 1) * density < emitted + 1 or (limit is not None and self.count >= limit):
+                continue
+            emitted += 1
+            self.emit(x, y, color, velocity)
 
     def update(self):
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        self.life -= 1
-
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            color = (*self.color[:3], alpha)
-            s = pygame.Surface((6, 6), pygame.SRCALPHA)
-            s.fill(color)
-            screen.blit(s, (self.x, self.y))
\ No newline at end of file
+        if self.count == 0:
+            return
+        for a, b in self.segments():
+            self.prev_x[a:b] = self.x[a:b]
+            self.prev_y[a:b] = self.y[a:b]
+            self.x[a:b] += self.vx[a:b]
+            self.y[a:b] += self.vy[a:b]
+            self.life[a:b] -= 1
+
+        while self.count and self.life[self.start] <= 0:
+            self.start = (self.start + 1) % self.capacity
+            self.count -= 1
+
+    def sprite(self, color_index, life):
+        key = (color_index, life)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            alpha = int(255 * (life / self.max_life))
+            sprite = pygame.Surface((6, 6), pygame.SRCALPHA)
+            sprite.fill((*self.colors[color_index][:3], alpha))
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, alpha=1.0):
+        rects = []
+        for a, b in self.segments():
+            live = np.flatnonzero(self.life[a:b] > 0) + a
+            if len(live) == 0:
+                continue
+            x = self.x[live]
+            y = self.y[live]
+            if alpha < 1:
+                x = self.prev_x[live] + (x - self.prev_x[live]) * alpha
+                y = self.prev_y[live] + (y - self.prev_y[live]) * alpha
+            sprite = self.sprite
+            rects.extend(screen.blits([(sprite(color_index, life), (px, py)) for px, py, color_index, life in zip(
+                x.tolist(), y.tolist(), self.color_index[live].tolist(), self.life[live].tolist())]))
+        return rects
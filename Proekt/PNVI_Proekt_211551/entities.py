@@ -1,133 +1,235 @@
 import pygame
 import math
 import random
+import numpy as np
 from constants import *
-from graphics import draw_enemy_ship, draw_boss_ship, draw_player_ship
+from graphics import draw_enemy_ship, draw_boss_ship, draw_player_ship, interpolate
+from text_cache import render_text
+from effect_cache import effect_cache
+from quality import QUALITY_TIERS
+from definitions import definitions
+from bullets import round_half_away, round_half_away_scalar
+from pooling import ColumnPool
 
 
-class Bullet:
-    def __init__(self, x, y, velocity, color=WHITE, damage=1, size=1.0):
-        self.x = x
-        self.y = y
-        self.velocity = velocity
-        self.color = color
-        self.damage = damage
-        self.size = size
-        width = int(6 * size)
-        height = int(12 * size)
-        self.rect = pygame.Rect(x, y, width, height)
+def fire_volley(owner, phase, bullets, sound_manager):
+    if owner.shoot_timer > phase.interval:
+        for offset_x, offset_y, velocity_x, velocity_y in phase.volley:
+            bullets.spawn(owner.x + offset_x, owner.y + offset_y, (velocity_x, velocity_y), phase.color,
+                          phase.damage, phase.size)
+        sound_manager.play_sound('enemy_shoot')
+        owner.shoot_timer = 0
 
-    def update(self):
-        self.y += self.velocity[1]
-        self.x += self.velocity[0]
-        self.rect.center = (self.x, self.y)
 
-    def draw(self, screen):
-        pygame.draw.ellipse(screen, self.color, self.rect)
-        inner_rect = pygame.Rect(self.rect.x + 2, self.rect.y + 2, self.rect.width - 4, self.rect.height - 4)
-        pygame.draw.ellipse(screen, WHITE, inner_rect)
+class PowerUp:
+    __slots__ = ('x', 'y', 'power_type', 'rect', 'prev_center', 'bounce')
 
+    colors = {
+        'triple_shot': CYAN,
+        'shield': GREEN,
+        'heal': RED,
+        'speed': YELLOW,
+        'ammo': ORANGE
+    }
 
-class PowerUp:
     def __init__(self, x, y, power_type):
+        self.rect = pygame.Rect(x, y, 45, 45)
+        self.reset(x, y, power_type)
+
+    def reset(self, x, y, power_type):
         self.x = x
         self.y = y
         self.power_type = power_type
-        self.rect = pygame.Rect(x, y, 45, 45)
+        self.rect.update(x, y, 45, 45)
+        self.prev_center = self.rect.center
         self.bounce = 0
 
-        self.colors = {
-            'triple_shot': CYAN,
-            'shield': GREEN,
-            'heal': RED,
-            'speed': YELLOW,
-            'ammo': ORANGE
-        }
-
     def update(self):
+        self.prev_center = self.rect.center
         self.y += 2
         self.bounce += 0.2
         self.rect.center = (self.x, self.y + math.sin(self.bounce) * 5)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0, glow_layers=QUALITY_TIERS[0]['glow_layers']):
         color = self.colors.get(self.power_type, WHITE)
-        center = (int(self.rect.centerx), int(self.rect.centery))
+        center = (int(interpolate(self.prev_center[0], self.rect.centerx, alpha)),
+                  int(interpolate(self.prev_center[1], self.rect.centery, alpha)))
 
-        for r in range(30, 15, -3):
-            alpha = int(40 * (30 - r) / 15)
-            glow_surface = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            glow_color = (*color[:3], alpha)
-            pygame.draw.circle(glow_surface, glow_color, (r, r), r)
-            screen.blit(glow_surface, (center[0] - r, center[1] - r))
+        rect = pygame.Rect(center, (0, 0))
+        rings = effect_cache.glow_rings(color)
+        for glow_surface, r in rings[max(0, len(rings) - glow_layers):]:
+            rect.union_ip(screen.blit(glow_surface, (center[0] - r, center[1] - r)))
 
-        pygame.draw.circle(screen, color, center, 18)
+        rect.union_ip(pygame.draw.circle(screen, color, center, 18))
         pygame.draw.circle(screen, WHITE, center, 18, 3)
         pygame.draw.circle(screen, color, center, 12)
+        return rect
 
 
-class Enemy:
-    def __init__(self, x, y, enemy_type='basic'):
-        self.x = x
-        self.y = y
-        self.enemy_type = enemy_type
-        self.health = 1 if enemy_type == 'basic' else 3 if enemy_type == 'heavy' else 2
-        self.max_health = self.health
-        self.speed = 2 if enemy_type == 'fast' else 1
-        self.rect = pygame.Rect(x, y, 60, 60)
-        self.shoot_timer = 0
-        self.movement_pattern = 0
+class EnemySwarm(ColumnPool):
+    size = 60
+    columns = (('x', float), ('y', float), ('prev_x', float), ('prev_y', float), ('left', np.int64),
+               ('top', np.int64), ('health', np.int64), ('shoot_timer', np.int64), ('kind', np.int16))
 
-    def update(self, player_x, difficulty_multiplier):
-        speed = self.speed * difficulty_multiplier
-
-        if self.enemy_type == 'basic':
-            self.y += speed
-        elif self.enemy_type == 'heavy':
-            self.y += speed * 0.8
-            self.x += math.sin(self.y * 0.02) * 2
-        elif self.enemy_type == 'fast':
-            if self.x < player_x:
-                self.x += speed * 0.5
-            elif self.x > player_x:
-                self.x -= speed * 0.5
-            self.y += speed * 1.5
-
-        self.rect.center = (self.x, self.y)
-        self.shoot_timer += 1
+    def __init__(self, capacity=1024):
+        super().__init__(capacity)
 
-    def shoot(self, difficulty_multiplier, sound_manager):
-        shoot_frequency = max(30, int(60 / difficulty_multiplier))
-        if self.shoot_timer > shoot_frequency:
-            self.shoot_timer = 0
-            bullet_speed = 4 * difficulty_multiplier
-            sound_manager.play_sound('enemy_shoot')
-            return Bullet(self.x, self.y + 30, (0, bullet_speed), RED, 1, 1.2)
-        return None
+        self.kinds = list(definitions.enemy_types.values())
+        self.kind_indices = {kind.name: i for i, kind in enumerate(self.kinds)}
+        self.offset_x = np.array([kind.offset_x for kind in self.kinds], dtype=float)
+        self.offset_y = np.array([kind.offset_y for kind in self.kinds], dtype=float)
+        self.bullet_speed = np.array([kind.bullet_speed for kind in self.kinds], dtype=float)
+        self.damage = np.array([kind.damage for kind in self.kinds], dtype=np.int32)
+        self.bullet_size = np.array([kind.size for kind in self.kinds], dtype=float)
+        self.colors = [kind.color for kind in self.kinds]
+        self.frequencies = {}
 
-    def take_damage(self, damage):
-        self.health -= damage
-        return self.health <= 0
+    def spawn(self, x, y, enemy_type='basic'):
+        if self.count >= self.capacity:
+            return False
 
-    def draw(self, screen):
-        draw_enemy_ship(screen, int(self.x), int(self.y), self.enemy_type)
+        kind = self.kind_indices[enemy_type]
+        self.add((float(x), float(y), float(x), float(y), int(x), int(y), self.kinds[kind].health, 0, kind))
+        return True
 
-        if self.health < self.max_health:
-            bar_width = 45
-            bar_height = 6
-            bar_x = self.x - bar_width // 2
-            bar_y = self.y - 35
+    def enemy_type(self, i):
+        return self.kinds[self.kind[i]].name
 
-            pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
-            health_width = int(bar_width * (self.health / self.max_health))
-            pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
+    def update(self, player_x, difficulty_multiplier):
+        n = self.count
+        if n == 0:
+            return None
+        if not self.vectorized:
+            return self.step(player_x, difficulty_multiplier)
+
+        x = self.x[:n]
+        y = self.y[:n]
+        kind = self.kind[:n]
+        shoot_timer = self.shoot_timer[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        shoot_timer += 1
+
+        frequencies = self.shoot_frequencies(difficulty_multiplier)
+        firing = np.zeros(n, dtype=bool)
+        for k, enemy_type in enumerate(self.kinds):
+            group = np.flatnonzero(kind == k)
+            if len(group) == 0:
+                continue
+            x[group], y[group] = enemy_type.move(x[group], y[group], player_x,
+                                                 enemy_type.speed * difficulty_multiplier)
+            firing[group] = shoot_timer[group] > frequencies[k]
+
+        half = self.size // 2
+        self.left[:n] = round_half_away(x) - half
+        self.top[:n] = round_half_away(y) - half
+
+        shooters = np.flatnonzero(firing)
+        if len(shooters) == 0:
+            return None
+        shoot_timer[shooters] = 0
+        kind = kind[shooters]
+        return (self.x[shooters] + self.offset_x[kind], self.y[shooters] + self.offset_y[kind],
+                np.zeros(len(shooters)), self.bullet_speed[kind] * difficulty_multiplier,
+                self.damage[kind], self.bullet_size[kind], self.colors, kind)
+
+    def step(self, player_x, difficulty_multiplier):
+        x = self.x
+        y = self.y
+        left = self.left
+        top = self.top
+        shoot_timer = self.shoot_timer
+        kinds = self.kinds
+        frequencies = self.shoot_frequencies(difficulty_multiplier)
+        self.prev_x[:] = x
+        self.prev_y[:] = y
+        half = self.size // 2
+        shots = None
+
+        for i, k in enumerate(self.kind):
+            enemy_type = kinds[k]
+            x[i], y[i] = enemy_type.step(x[i], y[i], player_x, enemy_type.speed * difficulty_multiplier)
+            left[i] = round_half_away_scalar(x[i]) - half
+            top[i] = round_half_away_scalar(y[i]) - half
+
+            shoot_timer[i] += 1
+            if shoot_timer[i] > frequencies[k]:
+                shoot_timer[i] = 0
+                if shots is None:
+                    shots = ([], [], [], [], [], [], self.colors, [])
+                shots[0].append(x[i] + enemy_type.offset_x)
+                shots[1].append(y[i] + enemy_type.offset_y)
+                shots[2].append(0.0)
+                shots[3].append(enemy_type.bullet_speed * difficulty_multiplier)
+                shots[4].append(enemy_type.damage)
+                shots[5].append(enemy_type.size)
+                shots[7].append(k)
+        return shots
+
+    def shoot_frequencies(self, difficulty_multiplier):
+        frequencies = self.frequencies.get(difficulty_multiplier)
+        if frequencies is None:
+            frequencies = [max(kind.min_interval, int(kind.base_interval / difficulty_multiplier))
+                           for kind in self.kinds]
+            self.frequencies[difficulty_multiplier] = frequencies
+        return frequencies
+
+    def cull(self):
+        n = self.count
+        if n == 0:
+            return
+        if not self.vectorized:
+            offscreen = [i for i, (x, y) in enumerate(zip(self.x, self.y))
+                         if y > SCREEN_HEIGHT or x < 0 or x > GAME_AREA_WIDTH]
+            if offscreen:
+                self.remove(offscreen)
+            return
+
+        x = self.x[:n]
+        self.remove_mask((self.y[:n] > SCREEN_HEIGHT) | (x < 0) | (x > GAME_AREA_WIDTH))
+
+    def bounds(self):
+        left = self.column('left')
+        top = self.column('top')
+        return left, top, left + self.size, top + self.size
+
+    def draw(self, screen, alpha=1.0):
+        x, y, prev_x, prev_y, kinds, healths = (self.column(name).tolist()
+                                                 for name in ('x', 'y', 'prev_x', 'prev_y', 'kind', 'health'))
+        if alpha < 1:
+            x = [start + (end - start) * alpha for start, end in zip(prev_x, x)]
+            y = [start + (end - start) * alpha for start, end in zip(prev_y, y)]
+
+        rects = []
+        for x, y, kind, health in zip(x, y, kinds, healths):
+            enemy_type = self.kinds[kind]
+            rect = draw_enemy_ship(screen, int(x), int(y), enemy_type.hull)
+
+            max_health = enemy_type.health
+            if health < max_health:
+                bar_width = 45
+                bar_height = 6
+                bar_x = x - bar_width // 2
+                bar_y = y - 35
+
+                rect.union_ip(pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height)))
+                health_width = int(bar_width * (health / max_health))
+                pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
+            rects.append(rect)
+        return rects
 
 
 class Boss:
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'health', 'max_health', 'rect', 'shoot_timer', 'phase',
+                 'movement_timer', 'direction')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.health = 50
-        self.max_health = 50
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.health = definitions.boss_health
+        self.max_health = self.health
         self.rect = pygame.Rect(x, y, 180, 120)
         self.shoot_timer = 0
         self.phase = 1
@@ -135,6 +237,8 @@ class Boss:
         self.direction = 1
 
     def update(self, player_x):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.movement_timer += 1
         if self.movement_timer < 120:
             self.x += self.direction * 2
@@ -148,42 +252,22 @@ class Boss:
         self.rect.center = (self.x, self.y)
         self.shoot_timer += 1
 
-        if self.health < self.max_health * 0.5 and self.phase == 1:
-            self.phase = 2
-        elif self.health < self.max_health * 0.2 and self.phase == 2:
-            self.phase = 3
-
-    def shoot(self, sound_manager):
-        bullets = []
-        if self.phase == 1:
-            if self.shoot_timer > 30:
-                bullets.append(Bullet(self.x, self.y + 60, (0, 5), ORANGE, 2, 1.5))
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-        elif self.phase == 2:
-            if self.shoot_timer > 25:
-                bullets.extend([
-                    Bullet(self.x - 45, self.y + 60, (-2, 4), ORANGE, 2, 1.5),
-                    Bullet(self.x, self.y + 60, (0, 5), ORANGE, 2, 1.5),
-                    Bullet(self.x + 45, self.y + 60, (2, 4), ORANGE, 2, 1.5)
-                ])
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-        elif self.phase == 3:
-            if self.shoot_timer > 10:
-                bullets.append(Bullet(self.x, self.y + 60, (0, 6), RED, 2, 1.5))
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-
-        return bullets
+        phases = definitions.boss_phases
+        if self.phase < len(phases) and self.health < self.max_health * phases[self.phase].enter_below:
+            self.phase += 1
+
+    def shoot(self, bullets, sound_manager):
+        fire_volley(self, definitions.boss_phases[self.phase - 1], bullets, sound_manager)
 
     def take_damage(self, damage, sound_manager):
         self.health -= damage
         sound_manager.play_sound('boss_hit')
         return self.health <= 0
 
-    def draw(self, screen):
-        draw_boss_ship(screen, int(self.x), int(self.y), self.phase)
+    def draw(self, screen, alpha=1.0):
+        x = interpolate(self.prev_x, self.x, alpha)
+        y = interpolate(self.prev_y, self.y, alpha)
+        rect = draw_boss_ship(screen, int(x), int(y), self.phase)
 
         bar_width = 300
         bar_height = 15
@@ -193,15 +277,21 @@ class Boss:
         pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
         health_width = int(bar_width * (self.health / self.max_health))
         pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 3)
+        rect.union_ip(pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 3))
+        return rect
 
 
 class AlienMothership:
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'health', 'max_health', 'rect', 'shoot_timer', 'movement_timer',
+                 'direction', 'phase')
+
     def __init__(self, x, y):
         self.x = float(x)
         self.y = float(y)
-        self.health = 30
-        self.max_health = 30
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.health = definitions.mothership_health
+        self.max_health = self.health
         self.rect = pygame.Rect(int(self.x - 80), int(self.y - 40), 160, 80)
         self.shoot_timer = 0
         self.movement_timer = 0
@@ -209,6 +299,8 @@ class AlienMothership:
         self.phase = 1
 
     def update(self, player_x):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.direction * 2
 
         if self.x <= 100 or self.x >= GAME_AREA_WIDTH - 100:
@@ -222,54 +314,26 @@ class AlienMothership:
         self.rect.centery = int(self.y)
         self.shoot_timer += 1
 
-        if self.health > 20:
-            self.phase = 1
-        elif self.health > 10:
-            self.phase = 2
-        else:
-            self.phase = 3
-
-    def shoot(self, sound_manager):
-        bullets = []
-
-        if self.phase == 1:
-            if self.shoot_timer > 40:
-                bullets.append(Bullet(self.x, self.y + 40, (0, 4), GREEN, 2, 1.5))
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-
-        elif self.phase == 2:
-            if self.shoot_timer > 35:
-                bullets.extend([
-                    Bullet(self.x - 30, self.y + 40, (-1, 4), GREEN, 2, 1.5),
-                    Bullet(self.x, self.y + 40, (0, 5), GREEN, 2, 1.5),
-                    Bullet(self.x + 30, self.y + 40, (1, 4), GREEN, 2, 1.5)
-                ])
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-
-        elif self.phase == 3:
-            if self.shoot_timer > 25:
-                for i in range(-2, 3):
-                    angle = i * 0.4
-                    vel_x = math.sin(angle) * 4
-                    vel_y = 5 + abs(i)
-                    bullets.append(Bullet(self.x + i * 25, self.y + 40, (vel_x, vel_y), (0, 255, 100), 2, 1.5))
-                sound_manager.play_sound('enemy_shoot')
-                self.shoot_timer = 0
-
-        return bullets
+        for phase in definitions.mothership_phases:
+            if self.health > phase.above:
+                self.phase = phase.number
+                break
+
+    def shoot(self, bullets, sound_manager):
+        fire_volley(self, definitions.mothership_phases[self.phase - 1], bullets, sound_manager)
 
     def take_damage(self, damage, sound_manager):
         self.health -= damage
         sound_manager.play_sound('boss_hit')
         return self.health <= 0
 
-    def draw(self, screen):
-        center = (int(self.x), int(self.y))
+    def draw(self, screen, alpha=1.0):
+        x = interpolate(self.prev_x, self.x, alpha)
+        y = interpolate(self.prev_y, self.y, alpha)
+        center = (int(x), int(y))
 
-        pygame.draw.ellipse(screen, GREEN, (self.x - 70, self.y - 35, 140, 70))
-        pygame.draw.ellipse(screen, (0, 200, 0), (self.x - 70, self.y - 35, 140, 70), 3)
+        pygame.draw.ellipse(screen, GREEN, (x - 70, y - 35, 140, 70))
+        pygame.draw.ellipse(screen, (0, 200, 0), (x - 70, y - 35, 140, 70), 3)
 
         pulse = abs(math.sin(pygame.time.get_ticks() * 0.01))
         pod_color = (int(100 + 100 * pulse), int(255 - 50 * pulse), int(100 + 50 * pulse))
@@ -277,17 +341,17 @@ class AlienMothership:
         pod_positions = [(-40, -10), (40, -10), (-20, 10), (20, 10), (0, -20)]
         for px, py in pod_positions:
             pod_size = int(8 + 3 * pulse)
-            pygame.draw.circle(screen, pod_color, (int(self.x + px), int(self.y + py)), pod_size)
-            pygame.draw.circle(screen, WHITE, (int(self.x + px), int(self.y + py)), pod_size, 2)
+            pygame.draw.circle(screen, pod_color, (int(x + px), int(y + py)), pod_size)
+            pygame.draw.circle(screen, WHITE, (int(x + px), int(y + py)), pod_size, 2)
 
-        pygame.draw.ellipse(screen, (150, 255, 150), (self.x - 25, self.y - 15, 50, 30))
-        pygame.draw.ellipse(screen, WHITE, (self.x - 25, self.y - 15, 50, 30), 2)
+        pygame.draw.ellipse(screen, (150, 255, 150), (x - 25, y - 15, 50, 30))
+        pygame.draw.ellipse(screen, WHITE, (x - 25, y - 15, 50, 30), 2)
 
         if self.phase >= 2:
-            pygame.draw.circle(screen, (255, 100, 100), (int(self.x - 50), int(self.y)), 6)
-            pygame.draw.circle(screen, (255, 100, 100), (int(self.x + 50), int(self.y)), 6)
+            pygame.draw.circle(screen, (255, 100, 100), (int(x - 50), int(y)), 6)
+            pygame.draw.circle(screen, (255, 100, 100), (int(x + 50), int(y)), 6)
         if self.phase >= 3:
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x), int(self.y + 25)), 8)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x), int(y + 25)), 8)
 
         bar_width = 200
         bar_height = 12
@@ -300,23 +364,29 @@ class AlienMothership:
         pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
         pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 3)
 
-        health_text = pygame.font.Font(None, 36).render(f"ALIEN MOTHERSHIP: {self.health}/30", True, WHITE)
+        health_text = render_text(f"ALIEN MOTHERSHIP: {self.health}/{self.max_health}", 36, WHITE)
         health_rect = health_text.get_rect(center=(GAME_AREA_WIDTH // 2, bar_y - 20))
         screen.blit(health_text, health_rect)
 
 
 class Player:
-    def __init__(self, x, y, difficulty='normal'):
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'difficulty', 'health', 'max_health', 'speed', 'ammo', 'max_ammo',
+                 'reload_timer', 'reloading', 'no_ammo_display', 'rect', 'shoot_timer', 'power_ups')
+
+    difficulty_settings = {
+        'easy': {'health': 7, 'speed': 6, 'ammo': 100},
+        'normal': {'health': 5, 'speed': 5, 'ammo': 75},
+        'hard': {'health': 3, 'speed': 4, 'ammo': 50}
+    }
+
+    def __init__(self, x, y, difficulty='normal', difficulty_settings=None):
         self.x = x
         self.y = y
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.difficulty = difficulty
 
-        difficulty_settings = {
-            'easy': {'health': 7, 'speed': 6, 'ammo': 100},
-            'normal': {'health': 5, 'speed': 5, 'ammo': 75},
-            'hard': {'health': 3, 'speed': 4, 'ammo': 50}
-        }
-
+        difficulty_settings = difficulty_settings or self.difficulty_settings
         settings = difficulty_settings.get(difficulty, difficulty_settings['normal'])
         self.health = settings['health']
         self.max_health = settings['health']
@@ -336,18 +406,18 @@ class Player:
             'speed': 0
         }
 
-    def update(self):
-        keys = pygame.key.get_pressed()
-
+    def update(self, controls):
+        self.prev_x = self.x
+        self.prev_y = self.y
         speed = self.speed * (2 if self.power_ups['speed'] > 0 else 1)
 
-        if keys[pygame.K_LEFT] and self.x > 30:
+        if controls.left and self.x > 30:
             self.x -= speed
-        if keys[pygame.K_RIGHT] and self.x < GAME_AREA_WIDTH - 30:
+        if controls.right and self.x < GAME_AREA_WIDTH - 30:
             self.x += speed
-        if keys[pygame.K_UP] and self.y > 30:
+        if controls.up and self.y > 30:
             self.y -= speed
-        if keys[pygame.K_DOWN] and self.y < SCREEN_HEIGHT - 30:
+        if controls.down and self.y < SCREEN_HEIGHT - 30:
             self.y += speed
 
         self.rect.center = (self.x, self.y)
@@ -366,29 +436,25 @@ class Player:
             if self.power_ups[power] > 0:
                 self.power_ups[power] -= 1
 
-    def shoot(self, sound_manager):
+    def shoot(self, bullets, sound_manager):
         if self.shoot_timer > 8:
             self.shoot_timer = 0
 
             if self.ammo <= 0 and not self.reloading:
                 self.no_ammo_display = 60
                 sound_manager.play_sound('no_ammo')
-                return []
+                return
 
             if self.reloading:
-                return []
-
-            bullets = []
+                return
 
             if self.power_ups['triple_shot'] > 0 and self.ammo >= 3:
-                bullets.extend([
-                    Bullet(self.x - 22, self.y - 30, (0, -10), CYAN, 2, 1.3),
-                    Bullet(self.x, self.y - 30, (0, -10), CYAN, 2, 1.3),
-                    Bullet(self.x + 22, self.y - 30, (0, -10), CYAN, 2, 1.3)
-                ])
+                bullets.spawn(self.x - 22, self.y - 30, (0, -10), CYAN, 2, 1.3)
+                bullets.spawn(self.x, self.y - 30, (0, -10), CYAN, 2, 1.3)
+                bullets.spawn(self.x + 22, self.y - 30, (0, -10), CYAN, 2, 1.3)
                 self.ammo -= 3
             elif self.ammo >= 1:
-                bullets.append(Bullet(self.x, self.y - 30, (0, -10), WHITE, 1, 1.2))
+                bullets.spawn(self.x, self.y - 30, (0, -10), WHITE, 1, 1.2)
                 self.ammo -= 1
 
             if self.ammo <= 0:
@@ -397,8 +463,6 @@ class Player:
                 sound_manager.play_sound('reload')
 
             sound_manager.play_sound('player_shoot')
-            return bullets
-        return []
 
     def take_damage(self, damage):
         if self.power_ups['shield'] > 0:
@@ -425,29 +489,34 @@ class Player:
 
         sound_manager.play_sound('powerup')
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        x = interpolate(self.prev_x, self.x, alpha)
+        y = interpolate(self.prev_y, self.y, alpha)
         ship_color = GREEN if self.power_ups['shield'] > 0 else BLUE
-        draw_player_ship(screen, int(self.x), int(self.y), ship_color)
+        rects = [draw_player_ship(screen, int(x), int(y), ship_color)]
 
         if self.power_ups['shield'] > 0:
             shield_alpha = int(100 + 50 * math.sin(self.power_ups['shield'] * 0.2))
             shield_surface = pygame.Surface((90, 90), pygame.SRCALPHA)
             shield_color = (*GREEN[:3], shield_alpha)
             pygame.draw.circle(shield_surface, shield_color, (45, 45), 40)
-            screen.blit(shield_surface, (self.x - 45, self.y - 45))
+            rects.append(screen.blit(shield_surface, (x - 45, y - 45)))
 
+        hearts = pygame.Rect(18, 18, 0, 0)
         for i in range(self.max_health):
             heart_color = GREEN if i < self.health else DARK_GRAY
             pygame.draw.circle(screen, heart_color, (30 + i * 35, 30), 12)
-            pygame.draw.circle(screen, WHITE, (30 + i * 35, 30), 12, 3)
+            hearts.union_ip(pygame.draw.circle(screen, WHITE, (30 + i * 35, 30), 12, 3))
+        rects.append(hearts)
 
         if self.no_ammo_display > 0:
-            font = pygame.font.Font(None, 48)
-            no_ammo_text = font.render("NO AMMO!", True, RED)
-            text_rect = no_ammo_text.get_rect(center=(self.x, self.y - 60))
+            no_ammo_text = render_text("NO AMMO!", 48, RED)
+            text_rect = no_ammo_text.get_rect(center=(x, y - 60))
 
-            alpha = int(200 + 55 * math.sin(self.no_ammo_display * 0.5))
+            text_alpha = int(200 + 55 * math.sin(self.no_ammo_display * 0.5))
             no_ammo_surface = pygame.Surface(no_ammo_text.get_size(), pygame.SRCALPHA)
-            red_with_alpha = (*RED[:3], alpha)
+            red_with_alpha = (*RED[:3], text_alpha)
             no_ammo_surface.fill(red_with_alpha)
-            screen.blit(no_ammo_surface, text_rect)
\ No newline at end of file
+            rects.append(screen.blit(no_ammo_surface, text_rect))
+
+        return rects
\ No newline at end of file
@@ -1,21 +1,56 @@
 import pygame
 import random
 import math
-import json
+import time
+import numpy as np
 from constants import *
 from sound_manager import SoundManager
-from effects import PowerUpNotification, Particle
-from entities import Player, Enemy, Boss, AlienMothership, PowerUp, Bullet
-from graphics import draw_player_ship
+from controls import KeyboardInput
+from spatial import SpatialGrid
+from effects import PowerUpNotification, ParticleEmitter
+from entities import Player, EnemySwarm, Boss, AlienMothership, PowerUp
+from bullets import BulletPool, sweep_times
+from graphics import draw_player_ship, prewarm_ship_sprites
+from text_cache import render_text
+from pooling import ObjectPool
+from definitions import definitions
+from effect_cache import effect_cache
+from profiler import FrameProfiler
+from starfield import StarField
+from renderer import DirtyRectRenderer
+from score_store import ScoreStore
+from quality import QualityGovernor
+
+
+COLLISION_MODES = ('discrete', 'swept')
+BRUTE_FORCE_PAIRS = 4096
+DIRECT_PAIRS = 256
 
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Galactic Defense Shooter - Петар Пејоски 211551")
+    def __init__(self, headless=False, input_source=None, sound_manager=None, replay_dir=None, profile_path=None,
+                 dirty_rendering=False, collision_mode='discrete', pipeline=False):
+        self.headless = headless
+        self.replay_dir = replay_dir
+        self.profile_path = profile_path
+        self.profiler = FrameProfiler(enabled=profile_path is not None)
+        self.recorder = None
+        self.controls = None
+        self.pause_toggled = False
+
+        if headless:
+            self.screen = None
+        else:
+            pygame.display.init()
+            pygame.font.init()
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Galactic Defense Shooter - Петар Пејоски 211551")
         self.clock = pygame.time.Clock()
 
-        self.sound_manager = SoundManager()
+        self.input_source = input_source or KeyboardInput()
+        self.sound_manager = sound_manager or SoundManager()
+        self.seed = None
+        self.rng = random.Random()
 
         self.state = 'menu'
         self.difficulty = 'normal'
@@ -24,75 +59,99 @@ class Game:
             'normal': 1.0,
             'hard': 1.5
         }
+        self.enemy_spawn_base = definitions.spawn_interval['base']
+        self.enemy_spawn_per_level = definitions.spawn_interval['per_level']
+        self.enemy_spawn_min = definitions.spawn_interval['min']
+        self.boss_after_frames = definitions.boss_after_frames
+        self.power_up_rates = {
+            'easy': 600,
+            'normal': 900,
+            'hard': 1200
+        }
+        self.player_settings = Player.difficulty_settings
 
         self.level = 1
         self.score = 0
-        self.high_score = self.load_high_score()
+        self.score_store = None if headless else ScoreStore()
+        self.high_score = self.score_store.high_score if self.score_store else 0
+        self.kills = {}
+        self.session_frames = 0
+        self.session_recorded = False
 
         self.player = None
-        self.player_bullets = []
-        self.enemy_bullets = []
-        self.enemies = []
+        self.player_bullets = BulletPool()
+        self.enemy_bullets = BulletPool()
+        self.enemies = EnemySwarm()
         self.boss = None
         self.alien_mothership = None
         self.mothership_spawned = False
         self.power_ups = []
-        self.particles = []
+        self.power_up_pool = ObjectPool(PowerUp)
+        self.particles = ParticleEmitter()
         self.power_up_notifications = []
+        self.collision_grid = SpatialGrid()
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"Unknown collision mode '{collision_mode}'")
+        self.collision_mode = collision_mode
+        self.pipelined = pipeline
+
+        self.info_panel_layers = {}
+        self.dirty_rects = None
+        self.presented_state = None
+        self.force_flip = False
 
         self.enemy_spawn_timer = 0
         self.power_up_spawn_timer = 0
         self.level_timer = 0
 
-        self.font = pygame.font.Font(None, 48)
-        self.big_font = pygame.font.Font(None, 96)
-        self.small_font = pygame.font.Font(None, 32)
-        self.tiny_font = pygame.font.Font(None, 24)
-
-        self.stars = [(random.randint(0, GAME_AREA_WIDTH), random.randint(0, SCREEN_HEIGHT)) for _ in range(150)]
+        self.starfield = StarField()
+        self.quality = QualityGovernor()
+        self.dirty_rendering = dirty_rendering
+        self.dirty_renderer = None
 
-    def load_high_score(self):
-        try:
-            with open('high_score.json', 'r') as f:
-                data = json.load(f)
-                return data.get('high_score', 0)
-        except:
-            return 0
-
-    def save_high_score(self):
-        try:
-            with open('high_score.json', 'w') as f:
-                json.dump({'high_score': self.high_score}, f)
-        except:
-            pass
+    def record_session(self):
+        if self.session_recorded:
+            return
+        self.session_recorded = True
+        self.high_score = max(self.high_score, self.score)
+        if self.score_store is not None:
+            self.score_store.record({
+                'seed': self.seed,
+                'difficulty': self.difficulty,
+                'score': self.score,
+                'level': self.level,
+                'duration': round(self.session_frames / FPS, 2),
+                'kills': dict(self.kills)
+            })
+
+    def add_kill(self, kind):
+        self.kills[kind] = self.kills.get(kind, 0) + 1
 
     def create_explosion(self, x, y, color=ORANGE):
         self.sound_manager.play_sound('explosion')
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 12)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            self.particles.append(Particle(x, y, color, velocity))
+        self.particles.burst(self.rng, x, y, 20, 3, 12, color, density=self.quality.particle_density,
+                             limit=self.quality.max_particles)
 
     def spawn_enemies(self):
         self.enemy_spawn_timer += 1
         difficulty_mult = self.difficulty_multipliers[self.difficulty]
-        spawn_rate = max(20, int((60 - self.level * 5) / difficulty_mult))
+        spawn_rate = max(self.enemy_spawn_min,
+                         int((self.enemy_spawn_base - self.level * self.enemy_spawn_per_level) / difficulty_mult))
 
         if self.enemy_spawn_timer > spawn_rate:
             self.enemy_spawn_timer = 0
-            enemy_type = random.choice(['basic', 'basic', 'heavy', 'fast'])
-            x = random.randint(50, GAME_AREA_WIDTH - 50)
-            self.enemies.append(Enemy(x, -50, enemy_type))
+            enemy_type = self.rng.choice(definitions.spawn_table)
+            x = self.rng.randint(50, GAME_AREA_WIDTH - 50)
+            self.enemies.spawn(x, -50, enemy_type)
 
     def spawn_boss(self):
-        if not self.boss and len(self.enemies) == 0 and self.level_timer > 1800:
+        if not self.boss and len(self.enemies) == 0 and self.level_timer > self.boss_after_frames:
             self.boss = Boss(GAME_AREA_WIDTH // 2, 150)
 
     def spawn_mothership(self):
         if not self.mothership_spawned and not self.alien_mothership and self.score >= 200:
-            for enemy in self.enemies:
-                self.create_explosion(enemy.x, enemy.y, ORANGE)
+            for x, y in zip(self.enemies.column('x').tolist(), self.enemies.column('y').tolist()):
+                self.create_explosion(x, y, ORANGE)
 
             if self.boss:
                 self.create_explosion(self.boss.x, self.boss.y, YELLOW)
@@ -100,17 +159,15 @@ class Game:
             self.enemies.clear()
             self.boss = None
             self.enemy_bullets.clear()
+            self.power_up_pool.release_all(self.power_ups)
             self.power_ups.clear()
 
             self.alien_mothership = AlienMothership(GAME_AREA_WIDTH // 2, 150)
             self.mothership_spawned = True
             self.sound_manager.play_sound('mothership_spawn')
 
-            for _ in range(50):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(5, 15)
-                velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-                self.particles.append(Particle(GAME_AREA_WIDTH // 2, 100, GREEN, velocity))
+            self.particles.burst(self.rng, GAME_AREA_WIDTH // 2, 100, 50, 5, 15, GREEN,
+                                 density=self.quality.particle_density, limit=self.quality.max_particles)
 
             self.power_up_notifications.append(
                 PowerUpNotification('mothership_spawned', GAME_AREA_WIDTH // 2, SCREEN_HEIGHT // 2)
@@ -118,136 +175,244 @@ class Game:
 
     def spawn_power_ups(self):
         self.power_up_spawn_timer += 1
-        power_up_rate = 600 if self.difficulty == 'easy' else 900 if self.difficulty == 'normal' else 1200
+        power_up_rate = self.power_up_rates[self.difficulty]
 
         if self.power_up_spawn_timer > power_up_rate:
             self.power_up_spawn_timer = 0
-            if random.random() < 0.8:
-                x = random.randint(50, GAME_AREA_WIDTH - 50)
-                power_type = random.choice(['triple_shot', 'shield', 'heal', 'speed', 'ammo'])
-                self.power_ups.append(PowerUp(x, -30, power_type))
+            if self.rng.random() < 0.8:
+                x = self.rng.randint(50, GAME_AREA_WIDTH - 50)
+                power_type = self.rng.choice(['triple_shot', 'shield', 'heal', 'speed', 'ammo'])
+                self.power_ups.append(self.power_up_pool.acquire(x, -30, power_type))
 
     def handle_collisions(self):
         difficulty_mult = self.difficulty_multipliers[self.difficulty]
-
-        for bullet in self.player_bullets[:]:
-            for enemy in self.enemies[:]:
-                if bullet.rect.colliderect(enemy.rect):
-                    self.player_bullets.remove(bullet)
-                    if enemy.take_damage(bullet.damage):
-                        self.enemies.remove(enemy)
+        player_bullets = self.player_bullets
+        enemies = self.enemies
+        spent_bullets = set()
+
+        if len(enemies) and len(player_bullets):
+            direct = (not player_bullets.vectorized and not enemies.vectorized and
+                      len(player_bullets) * len(enemies) <= DIRECT_PAIRS)
+            if self.collision_mode == 'swept':
+                hits = self.direct_swept_hits() if direct else self.swept_enemy_hits()
+            else:
+                hits = self.direct_discrete_hits() if direct else self.discrete_enemy_hits()
+
+            destroyed = set()
+            for i, targets in hits:
+                for j in targets:
+                    if j in destroyed:
+                        continue
+                    spent_bullets.add(i)
+                    enemies.health[j] -= int(player_bullets.damage[i])
+                    if enemies.health[j] <= 0:
+                        destroyed.add(j)
+                        self.add_kill(enemies.enemy_type(j))
                         self.score += int((10 + self.level * 5) * difficulty_mult)
-                        self.create_explosion(enemy.x, enemy.y)
+                        self.create_explosion(float(enemies.x[j]), float(enemies.y[j]))
                     break
-
-        if self.boss:
-            for bullet in self.player_bullets[:]:
-                if bullet.rect.colliderect(self.boss.rect):
-                    self.player_bullets.remove(bullet)
-                    if self.boss.take_damage(bullet.damage, self.sound_manager):
-                        self.score += int(500 * difficulty_mult)
-                        self.create_explosion(self.boss.x, self.boss.y, YELLOW)
-                        self.boss = None
-                        self.level += 1
-                        self.level_timer = 0
-
-        if self.alien_mothership:
-            for bullet in self.player_bullets[:]:
-                if bullet.rect.colliderect(self.alien_mothership.rect):
-                    self.player_bullets.remove(bullet)
-                    if self.alien_mothership.take_damage(bullet.damage, self.sound_manager):
-                        self.score += int(1000 * difficulty_mult)
-                        self.sound_manager.play_sound('mothership_destroy')
-                        for _ in range(50):
-                            angle = random.uniform(0, 2 * math.pi)
-                            speed = random.uniform(8, 20)
-                            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-                            color = random.choice([GREEN, YELLOW, WHITE])
-                            self.particles.append(
-                                Particle(self.alien_mothership.x, self.alien_mothership.y, color, velocity))
-
-                        self.power_up_notifications.append(
-                            PowerUpNotification('mothership_destroyed', GAME_AREA_WIDTH // 2, SCREEN_HEIGHT // 2)
-                        )
-
-                        self.alien_mothership = None
-                        self.level += 2
-
-                        for _ in range(3):
-                            power_type = random.choice(['triple_shot', 'shield', 'ammo'])
-                            self.power_ups.append(PowerUp(random.randint(100, GAME_AREA_WIDTH - 100), -30, power_type))
+            if destroyed:
+                enemies.remove(list(destroyed))
+
+        if self.boss and len(player_bullets):
+            for i in self.bullets_hitting(player_bullets, self.boss):
+                if i in spent_bullets:
+                    continue
+                spent_bullets.add(i)
+                if self.boss.take_damage(int(player_bullets.damage[i]), self.sound_manager):
+                    self.add_kill('boss')
+                    self.score += int(500 * difficulty_mult)
+                    self.create_explosion(self.boss.x, self.boss.y, YELLOW)
+                    self.boss = None
+                    self.level += 1
+                    self.level_timer = 0
                     break
 
-        for bullet in self.enemy_bullets[:]:
-            if bullet.rect.colliderect(self.player.rect):
-                self.enemy_bullets.remove(bullet)
-                if self.player.take_damage(bullet.damage):
+        if self.alien_mothership and len(player_bullets):
+            for i in self.bullets_hitting(player_bullets, self.alien_mothership):
+                if i in spent_bullets:
+                    continue
+                spent_bullets.add(i)
+                if self.alien_mothership.take_damage(int(player_bullets.damage[i]), self.sound_manager):
+                    self.add_kill('mothership')
+                    self.score += int(1000 * difficulty_mult)
+                    self.sound_manager.play_sound('mothership_destroy')
+                    self.particles.burst(self.rng, self.alien_mothership.x, self.alien_mothership.y, 50, 8, 20,
+                                         palette=[GREEN, YELLOW, WHITE], density=self.quality.particle_density,
+                                         limit=self.quality.max_particles)
+
+                    self.power_up_notifications.append(
+                        PowerUpNotification('mothership_destroyed', GAME_AREA_WIDTH // 2, SCREEN_HEIGHT // 2)
+                    )
+
+                    self.alien_mothership = None
+                    self.level += 2
+
+                    for _ in range(3):
+                        power_type = self.rng.choice(['triple_shot', 'shield', 'ammo'])
+                        self.power_ups.append(
+                            self.power_up_pool.acquire(self.rng.randint(100, GAME_AREA_WIDTH - 100), -30, power_type))
+                break
+
+        if spent_bullets:
+            player_bullets.remove(list(spent_bullets))
+
+        if len(self.enemy_bullets):
+            hits = self.bullets_hitting(self.enemy_bullets, self.player)
+            for i in hits:
+                if self.player.take_damage(int(self.enemy_bullets.damage[i])):
                     self.state = 'game_over'
                     self.sound_manager.play_sound('game_over')
-                    if self.score > self.high_score:
-                        self.high_score = self.score
-                        self.save_high_score()
-
-        for power_up in self.power_ups[:]:
-            if power_up.rect.colliderect(self.player.rect):
-                self.power_ups.remove(power_up)
+                    self.record_session()
+                    break
+            if hits:
+                self.enemy_bullets.remove(hits)
+
+        if self.power_ups:
+            player_rect = self.player.rect
+            collected = [i for i, power_up in enumerate(self.power_ups) if power_up.rect.colliderect(player_rect)]
+            for i in collected:
+                power_up = self.power_ups[i]
                 self.player.add_power_up(power_up.power_type, self.sound_manager)
                 self.score += 50
 
                 self.power_up_notifications.append(
                     PowerUpNotification(power_up.power_type, self.player.x, self.player.y - 80)
                 )
+            if collected:
+                self.compact(self.power_ups, set(collected), self.power_up_pool)
+
+    def discrete_enemy_hits(self):
+        player_bullets = self.player_bullets
+        left, top, right, bottom = self.enemies.bounds()
+        bullet_left = player_bullets.column('left')
+        bullet_top = player_bullets.column('top')
+        bullet_right = bullet_left + player_bullets.column('width')
+        bullet_bottom = bullet_top + player_bullets.column('height')
+
+        bullets, enemies = self.candidate_pairs((bullet_left, bullet_top, bullet_right, bullet_bottom),
+                                                (left, top, right, bottom))
+        hit = ((bullet_left[bullets] < right[enemies]) & (left[enemies] < bullet_right[bullets]) &
+               (bullet_top[bullets] < bottom[enemies]) & (top[enemies] < bullet_bottom[bullets]))
+        return self.group_hits(bullets[hit], enemies[hit])
+
+    def swept_enemy_hits(self):
+        player_bullets = self.player_bullets
+        left, top, right, bottom = self.enemies.bounds()
+        dx = self.enemies.column('x') - self.enemies.column('prev_x')
+        dy = self.enemies.column('y') - self.enemies.column('prev_y')
+        enemy_bounds = (np.floor(np.minimum(left, left - dx)).astype(np.int64) - 1,
+                        np.floor(np.minimum(top, top - dy)).astype(np.int64) - 1,
+                        np.ceil(np.maximum(right, right - dx)).astype(np.int64) + 1,
+                        np.ceil(np.maximum(bottom, bottom - dy)).astype(np.int64) + 1)
+
+        bullets, enemies = self.candidate_pairs(player_bullets.swept_bounds(), enemy_bounds)
+        start_left, start_top = player_bullets.start_corners()
+        start_left = start_left[bullets]
+        start_top = start_top[bullets]
+        dx = dx[enemies]
+        dy = dy[enemies]
+        times = sweep_times(start_left, start_top, player_bullets.column('width')[bullets],
+                            player_bullets.column('height')[bullets],
+                            player_bullets.column('left')[bullets] - start_left - dx,
+                            player_bullets.column('top')[bullets] - start_top - dy,
+                            left[enemies] - dx, top[enemies] - dy, right[enemies] - dx, bottom[enemies] - dy)
+
+        hit = np.isfinite(times)
+        return self.group_hits(bullets[hit], enemies[hit], times[hit])
+
+    def direct_discrete_hits(self):
+        bullets = self.player_bullets
+        enemies = self.enemies
+        size = enemies.size
+        corners = list(zip(enemies.left, enemies.top))
+        pairs = [(i, j) for i, (bullet_left, bullet_top, width, height) in enumerate(zip(
+                     bullets.left, bullets.top, bullets.width, bullets.height))
+                 for j, (left, top) in enumerate(corners)
+                 if bullet_left < left + size and left < bullet_left + width and
+                 bullet_top < top + size and top < bullet_top + height]
+        return self.group_pairs(pairs)
+
+    def direct_swept_hits(self):
+        bullets = self.player_bullets
+        enemies = self.enemies
+        size = enemies.size
+        targets = {}
+        for j, (left, top, x, y, prev_x, prev_y) in enumerate(zip(enemies.left, enemies.top, enemies.x, enemies.y,
+                                                                  enemies.prev_x, enemies.prev_y)):
+            dx = x - prev_x
+            dy = y - prev_y
+            region = (math.floor(min(left, left - dx)) - 1, math.floor(min(top, top - dy)) - 1,
+                      math.ceil(max(left, left - dx)) + size + 1, math.ceil(max(top, top - dy)) + size + 1)
+            for i in bullets.reaching(*region):
+                entry = bullets.sweep_row(i, left - dx, top - dy, left + size - dx, top + size - dy, dx, dy)
+                if entry < math.inf:
+                    targets.setdefault(i, []).append((entry, j))
+        return [(i, [j for _, j in sorted(targets[i])]) for i in sorted(targets)]
+
+    def candidate_pairs(self, bullet_bounds, enemy_bounds):
+        bullet_count = len(bullet_bounds[0])
+        enemy_count = len(enemy_bounds[0])
+        if bullet_count * enemy_count <= BRUTE_FORCE_PAIRS:
+            return (np.repeat(np.arange(bullet_count), enemy_count),
+                    np.tile(np.arange(enemy_count), bullet_count))
+        return self.collision_grid.pairs(bullet_bounds, enemy_bounds)
+
+    def group_hits(self, bullets, enemies, times=None):
+        serial = self.player_bullets.column('serial')[bullets]
+        order = np.lexsort((enemies, serial) if times is None else (enemies, times, serial))
+        return self.group_pairs(zip(bullets[order].tolist(), enemies[order].tolist()))
+
+    def group_pairs(self, pairs):
+        hits = []
+        for i, j in pairs:
+            if hits and hits[-1][0] == i:
+                hits[-1][1].append(j)
+            else:
+                hits.append((i, [j]))
+        return hits
+
+    def bullets_hitting(self, bullets, target):
+        if self.collision_mode == 'swept':
+            return bullets.swept(target.rect, target.x - target.prev_x, target.y - target.prev_y)
+        return bullets.overlapping(target.rect)
+
+    def compact(self, items, removed, pool):
+        kept = 0
+        for i, item in enumerate(items):
+            if i in removed:
+                pool.release(item)
+            else:
+                items[kept] = item
+                kept += 1
+        del items[kept:]
 
-    def draw_info_panel(self):
-        panel_x = GAME_AREA_WIDTH
-        panel_rect = pygame.Rect(panel_x, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT)
+    def render_info_panel_layer(self, show_ammo):
+        layer = pygame.Surface((INFO_PANEL_WIDTH, SCREEN_HEIGHT))
+        panel_x = 0
 
-        pygame.draw.rect(self.screen, (20, 20, 40), panel_rect)
-        pygame.draw.line(self.screen, WHITE, (panel_x, 0), (panel_x, SCREEN_HEIGHT), 3)
+        layer.fill((20, 20, 40))
+        pygame.draw.line(layer, WHITE, (panel_x, 0), (panel_x, SCREEN_HEIGHT), 3)
 
         y_offset = 30
 
-        title_text = self.font.render("INFO PANEL", True, CYAN)
+        title_text = render_text("INFO PANEL", 48, CYAN)
         title_rect = title_text.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
         title_rect.y = y_offset
-        self.screen.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
         y_offset += 70
 
-        if self.state == 'playing' and self.player:
-            ammo_title = self.small_font.render("AMMO STATUS", True, WHITE)
+        if show_ammo:
+            ammo_title = render_text("AMMO STATUS", 32, WHITE)
             ammo_title_rect = ammo_title.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
             ammo_title_rect.y = y_offset
-            self.screen.blit(ammo_title, ammo_title_rect)
-            y_offset += 40
-
-            bar_width = 200
-            bar_height = 20
-            bar_x = panel_x + (INFO_PANEL_WIDTH - bar_width) // 2
-            bar_y = y_offset
-
-            pygame.draw.rect(self.screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
-            if self.player.reloading:
-                reload_progress = 1 - (self.player.reload_timer / 120)
-                progress_width = int(bar_width * reload_progress)
-                pygame.draw.rect(self.screen, YELLOW, (bar_x, bar_y, progress_width, bar_height))
-                reload_text = self.tiny_font.render("RELOADING...", True, YELLOW)
-            else:
-                ammo_ratio = self.player.ammo / self.player.max_ammo
-                ammo_width = int(bar_width * ammo_ratio)
-                ammo_color = GREEN if ammo_ratio > 0.5 else ORANGE if ammo_ratio > 0.2 else RED
-                pygame.draw.rect(self.screen, ammo_color, (bar_x, bar_y, ammo_width, bar_height))
-                reload_text = self.tiny_font.render(f"{self.player.ammo}/{self.player.max_ammo}", True, WHITE)
-
-            pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-            reload_rect = reload_text.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
-            reload_rect.y = y_offset + 25
-            self.screen.blit(reload_text, reload_rect)
-            y_offset += 80
-
-        powerup_title = self.small_font.render("POWER-UPS GUIDE", True, WHITE)
+            layer.blit(ammo_title, ammo_title_rect)
+            y_offset += 120
+
+        powerup_title = render_text("POWER-UPS GUIDE", 32, WHITE)
         powerup_title_rect = powerup_title.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
         powerup_title_rect.y = y_offset
-        self.screen.blit(powerup_title, powerup_title_rect)
+        layer.blit(powerup_title, powerup_title_rect)
         y_offset += 50
 
         power_up_info = [
@@ -261,22 +426,22 @@ class Game:
         for name, description, color in power_up_info:
             icon_x = panel_x + 20
             icon_y = y_offset + 5
-            pygame.draw.circle(self.screen, color, (icon_x, icon_y), 12)
-            pygame.draw.circle(self.screen, WHITE, (icon_x, icon_y), 12, 2)
+            pygame.draw.circle(layer, color, (icon_x, icon_y), 12)
+            pygame.draw.circle(layer, WHITE, (icon_x, icon_y), 12, 2)
 
-            name_text = self.tiny_font.render(name, True, color)
-            desc_text = self.tiny_font.render(description, True, WHITE)
+            name_text = render_text(name, 24, color)
+            desc_text = render_text(description, 24, WHITE)
 
-            self.screen.blit(name_text, (icon_x + 25, icon_y - 15))
-            self.screen.blit(desc_text, (icon_x + 25, icon_y + 2))
+            layer.blit(name_text, (icon_x + 25, icon_y - 15))
+            layer.blit(desc_text, (icon_x + 25, icon_y + 2))
 
             y_offset += 35
 
         y_offset += 20
-        enemy_title = self.small_font.render("ENEMY TYPES", True, WHITE)
+        enemy_title = render_text("ENEMY TYPES", 32, WHITE)
         enemy_title_rect = enemy_title.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
         enemy_title_rect.y = y_offset
-        self.screen.blit(enemy_title, enemy_title_rect)
+        layer.blit(enemy_title, enemy_title_rect)
         y_offset += 40
 
         enemy_info = [
@@ -291,32 +456,32 @@ class Game:
             icon_x = panel_x + 20
             icon_y = y_offset + 5
             if name == "GREEN":
-                pygame.draw.polygon(self.screen, color, [
+                pygame.draw.polygon(layer, color, [
                     (icon_x - 8, icon_y), (icon_x + 8, icon_y),
                     (icon_x + 6, icon_y + 8), (icon_x - 6, icon_y + 8)
                 ])
-                pygame.draw.circle(self.screen, (0, 255, 100), (icon_x, icon_y), 4)
+                pygame.draw.circle(layer, (0, 255, 100), (icon_x, icon_y), 4)
             else:
-                pygame.draw.polygon(self.screen, color, [
+                pygame.draw.polygon(layer, color, [
                     (icon_x, icon_y - 8), (icon_x - 8, icon_y + 8), (icon_x + 8, icon_y + 8)
                 ])
-            pygame.draw.polygon(self.screen, WHITE, [
+            pygame.draw.polygon(layer, WHITE, [
                 (icon_x, icon_y - 8), (icon_x - 8, icon_y + 8), (icon_x + 8, icon_y + 8)
             ], 1)
 
-            name_text = self.tiny_font.render(name, True, color)
-            desc_text = self.tiny_font.render(description, True, WHITE)
+            name_text = render_text(name, 24, color)
+            desc_text = render_text(description, 24, WHITE)
 
-            self.screen.blit(name_text, (icon_x + 25, icon_y - 10))
-            self.screen.blit(desc_text, (icon_x + 25, icon_y + 5))
+            layer.blit(name_text, (icon_x + 25, icon_y - 10))
+            layer.blit(desc_text, (icon_x + 25, icon_y + 5))
 
             y_offset += 30
 
         y_offset += 20
-        controls_title = self.small_font.render("CONTROLS", True, WHITE)
+        controls_title = render_text("CONTROLS", 32, WHITE)
         controls_title_rect = controls_title.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
         controls_title_rect.y = y_offset
-        self.screen.blit(controls_title, controls_title_rect)
+        layer.blit(controls_title, controls_title_rect)
         y_offset += 30
 
         controls = [
@@ -326,161 +491,268 @@ class Game:
         ]
 
         for control in controls:
-            control_text = self.tiny_font.render(control, True, WHITE)
+            control_text = render_text(control, 24, WHITE)
             control_rect = control_text.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
             control_rect.y = y_offset
-            self.screen.blit(control_text, control_rect)
+            layer.blit(control_text, control_rect)
             y_offset += 20
 
-    def update_game(self):
-        if self.state != 'playing':
-            return
+        return layer
 
-        self.level_timer += 1
-        difficulty_mult = self.difficulty_multipliers[self.difficulty]
+    def draw_ammo_status(self, panel_x, y_offset, player):
+        bar_width = 200
+        bar_height = 20
+        bar_x = panel_x + (INFO_PANEL_WIDTH - bar_width) // 2
+        bar_y = y_offset
 
-        self.player.update()
+        pygame.draw.rect(self.screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        if player.reloading:
+            reload_progress = 1 - (player.reload_timer / 120)
+            progress_width = int(bar_width * reload_progress)
+            pygame.draw.rect(self.screen, YELLOW, (bar_x, bar_y, progress_width, bar_height))
+            reload_text = render_text("RELOADING...", 24, YELLOW)
+        else:
+            ammo_ratio = player.ammo / player.max_ammo
+            ammo_width = int(bar_width * ammo_ratio)
+            ammo_color = GREEN if ammo_ratio > 0.5 else ORANGE if ammo_ratio > 0.2 else RED
+            pygame.draw.rect(self.screen, ammo_color, (bar_x, bar_y, ammo_width, bar_height))
+            reload_text = render_text(f"{player.ammo}/{player.max_ammo}", 24, WHITE)
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE]:
-            self.player_bullets.extend(self.player.shoot(self.sound_manager))
+        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        reload_rect = reload_text.get_rect(centerx=panel_x + INFO_PANEL_WIDTH // 2)
+        reload_rect.y = y_offset + 25
+        self.screen.blit(reload_text, reload_rect)
 
-        if keys[pygame.K_m] and not self.alien_mothership and not self.mothership_spawned:
-            self.spawn_mothership()
+        return pygame.Rect(panel_x, bar_y, INFO_PANEL_WIDTH, 25 + reload_rect.height)
 
-        for bullet in self.player_bullets[:]:
-            bullet.update()
-            if bullet.y < 0 or bullet.x < 0 or bullet.x > GAME_AREA_WIDTH:
-                self.player_bullets.remove(bullet)
+    def draw_info_panel(self, view=None):
+        view = view or self
+        panel_x = GAME_AREA_WIDTH
+        show_ammo = view.state == 'playing' and view.player is not None
 
-        for bullet in self.enemy_bullets[:]:
-            bullet.update()
-            if bullet.y > SCREEN_HEIGHT or bullet.x < 0 or bullet.x > GAME_AREA_WIDTH:
-                self.enemy_bullets.remove(bullet)
+        layer = self.info_panel_layers.get(show_ammo)
+        if layer is None:
+            layer = self.render_info_panel_layer(show_ammo)
+            self.info_panel_layers[show_ammo] = layer
 
-        if not self.boss and not self.alien_mothership:
-            self.spawn_enemies()
+        self.screen.blit(layer, (panel_x, 0))
+        pygame.draw.line(self.screen, WHITE, (panel_x, 0), (panel_x, SCREEN_HEIGHT), 3)
 
-        for enemy in self.enemies[:]:
-            enemy.update(self.player.x, difficulty_mult)
-            bullet = enemy.shoot(difficulty_mult, self.sound_manager)
-            if bullet:
-                self.enemy_bullets.append(bullet)
-            if enemy.y > SCREEN_HEIGHT or enemy.x < 0 or enemy.x > GAME_AREA_WIDTH:
-                self.enemies.remove(enemy)
+        if show_ammo:
+            return self.draw_ammo_status(panel_x, 30 + 70 + 40, view.player)
+        return None
 
-        if not self.boss and self.level_timer > 1800 and not self.alien_mothership:
-            self.spawn_boss()
+    def update_game(self):
+        if self.state != 'playing':
+            return
 
-        if self.boss:
-            self.boss.update(self.player.x)
-            new_bullets = self.boss.shoot(self.sound_manager)
-            self.enemy_bullets.extend(new_bullets)
+        profiler = self.profiler
+        self.level_timer += 1
+        self.session_frames += 1
+        difficulty_mult = self.difficulty_multipliers[self.difficulty]
 
-        if self.alien_mothership:
-            self.alien_mothership.update(self.player.x)
-            new_bullets = self.alien_mothership.shoot(self.sound_manager)
-            self.enemy_bullets.extend(new_bullets)
+        with profiler.section('update.player'):
+            controls = self.input_source.poll(self)
+            self.controls = controls
+            self.player.update(controls)
 
-        self.spawn_mothership()
+            if controls.shoot:
+                self.player.shoot(self.player_bullets, self.sound_manager)
 
-        if not self.alien_mothership:
-            self.spawn_power_ups()
+        if controls.mothership and not self.alien_mothership and not self.mothership_spawned:
+            with profiler.section('update.spawners'):
+                self.spawn_mothership()
 
-        for power_up in self.power_ups[:]:
-            power_up.update()
-            if power_up.y > SCREEN_HEIGHT or power_up.x < 0 or power_up.x > GAME_AREA_WIDTH:
-                self.power_ups.remove(power_up)
+        with profiler.section('update.bullets'):
+            self.player_bullets.update()
+            self.player_bullets.cull(min_y=0)
 
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.life <= 0:
-                self.particles.remove(particle)
+            self.enemy_bullets.update()
+            self.enemy_bullets.cull(max_y=SCREEN_HEIGHT)
+
+        if not self.boss and not self.alien_mothership:
+            with profiler.section('update.spawners'):
+                self.spawn_enemies()
 
-        for notification in self.power_up_notifications[:]:
-            notification.update()
-            if notification.life <= 0:
-                self.power_up_notifications.remove(notification)
+        with profiler.section('update.enemies'):
+            shots = self.enemies.update(self.player.x, difficulty_mult)
+            if shots is not None:
+                self.enemy_bullets.spawn_batch(*shots)
+                self.sound_manager.play_sound('enemy_shoot')
+            self.enemies.cull()
 
-        self.handle_collisions()
+        if not self.boss and self.level_timer > self.boss_after_frames and not self.alien_mothership:
+            with profiler.section('update.spawners'):
+                self.spawn_boss()
 
-    def draw_stars(self):
-        for i, (x, y) in enumerate(self.stars):
-            self.stars[i] = (x, (y + 1) % SCREEN_HEIGHT)
+        with profiler.section('update.boss'):
+            if self.boss:
+                self.boss.update(self.player.x)
+                self.boss.shoot(self.enemy_bullets, self.sound_manager)
 
             if self.alien_mothership:
-                brightness = random.choice([(0, 255, 100), (100, 255, 150), (150, 255, 200)])
-            else:
-                brightness = random.choice([WHITE, GRAY, LIGHT_BLUE])
-            pygame.draw.circle(self.screen, brightness, (int(x), int(y)), random.choice([1, 2]))
+                self.alien_mothership.update(self.player.x)
+                self.alien_mothership.shoot(self.enemy_bullets, self.sound_manager)
 
-    def draw_game(self):
-        if self.state != 'playing':
-            return
+        with profiler.section('update.spawners'):
+            self.spawn_mothership()
 
-        if self.alien_mothership:
+            if not self.alien_mothership:
+                self.spawn_power_ups()
+
+        with profiler.section('update.power_ups'):
+            power_ups = self.power_ups
+            kept = 0
+            for power_up in power_ups:
+                power_up.update()
+                if power_up.y > SCREEN_HEIGHT or power_up.x < 0 or power_up.x > GAME_AREA_WIDTH:
+                    self.power_up_pool.release(power_up)
+                else:
+                    power_ups[kept] = power_up
+                    kept += 1
+            del power_ups[kept:]
+
+        with profiler.section('update.particles'):
+            self.particles.update()
+
+            notifications = self.power_up_notifications
+            kept = 0
+            for notification in notifications:
+                notification.update()
+                if notification.life > 0:
+                    notifications[kept] = notification
+                    kept += 1
+            if kept < len(notifications):
+                del notifications[kept:]
+                effect_cache.retain_notifications({notification.message for notification in self.power_up_notifications})
+
+        with profiler.section('update.collisions'):
+            self.handle_collisions()
+
+    def draw_stars(self, view=None):
+        theme = 'mothership' if (view or self).alien_mothership else 'default'
+        self.starfield.draw(self.screen, pygame.time.get_ticks() / 1000, theme, self.quality.star_density)
+
+    def draw_background(self, view=None):
+        view = view or self
+        if view.alien_mothership:
             self.screen.fill((0, 20, 10))
         else:
             self.screen.fill(BLACK)
-        self.draw_stars()
+        self.draw_stars(view)
 
-        if self.alien_mothership:
-            glow_surface = pygame.Surface((GAME_AREA_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            glow_alpha = int(20 + 10 * math.sin(pygame.time.get_ticks() * 0.01))
-            glow_surface.fill((0, 100, 0, glow_alpha))
-            self.screen.blit(glow_surface, (0, 0))
+        if view.alien_mothership:
+            if self.quality.background_glow:
+                glow_surface = pygame.Surface((GAME_AREA_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                glow_alpha = int(20 + 10 * math.sin(pygame.time.get_ticks() * 0.01))
+                glow_surface.fill((0, 100, 0, glow_alpha))
+                self.screen.blit(glow_surface, (0, 0))
 
-            encounter_text = pygame.font.Font(None, 42).render("MOTHERSHIP BATTLE", True, YELLOW)
+            encounter_text = render_text("MOTHERSHIP BATTLE", 42, YELLOW)
             encounter_rect = encounter_text.get_rect(center=(GAME_AREA_WIDTH // 2, 30))
-            alpha = int(200 + 55 * math.sin(pygame.time.get_ticks() * 0.02))
+            text_alpha = int(200 + 55 * math.sin(pygame.time.get_ticks() * 0.02))
             encounter_surface = pygame.Surface(encounter_text.get_size(), pygame.SRCALPHA)
-            encounter_surface.fill((255, 255, 0, alpha))
+            encounter_surface.fill((255, 255, 0, text_alpha))
             self.screen.blit(encounter_surface, encounter_rect)
 
         pygame.draw.line(self.screen, WHITE, (GAME_AREA_WIDTH, 0), (GAME_AREA_WIDTH, SCREEN_HEIGHT), 3)
 
-        self.player.draw(self.screen)
+    def prewarm(self):
+        prewarm_ship_sprites()
+        self.starfield.prewarm()
+
+    def render_static_background(self):
+        background = pygame.Surface((GAME_AREA_WIDTH, SCREEN_HEIGHT))
+        background.fill(BLACK)
+        self.starfield.draw(background, 0)
+        pygame.draw.line(background, WHITE, (GAME_AREA_WIDTH, 0), (GAME_AREA_WIDTH, SCREEN_HEIGHT), 3)
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        return background
+
+    def draw_game(self, alpha=1.0, view=None):
+        view = view or self
+        if view.state != 'playing':
+            return
+
+        profiler = self.profiler
+        if self.dirty_rendering and self.dirty_renderer is None:
+            self.dirty_renderer = DirtyRectRenderer(self.render_static_background())
+        renderer = self.dirty_renderer
+        if renderer is not None and (view.alien_mothership or self.presented_state != 'playing'):
+            renderer.invalidate()
+        dirty = renderer is not None and not view.alien_mothership
+        rects = []
+
+        with profiler.section('draw.background'):
+            if dirty:
+                renderer.begin(self.screen)
+            else:
+                self.draw_background(view)
+
+        with profiler.section('draw.player'):
+            rects.extend(view.player.draw(self.screen, alpha))
+
+        with profiler.section('draw.bullets'):
+            rects.extend(view.player_bullets.draw(self.screen, alpha))
+            rects.extend(view.enemy_bullets.draw(self.screen, alpha))
 
-        for bullet in self.player_bullets:
-            bullet.draw(self.screen)
+        with profiler.section('draw.enemies'):
+            rects.extend(view.enemies.draw(self.screen, alpha))
 
-        for bullet in self.enemy_bullets:
-            bullet.draw(self.screen)
+        with profiler.section('draw.boss'):
+            if view.boss:
+                rects.append(view.boss.draw(self.screen, alpha))
 
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+            if view.alien_mothership:
+                view.alien_mothership.draw(self.screen, alpha)
 
-        if self.boss:
-            self.boss.draw(self.screen)
+        with profiler.section('draw.power_ups'):
+            for power_up in view.power_ups:
+                rects.append(power_up.draw(self.screen, alpha, self.quality.glow_layers))
 
-        if self.alien_mothership:
-            self.alien_mothership.draw(self.screen)
+        with profiler.section('draw.particles'):
+            rects.extend(view.particles.draw(self.screen, alpha))
 
-        for power_up in self.power_ups:
-            power_up.draw(self.screen)
+            for notification in view.power_up_notifications:
+                rect = notification.draw(self.screen, alpha, self.quality.notification_glow)
+                if rect:
+                    rects.append(rect)
 
-        for particle in self.particles:
-            particle.draw(self.screen)
+        with profiler.section('draw.hud'):
+            score_text = render_text(f"Score: {view.score}", 32, WHITE)
+            level_text = render_text(f"Level: {view.level}", 32, WHITE)
 
-        for notification in self.power_up_notifications:
-            notification.draw(self.screen, self.font)
+            rects.append(self.screen.blit(score_text, (GAME_AREA_WIDTH - 200, 70)))
+            rects.append(self.screen.blit(level_text, (GAME_AREA_WIDTH - 200, 100)))
 
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
-        level_text = self.small_font.render(f"Level: {self.level}", True, WHITE)
+            if view.score >= 180 and view.score < 200 and not view.mothership_spawned and not view.alien_mothership:
+                points_needed = 200 - view.score
+                warning_text = render_text(f"MOTHERSHIP IN {points_needed} PTS!", 32, GREEN)
+                warning_rect = warning_text.get_rect(center=(GAME_AREA_WIDTH // 2, 130))
+                text_alpha = int(200 + 55 * math.sin(pygame.time.get_ticks() * 0.01))
+                warning_surface = pygame.Surface(warning_text.get_size(), pygame.SRCALPHA)
+                warning_surface.fill((0, 255, 0, text_alpha))
+                rects.append(self.screen.blit(warning_surface, warning_rect))
 
-        self.screen.blit(score_text, (GAME_AREA_WIDTH - 200, 70))
-        self.screen.blit(level_text, (GAME_AREA_WIDTH - 200, 100))
+        with profiler.section('draw.info_panel'):
+            ammo_rect = self.draw_info_panel(view)
 
-        if self.score >= 180 and self.score < 200 and not self.mothership_spawned and not self.alien_mothership:
-            points_needed = 200 - self.score
-            warning_text = self.small_font.render(f"MOTHERSHIP IN {points_needed} PTS!", True, GREEN)
-            warning_rect = warning_text.get_rect(center=(GAME_AREA_WIDTH // 2, 130))
-            alpha = int(200 + 55 * math.sin(pygame.time.get_ticks() * 0.01))
-            warning_surface = pygame.Surface(warning_text.get_size(), pygame.SRCALPHA)
-            warning_surface.fill((0, 255, 0, alpha))
-            self.screen.blit(warning_surface, warning_rect)
+        if dirty:
+            renderer.extend(rects)
+            self.dirty_rects = renderer.dirty_rects() + [ammo_rect]
+        else:
+            self.dirty_rects = [pygame.Rect(0, 0, GAME_AREA_WIDTH, SCREEN_HEIGHT), ammo_rect]
+
+    def present(self):
+        if self.dirty_rects and self.state == self.presented_state and not self.force_flip:
+            pygame.display.update(self.dirty_rects)
+        else:
+            pygame.display.flip()
 
-        self.draw_info_panel()
+        self.presented_state = self.state
+        self.dirty_rects = None
+        self.force_flip = False
 
     def draw_menu(self):
         if not self.sound_manager.music_playing:
@@ -491,10 +763,10 @@ class Game:
 
         draw_player_ship(self.screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150, CYAN, 2.0)
 
-        title_text = self.big_font.render("GALACTIC DEFENSE", True, CYAN)
-        subtitle_text = self.big_font.render("SHOOTER", True, CYAN)
-        start_text = self.font.render("Press SPACE to Select Difficulty", True, WHITE)
-        quit_text = self.font.render("Press Q to Quit", True, WHITE)
+        title_text = render_text("GALACTIC DEFENSE", 96, CYAN)
+        subtitle_text = render_text("SHOOTER", 96, CYAN)
+        start_text = render_text("Press SPACE to Select Difficulty", 48, WHITE)
+        quit_text = render_text("Press Q to Quit", 48, WHITE)
 
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 200))
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
@@ -507,7 +779,7 @@ class Game:
         self.screen.blit(quit_text, quit_rect)
 
         if self.high_score > 0:
-            high_score_text = self.font.render(f"High Score: {self.high_score}", True, YELLOW)
+            high_score_text = render_text(f"High Score: {self.high_score}", 48, YELLOW)
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 350))
             self.screen.blit(high_score_text, high_score_rect)
 
@@ -515,7 +787,7 @@ class Game:
         self.screen.fill(BLACK)
         self.draw_stars()
 
-        title_text = self.big_font.render("SELECT DIFFICULTY", True, CYAN)
+        title_text = render_text("SELECT DIFFICULTY", 96, CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         self.screen.blit(title_text, title_rect)
 
@@ -531,8 +803,8 @@ class Game:
             if diff_name.lower() == self.difficulty:
                 pygame.draw.rect(self.screen, color, (SCREEN_WIDTH // 2 - 300, y_pos - 50, 600, 100), 4)
 
-            diff_text = self.font.render(f"{i + 1}. {diff_name}", True, color)
-            desc_text = self.small_font.render(description, True, WHITE)
+            diff_text = render_text(f"{i + 1}. {diff_name}", 48, color)
+            desc_text = render_text(description, 32, WHITE)
 
             diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos - 20))
             desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 20))
@@ -540,11 +812,11 @@ class Game:
             self.screen.blit(diff_text, diff_rect)
             self.screen.blit(desc_text, desc_rect)
 
-        instruction_text = self.font.render("Press 1, 2, or 3 to select, ENTER to start", True, WHITE)
+        instruction_text = render_text("Press 1, 2, or 3 to select, ENTER to start", 48, WHITE)
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, 750))
         self.screen.blit(instruction_text, instruction_rect)
 
-        back_text = self.small_font.render("Press ESC to go back", True, GRAY)
+        back_text = render_text("Press ESC to go back", 32, GRAY)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, 800))
         self.screen.blit(back_text, back_rect)
 
@@ -552,12 +824,12 @@ class Game:
         self.screen.fill(BLACK)
         self.draw_stars()
 
-        game_over_text = self.big_font.render("GAME OVER", True, RED)
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        high_score_text = self.font.render(f"High Score: {self.high_score}", True, YELLOW)
-        difficulty_text = self.font.render(f"Difficulty: {self.difficulty.title()}", True, CYAN)
-        restart_text = self.font.render("Press R to Restart", True, WHITE)
-        menu_text = self.font.render("Press M for Menu", True, WHITE)
+        game_over_text = render_text("GAME OVER", 96, RED)
+        score_text = render_text(f"Final Score: {self.score}", 48, WHITE)
+        high_score_text = render_text(f"High Score: {self.high_score}", 48, YELLOW)
+        difficulty_text = render_text(f"Difficulty: {self.difficulty.title()}", 48, CYAN)
+        restart_text = render_text("Press R to Restart", 48, WHITE)
+        menu_text = render_text("Press M for Menu", 48, WHITE)
 
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 150))
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 75))
@@ -573,29 +845,54 @@ class Game:
         self.screen.blit(restart_text, restart_rect)
         self.screen.blit(menu_text, menu_rect)
 
-    def reset_game(self):
-        self.player = Player(GAME_AREA_WIDTH // 2, SCREEN_HEIGHT - 150, self.difficulty)
-        self.player_bullets = []
-        self.enemy_bullets = []
-        self.enemies = []
+    def reset_game(self, seed=None):
+        self.finish_replay()
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
+        if self.replay_dir:
+            from replay import ReplayRecorder
+            self.recorder = ReplayRecorder(self.seed, self.difficulty, self.collision_mode)
+        self.player = Player(GAME_AREA_WIDTH // 2, SCREEN_HEIGHT - 150, self.difficulty, self.player_settings)
+        self.player_bullets.clear()
+        self.enemy_bullets.clear()
+        self.enemies.clear()
         self.boss = None
         self.alien_mothership = None
         self.mothership_spawned = False
-        self.power_ups = []
-        self.particles = []
+        self.power_up_pool.release_all(self.power_ups)
+        self.power_ups.clear()
+        self.particles.clear()
         self.power_up_notifications = []
+        effect_cache.retain_notifications(())
         self.level = 1
         self.score = 0
         self.enemy_spawn_timer = 0
         self.power_up_spawn_timer = 0
         self.level_timer = 0
+        self.kills = {}
+        self.session_frames = 0
+        self.session_recorded = False
+
+    def finish_replay(self):
+        if self.recorder and self.recorder.frames:
+            from replay import replay_path
+            self.recorder.save(replay_path(self.replay_dir, self.recorder.seed))
+        self.recorder = None
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
 
+            if event.type == pygame.VIDEOEXPOSE:
+                self.force_flip = True
+
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif event.key == pygame.K_F4:
+                    self.dump_profile()
+
                 if self.state == 'menu':
                     if event.key == pygame.K_SPACE:
                         self.state = 'difficulty'
@@ -620,11 +917,14 @@ class Game:
                 elif self.state == 'playing':
                     if event.key == pygame.K_p:
                         self.state = 'paused'
+                        self.pause_toggled = True
 
                 elif self.state == 'paused':
                     if event.key == pygame.K_p:
                         self.state = 'playing'
+                        self.pause_toggled = True
                     elif event.key == pygame.K_m:
+                        self.record_session()
                         self.state = 'menu'
                         self.sound_manager.stop_music()
 
@@ -638,15 +938,82 @@ class Game:
 
         return True
 
+    def profile_counts(self):
+        counts = {
+            'count.enemies': len(self.enemies),
+            'count.player_bullets': len(self.player_bullets),
+            'count.enemy_bullets': len(self.enemy_bullets),
+            'count.power_ups': len(self.power_ups),
+            'count.particles': len(self.particles),
+            'count.notifications': len(self.power_up_notifications)
+        }
+        for key, value in self.power_up_pool.stats().items():
+            counts[f'pool.power_ups.{key}'] = value
+        counts.update(self.quality.telemetry())
+        if self.dirty_renderer is not None:
+            counts['count.dirty_rects'] = self.dirty_renderer.rect_count
+            counts['count.dirty_pixels'] = self.dirty_renderer.pixel_count
+        return counts
+
+    def dump_profile(self):
+        path = self.profile_path or f"profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        self.profiler.dump(path)
+        if path.endswith('.json'):
+            self.profiler.dump(path[:-5] + '.csv')
+
+    def step(self):
+        self.update_game()
+        if self.recorder:
+            self.recorder.record(self, self.controls, self.pause_toggled)
+            self.pause_toggled = False
+
     def run(self):
         running = True
+        step_time = 1.0 / FPS
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+
+        profiler = self.profiler
+        prewarmed = False
+
+        pipeline = None
+        if self.pipelined:
+            from pipeline import FramePipeline, pipeline_supported
+            if pipeline_supported():
+                pipeline = FramePipeline(self)
+            else:
+                print("Warning: Pipelined rendering needs more than one CPU. Running serially.")
 
         while running:
-            running = self.handle_events()
-
-            if self.state == 'playing':
-                self.update_game()
-                self.draw_game()
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+            profiler.begin_frame()
+
+            with profiler.section('events'):
+                running = self.handle_events()
+            if self.state != 'playing':
+                accumulator = 0.0
+                if pipeline is not None:
+                    pipeline.invalidate()
+
+            if self.state == 'playing' and pipeline is not None:
+                steps = min(int(accumulator / step_time), MAX_CATCHUP_STEPS)
+                accumulator -= steps * step_time
+                if steps == MAX_CATCHUP_STEPS:
+                    accumulator = min(accumulator, step_time)
+                pipeline.run_frame(steps, accumulator / step_time)
+            elif self.state == 'playing':
+                steps = 0
+                with profiler.section('update'):
+                    while accumulator >= step_time and steps < MAX_CATCHUP_STEPS and self.state == 'playing':
+                        self.step()
+                        accumulator -= step_time
+                        steps += 1
+                if steps == MAX_CATCHUP_STEPS:
+                    accumulator = min(accumulator, step_time)
+                with profiler.section('draw'):
+                    self.draw_game(accumulator / step_time)
             elif self.state == 'menu':
                 self.draw_menu()
             elif self.state == 'difficulty':
@@ -655,7 +1022,7 @@ class Game:
                 self.draw_game_over()
             elif self.state == 'paused':
                 self.draw_game()
-                pause_text = self.big_font.render("PAUSED", True, YELLOW)
+                pause_text = render_text("PAUSED", 96, YELLOW)
                 pause_rect = pause_text.get_rect(center=(GAME_AREA_WIDTH // 2, SCREEN_HEIGHT // 2))
                 pygame.draw.rect(self.screen, BLACK,
                                  (pause_rect.x - 30, pause_rect.y - 30, pause_rect.width + 60, pause_rect.height + 60))
@@ -664,7 +1031,35 @@ class Game:
                                  4)
                 self.screen.blit(pause_text, pause_rect)
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
+            with profiler.section('sound'):
+                self.sound_manager.flush()
+
+            if self.recorder and self.state not in ('playing', 'paused'):
+                self.finish_replay()
+
+            overlay_rect = profiler.draw_overlay(self.screen)
+            if overlay_rect and self.dirty_rects and self.dirty_renderer is not None:
+                self.dirty_renderer.add(overlay_rect)
+                self.dirty_rects.append(overlay_rect)
+            with profiler.section('present'):
+                self.present()
+            profiler.end_frame(self.profile_counts())
+
+            if not prewarmed:
+                self.prewarm()
+                prewarmed = True
+            elif self.state == 'playing':
+                self.quality.observe(time.perf_counter() - now)
+            self.clock.tick(MAX_RENDER_FPS)
+
+        if pipeline is not None:
+            pipeline.close()
+        if self.state in ('playing', 'paused'):
+            self.record_session()
+        self.finish_replay()
+        if self.profile_path:
+            self.dump_profile()
+        if self.score_store is not None:
+            self.score_store.close()
+        self.sound_manager.close()
         pygame.quit()
\ No newline at end of file
@@ -1,8 +1,18 @@
 import pygame
 from constants import *
 
+SPRITE_COLORKEY = (1, 2, 3)
+ENEMY_HULLS = ('basic', 'heavy', 'fast')
+ship_sprites = {}
 
-def draw_player_ship(screen, x, y, color=BLUE, size=1.0):
+
+def interpolate(previous, current, alpha):
+    if alpha >= 1:
+        return current
+    return previous + (current - previous) * alpha
+
+
+def render_player_ship(screen, x, y, color=BLUE, size=1.0):
     scale = size * 1.5
     points = [
         (x, y - int(20 * scale)),
@@ -28,7 +38,7 @@ def draw_player_ship(screen, x, y, color=BLUE, size=1.0):
     pygame.draw.circle(screen, WHITE, (x, y - int(3 * scale)), int(6 * scale), 2)
 
 
-def draw_enemy_ship(screen, x, y, enemy_type, size=1.0):
+def render_enemy_ship(screen, x, y, enemy_type, size=1.0):
     scale = size * 1.5
 
     if enemy_type == 'basic':
@@ -73,7 +83,7 @@ def draw_enemy_ship(screen, x, y, enemy_type, size=1.0):
             pygame.draw.line(screen, CYAN, (x - int(4 * scale), trail_y), (x + int(4 * scale), trail_y), 3)
 
 
-def draw_boss_ship(screen, x, y, phase=1, size=1.0):
+def render_boss_ship(screen, x, y, phase=1, size=1.0):
     scale = size * 2.0
 
     main_color = YELLOW if phase == 1 else ORANGE if phase == 2 else RED
@@ -105,4 +115,62 @@ def draw_boss_ship(screen, x, y, phase=1, size=1.0):
         pygame.draw.circle(screen, RED, (x - int(35 * scale), y), int(7 * scale))
         pygame.draw.circle(screen, RED, (x + int(35 * scale), y), int(7 * scale))
     if phase >= 3:
-        pygame.draw.circle(screen, DARK_RED, (x, y + int(15 * scale)), int(9 * scale))
\ No newline at end of file
+        pygame.draw.circle(screen, DARK_RED, (x, y + int(15 * scale)), int(9 * scale))
+
+
+def build_ship_sprite(render, scale, *args):
+    pad = int(100 * scale) + 10
+    canvas = pygame.Surface((pad * 2, pad * 2), pygame.SRCALPHA)
+    render(canvas, pad, pad, *args)
+
+    bounds = canvas.get_bounding_rect()
+    sprite = pygame.Surface(bounds.size)
+    sprite.fill(SPRITE_COLORKEY)
+    sprite.blit(canvas, (0, 0), bounds)
+    sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert()
+    return sprite, bounds.move(-pad, -pad), render, args
+
+
+def ship_sprite(key, render, scale, *args):
+    entry = ship_sprites.get(key)
+    if entry is None:
+        entry = build_ship_sprite(render, scale, *args)
+        ship_sprites[key] = entry
+    return entry
+
+
+def blit_ship(screen, entry, x, y):
+    sprite, bounds, render, args = entry
+    dest = bounds.move(x, y)
+    if screen.get_clip().contains(dest):
+        return screen.blit(sprite, dest)
+
+    render(screen, x, y, *args)
+    return dest.clip(screen.get_clip())
+
+
+def draw_player_ship(screen, x, y, color=BLUE, size=1.0):
+    entry = ship_sprite(('player', color, size), render_player_ship, size * 1.5, color, size)
+    return blit_ship(screen, entry, x, y)
+
+
+def draw_enemy_ship(screen, x, y, enemy_type, size=1.0):
+    entry = ship_sprite(('enemy', enemy_type, size), render_enemy_ship, size * 1.5, enemy_type, size)
+    return blit_ship(screen, entry, x, y)
+
+
+def draw_boss_ship(screen, x, y, phase=1, size=1.0):
+    entry = ship_sprite(('boss', phase, size), render_boss_ship, size * 2.0, phase, size)
+    return blit_ship(screen, entry, x, y)
+
+
+def prewarm_ship_sprites():
+    for color in (BLUE, GREEN):
+        ship_sprite(('player', color, 1.0), render_player_ship, 1.5, color, 1.0)
+    ship_sprite(('player', CYAN, 2.0), render_player_ship, 3.0, CYAN, 2.0)
+    for hull in ENEMY_HULLS:
+        ship_sprite(('enemy', hull, 1.0), render_enemy_ship, 1.5, hull, 1.0)
+    for phase in (1, 2, 3):
+        ship_sprite(('boss', phase, 1.0), render_boss_ship, 2.0, phase, 1.0)
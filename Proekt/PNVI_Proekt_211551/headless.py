@@ -0,0 +1,85 @@
+import argparse
+import time
+from game import Game, COLLISION_MODES
+from controls import ScriptedInput, autopilot_policy, idle_policy
+
+POLICIES = {
+    'idle': idle_policy,
+    'autopilot': autopilot_policy
+}
+
+
+class NullSoundManager:
+    def __init__(self):
+        self.sounds = {}
+        self.music_playing = False
+
+    def play_sound(self, sound_name):
+        pass
+
+    def play_music(self, music_file):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def create_headless_game(difficulty='normal', seed=None, policy=autopilot_policy, collision_mode='discrete'):
+    game = Game(headless=True, input_source=ScriptedInput(policy), sound_manager=NullSoundManager(),
+                collision_mode=collision_mode)
+    game.difficulty = difficulty
+    game.state = 'playing'
+    game.reset_game(seed)
+    return game
+
+
+def run_session(difficulty='normal', seed=None, policy=autopilot_policy, max_frames=36000, collision_mode='discrete'):
+    game = create_headless_game(difficulty, seed, policy, collision_mode)
+
+    frames = 0
+    while game.state == 'playing' and frames < max_frames:
+        game.update_game()
+        frames += 1
+
+    return {
+        'seed': game.seed,
+        'difficulty': difficulty,
+        'score': game.score,
+        'level': game.level,
+        'frames': frames,
+        'game_over': game.state == 'game_over'
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Galactic Defense sessions without a display or audio.")
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--difficulty', choices=['easy', 'normal', 'hard'], default='normal')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='autopilot')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-frames', type=int, default=36000)
+    parser.add_argument('--collisions', choices=COLLISION_MODES, default='discrete',
+                        help="swept tests each bullet's whole path this frame instead of its end position")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    total_frames = 0
+    for i in range(args.sessions):
+        result = run_session(args.difficulty, args.seed + i, POLICIES[args.policy], args.max_frames, args.collisions)
+        total_frames += result['frames']
+        print(f"seed={result['seed']} score={result['score']} level={result['level']} "
+              f"frames={result['frames']} game_over={result['game_over']}")
+
+    elapsed = time.perf_counter() - start
+    print(f"{args.sessions} sessions, {total_frames} frames in {elapsed:.2f}s "
+          f"({total_frames / max(elapsed, 1e-9):.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
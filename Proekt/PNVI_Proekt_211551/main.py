@@ -1,5 +1,18 @@
-from game import Game
+import argparse
+from game import Game, COLLISION_MODES
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Galactic Defense Shooter")
+    parser.add_argument('--record', metavar='DIR', help="save a replay of every session into DIR")
+    parser.add_argument('--profile', metavar='FILE', help="record frame timings and dump them to FILE (.json or .csv) on exit")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="redraw and present only the changed parts of the game area over a static background")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="simulate the next frame on a worker thread while the current one is drawn")
+    parser.add_argument('--collisions', choices=COLLISION_MODES, default='discrete',
+                        help="collision mode for player bullets; recorded replays keep it")
+    args = parser.parse_args()
+
+    game = Game(replay_dir=args.record, profile_path=args.profile, dirty_rendering=args.dirty_rects,
+                collision_mode=args.collisions, pipeline=args.pipeline)
     game.run()
\ No newline at end of file
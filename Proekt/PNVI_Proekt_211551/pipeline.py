@@ -0,0 +1,106 @@
+import copy
+import os
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from bullets import BulletPool
+from effects import ParticleEmitter
+from entities import EnemySwarm
+
+
+def detach(entity):
+    if entity is None:
+        return None
+    clone = copy.copy(entity)
+    for name in entity.__slots__:
+        value = getattr(entity, name, None)
+        if isinstance(value, (pygame.Rect, dict, list)):
+            setattr(clone, name, value.copy())
+    return clone
+
+
+def usable_cpus():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def pipeline_supported():
+    return usable_cpus() > 1
+
+
+class FrameSnapshot:
+    def __init__(self, game):
+        self.state = None
+        self.alpha = 1.0
+        self.score = 0
+        self.level = 1
+        self.mothership_spawned = False
+        self.player = None
+        self.boss = None
+        self.alien_mothership = None
+        self.power_ups = []
+        self.power_up_notifications = []
+        self.player_bullets = BulletPool(game.player_bullets.capacity)
+        self.enemy_bullets = BulletPool(game.enemy_bullets.capacity)
+        self.enemies = EnemySwarm(game.enemies.capacity)
+        self.particles = ParticleEmitter(game.particles.capacity, game.particles.max_life)
+
+    def capture(self, game, alpha):
+        self.state = game.state
+        self.alpha = alpha
+        self.score = game.score
+        self.level = game.level
+        self.mothership_spawned = game.mothership_spawned
+        self.player = detach(game.player)
+        self.boss = detach(game.boss)
+        self.alien_mothership = detach(game.alien_mothership)
+        self.power_ups = [detach(power_up) for power_up in game.power_ups]
+        self.power_up_notifications = [detach(notification) for notification in game.power_up_notifications]
+        self.player_bullets.copy_from(game.player_bullets)
+        self.enemy_bullets.copy_from(game.enemy_bullets)
+        self.enemies.copy_from(game.enemies)
+        self.particles.copy_from(game.particles)
+
+
+class FramePipeline:
+    def __init__(self, game):
+        self.game = game
+        self.front = FrameSnapshot(game)
+        self.back = FrameSnapshot(game)
+        self.ready = False
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='simulation')
+
+    def invalidate(self):
+        self.ready = False
+
+    def simulate(self, steps, alpha):
+        game = self.game
+        with game.profiler.section('update'):
+            for _ in range(steps):
+                if game.state != 'playing':
+                    break
+                game.step()
+        with game.profiler.section('pipeline.snapshot'):
+            self.back.capture(game, alpha)
+
+    def run_frame(self, steps, alpha):
+        future = self.executor.submit(self.simulate, steps, alpha)
+        if self.ready:
+            self.draw()
+            self.finish(future)
+        else:
+            self.finish(future)
+            self.draw()
+
+    def draw(self):
+        with self.game.profiler.section('draw'):
+            self.game.draw_game(self.front.alpha, self.front)
+
+    def finish(self, future):
+        with self.game.profiler.section('pipeline.wait'):
+            future.result()
+        self.front, self.back = self.back, self.front
+        self.ready = True
+
+    def close(self):
+        self.executor.shutdown()
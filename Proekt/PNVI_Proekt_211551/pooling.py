@@ -0,0 +1,160 @@
+import numpy as np
+
+VECTOR_ABOVE = 64
+SCALAR_BELOW = 32
+
+
+class ObjectPool:
+    def __init__(self, factory, max_free=512):
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.live = 0
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.factory(*args)
+            self.misses += 1
+
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        self.live = max(0, self.live - 1)
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    def stats(self):
+        return {
+            'live': self.live,
+            'free': len(self.free),
+            'hits': self.hits,
+            'misses': self.misses,
+            'high_water': self.high_water
+        }
+
+
+class ColumnPool:
+    columns = ()
+
+    def __init__(self, capacity, vector_above=VECTOR_ABOVE, scalar_below=SCALAR_BELOW):
+        self.capacity = capacity
+        self.count = 0
+        self.vector_above = vector_above
+        self.scalar_below = scalar_below
+        self.vectorized = False
+        self.dtypes = dict(self.columns)
+        self.arrays = [np.zeros(capacity, dtype=dtype) for _, dtype in self.columns]
+        self.lists = [[] for _ in self.columns]
+        self.bind(self.lists)
+
+    def __len__(self):
+        return self.count
+
+    def bind(self, storage):
+        for (name, _), values in zip(self.columns, storage):
+            setattr(self, name, values)
+
+    def clear(self):
+        self.count = 0
+        for values in self.lists:
+            values.clear()
+        self.vectorized = False
+        self.bind(self.lists)
+
+    def copy_from(self, pool):
+        self.clear()
+        self.count = pool.count
+        if pool.vectorized:
+            for array, source in zip(self.arrays, pool.arrays):
+                array[:self.count] = source[:self.count]
+            self.vectorized = True
+            self.bind(self.arrays)
+        else:
+            for values, source in zip(self.lists, pool.lists):
+                values.extend(source)
+
+    def settle(self):
+        if self.vectorized:
+            if self.count < self.scalar_below:
+                self.devectorize()
+        elif self.count > self.vector_above:
+            self.vectorize()
+
+    def vectorize(self):
+        n = self.count
+        for array, values in zip(self.arrays, self.lists):
+            array[:n] = values
+            values.clear()
+        self.vectorized = True
+        self.bind(self.arrays)
+
+    def devectorize(self):
+        order = self.order()
+        for array, values in zip(self.arrays, self.lists):
+            values[:] = array[order].tolist()
+        self.vectorized = False
+        self.bind(self.lists)
+
+    def order(self):
+        return np.arange(self.count)
+
+    def column(self, name):
+        values = getattr(self, name)
+        if self.vectorized:
+            return values[:self.count]
+        return np.array(values, dtype=self.dtypes[name])
+
+    def add(self, row):
+        if self.vectorized:
+            i = self.count
+            for array, value in zip(self.arrays, row):
+                array[i] = value
+        else:
+            for values, value in zip(self.lists, row):
+                values.append(value)
+        self.count += 1
+        self.settle()
+
+    def drop_rows(self, removed):
+        for i in sorted(removed, reverse=True):
+            for values in self.lists:
+                del values[i]
+        self.count -= len(removed)
+
+    def compact(self, mask):
+        keep = np.flatnonzero(~mask[:self.count])
+        if len(keep) == self.count:
+            return
+        for array in self.arrays:
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def remove_mask(self, mask):
+        if self.vectorized:
+            self.compact(mask)
+        else:
+            self.drop_rows([i for i, removed in enumerate(mask) if removed])
+        self.settle()
+
+    def remove(self, indices):
+        if self.vectorized:
+            mask = np.zeros(self.count, dtype=bool)
+            mask[indices] = True
+            self.remove_mask(mask)
+        else:
+            self.drop_rows(set(indices))
+            self.settle()
@@ -0,0 +1,187 @@
+import csv
+import gc
+import json
+import sys
+import time
+import pygame
+from collections import deque
+from constants import *
+from text_cache import text_cache
+
+
+class NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+class ProfileSection:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    def __init__(self, window=300, history=3600, enabled=False):
+        self.enabled = False
+        self.overlay_visible = False
+        self.window = window
+        self.timings = {}
+        self.frames = deque(maxlen=history)
+        self.frame_number = 0
+
+        self.current = {}
+        self.frame_start = 0.0
+        self.blocks_start = 0
+        self.gc_collections = 0
+        self.frame_gc_start = 0
+
+        self.overlay_surface = None
+        self.overlay_age = 0
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            gc.callbacks.append(self.on_gc)
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            gc.callbacks.remove(self.on_gc)
+
+    def reset(self):
+        self.timings = {}
+        self.frames.clear()
+        self.frame_number = 0
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+        if self.overlay_visible:
+            self.enable()
+
+    def on_gc(self, phase, info):
+        if phase == 'stop':
+            self.gc_collections += 1
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return ProfileSection(self, name)
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self.frame_start = time.perf_counter()
+        self.blocks_start = sys.getallocatedblocks()
+        self.frame_gc_start = self.gc_collections
+
+    def end_frame(self, counts):
+        if not self.enabled:
+            return
+        self.current['frame'] = time.perf_counter() - self.frame_start
+        for name, seconds in self.current.items():
+            samples = self.timings.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self.timings[name] = samples
+            samples.append(seconds * 1000)
+
+        record = {'frame_number': self.frame_number}
+        record.update((name, round(seconds * 1000, 4)) for name, seconds in self.current.items())
+        record.update(counts)
+        record['allocated_blocks'] = sys.getallocatedblocks() - self.blocks_start
+        record['gc_collections'] = self.gc_collections - self.frame_gc_start
+        self.frames.append(record)
+        self.frame_number += 1
+
+    def summary(self):
+        result = {}
+        for name, samples in sorted(self.timings.items()):
+            ordered = sorted(samples)
+            result[name] = {
+                'p50': percentile(ordered, 0.50),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99),
+                'mean': sum(ordered) / len(ordered)
+            }
+        return result
+
+    def dump(self, path):
+        frames = list(self.frames)
+        if path.endswith('.csv'):
+            columns = []
+            for record in frames:
+                for name in record:
+                    if name not in columns:
+                        columns.append(name)
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(frames)
+        else:
+            with open(path, 'w') as f:
+                json.dump({'summary': self.summary(), 'frames': frames}, f, indent=1)
+
+    def render_overlay(self):
+        font = text_cache.font(20)
+        lines = [("STAGE", "p50", "p95", "p99")]
+        for name, stats in self.summary().items():
+            lines.append((name, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"))
+
+        last = self.frames[-1] if self.frames else {}
+        counts = [f"{name}: {value}" for name, value in last.items()
+                  if name.startswith(('count.', 'pool.', 'quality.')) or name in ('allocated_blocks', 'gc_collections')]
+
+        line_height = 16
+        height = (len(lines) + len(counts) + 1) * line_height + 10
+        surface = pygame.Surface((330, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+
+        y = 5
+        for name, p50, p95, p99 in lines:
+            surface.blit(font.render(name, True, WHITE), (5, y))
+            for column, value in zip((190, 235, 280), (p50, p95, p99)):
+                surface.blit(font.render(value, True, YELLOW), (column, y))
+            y += line_height
+        y += line_height // 2
+        for text in counts:
+            surface.blit(font.render(text, True, CYAN), (5, y))
+            y += line_height
+        return surface
+
+    def draw_overlay(self, screen):
+        if not self.overlay_visible:
+            return None
+        if self.overlay_surface is None or self.overlay_age >= 30:
+            self.overlay_surface = self.render_overlay()
+            self.overlay_age = 0
+        self.overlay_age += 1
+        return screen.blit(self.overlay_surface, (10, 60))
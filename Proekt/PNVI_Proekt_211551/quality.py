@@ -0,0 +1,85 @@
+from collections import deque
+from constants import *
+
+QUALITY_TIERS = [
+    {'name': 'high', 'particle_density': 1.0, 'max_particles': None, 'glow_layers': 5, 'notification_glow': True,
+     'background_glow': True, 'star_density': 1.0},
+    {'name': 'medium', 'particle_density': 0.5, 'max_particles': 1500, 'glow_layers': 2, 'notification_glow': True,
+     'background_glow': True, 'star_density': 1.0},
+    {'name': 'low', 'particle_density': 0.25, 'max_particles': 600, 'glow_layers': 0, 'notification_glow': False,
+     'background_glow': False, 'star_density': 0.5}
+]
+
+
+class QualityGovernor:
+    def __init__(self, budget=1.0 / FPS, window=30, degrade_above=1.0, restore_below=0.7, restore_after=180,
+                 max_restore_after=1440):
+        self.budget = budget
+        self.samples = deque(maxlen=window)
+        self.degrade_above = degrade_above
+        self.restore_below = restore_below
+        self.restore_after = restore_after
+        self.max_restore_after = max_restore_after
+        self.restore_wait = restore_after
+        self.headroom_frames = 0
+        self.frames_since_restore = None
+        self.changes = 0
+        self.set_tier(0)
+
+    def set_tier(self, tier):
+        self.tier = tier
+        settings = QUALITY_TIERS[tier]
+        self.name = settings['name']
+        self.particle_density = settings['particle_density']
+        self.max_particles = settings['max_particles']
+        self.glow_layers = settings['glow_layers']
+        self.notification_glow = settings['notification_glow']
+        self.background_glow = settings['background_glow']
+        self.star_density = settings['star_density']
+        self.samples.clear()
+        self.headroom_frames = 0
+
+    def degrade(self):
+        if self.frames_since_restore is not None and self.frames_since_restore < self.restore_wait:
+            self.restore_wait = min(self.restore_wait * 2, self.max_restore_after)
+        self.frames_since_restore = None
+        self.set_tier(self.tier + 1)
+        self.changes += 1
+
+    def restore(self):
+        self.frames_since_restore = 0
+        self.set_tier(self.tier - 1)
+        self.changes += 1
+
+    def observe(self, frame_seconds):
+        self.samples.append(frame_seconds)
+        if self.frames_since_restore is not None:
+            self.frames_since_restore += 1
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        average = sum(self.samples) / len(self.samples)
+        if average > self.budget * self.degrade_above:
+            self.headroom_frames = 0
+            if self.tier < len(QUALITY_TIERS) - 1:
+                self.degrade()
+        elif average < self.budget * self.restore_below:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.restore_wait and self.tier > 0:
+                self.restore()
+        else:
+            self.headroom_frames = 0
+
+    def reset(self):
+        self.set_tier(0)
+        self.restore_wait = self.restore_after
+        self.frames_since_restore = None
+        self.changes = 0
+
+    def telemetry(self):
+        return {
+            'quality.tier': self.tier,
+            'quality.changes': self.changes,
+            'quality.restore_wait': self.restore_wait
+        }
+
@@ -0,0 +1,58 @@
+import pygame
+from constants import *
+
+
+class DirtyRectRenderer:
+    def __init__(self, background, area=None, max_rects=400, max_coverage=0.5):
+        self.background = background
+        self.area = area or pygame.Rect(0, 0, GAME_AREA_WIDTH, SCREEN_HEIGHT)
+        self.max_rects = max_rects
+        self.max_coverage = max_coverage
+        self.previous = []
+        self.current = []
+        self.full = True
+        self.needs_full = True
+        self.rect_count = 0
+        self.pixel_count = 0
+
+    def invalidate(self):
+        self.needs_full = True
+
+    def too_large(self, rects):
+        if len(rects) > self.max_rects:
+            return True
+        covered = sum(rect.width * rect.height for rect in rects)
+        return covered > self.area.width * self.area.height * self.max_coverage
+
+    def begin(self, screen):
+        self.previous = self.current
+        self.current = []
+        self.full = self.needs_full or self.too_large(self.previous)
+        self.needs_full = False
+
+        if self.full:
+            screen.blit(self.background, self.area)
+        else:
+            background = self.background
+            offset_x, offset_y = -self.area.x, -self.area.y
+            for rect in self.previous:
+                screen.blit(background, rect, rect.move(offset_x, offset_y))
+        return self.full
+
+    def add(self, rect):
+        rect = rect.clip(self.area)
+        if rect.width and rect.height:
+            self.current.append(rect)
+
+    def extend(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def dirty_rects(self):
+        if self.full or self.too_large(self.current):
+            rects = [self.area.copy()]
+        else:
+            rects = self.previous + self.current
+        self.rect_count = len(rects)
+        self.pixel_count = sum(rect.width * rect.height for rect in rects)
+        return rects
@@ -0,0 +1,225 @@
+import argparse
+import os
+import struct
+import time
+import zlib
+from controls import InputState
+from game import COLLISION_MODES
+
+REPLAY_MAGIC = b'GDSR'
+REPLAY_VERSION = 4
+HEADER_FORMAT = '<4sBBBQIIII'
+CHECKSUM_FORMAT = '<II'
+DIFFICULTIES = ['easy', 'normal', 'hard']
+
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+SHOOT = 16
+MOTHERSHIP = 32
+PAUSE = 64
+
+
+class ReplayError(Exception):
+    pass
+
+
+class ReplayDesyncError(ReplayError):
+    def __init__(self, frame, expected, actual):
+        super().__init__(f"Replay desynced at frame {frame}: expected checksum {expected:08x}, got {actual:08x}")
+        self.frame = frame
+        self.expected = expected
+        self.actual = actual
+
+
+def encode_input(controls, pause=False):
+    return ((LEFT if controls.left else 0) | (RIGHT if controls.right else 0) |
+            (UP if controls.up else 0) | (DOWN if controls.down else 0) |
+            (SHOOT if controls.shoot else 0) | (MOTHERSHIP if controls.mothership else 0) |
+            (PAUSE if pause else 0))
+
+
+def decode_input(mask):
+    return InputState(
+        left=bool(mask & LEFT),
+        right=bool(mask & RIGHT),
+        up=bool(mask & UP),
+        down=bool(mask & DOWN),
+        shoot=bool(mask & SHOOT),
+        mothership=bool(mask & MOTHERSHIP)
+    )
+
+
+def pool_checksum(pool, crc):
+    order = pool.order()
+    for name in ('x', 'y', 'vx', 'vy', 'damage'):
+        crc = zlib.crc32(pool.column(name)[order].tobytes(), crc)
+    return crc
+
+
+def swarm_checksum(swarm, crc):
+    for name in ('kind', 'x', 'y', 'health', 'shoot_timer'):
+        crc = zlib.crc32(swarm.column(name).tobytes(), crc)
+    return crc
+
+
+def state_checksum(game):
+    player = game.player
+    values = [
+        game.state, game.score, game.level, game.level_timer, game.enemy_spawn_timer,
+        game.power_up_spawn_timer, game.mothership_spawned,
+        player.x, player.y, player.health, player.ammo, player.reloading, player.reload_timer,
+        player.shoot_timer, sorted(player.power_ups.items()),
+        [(power_up.power_type, power_up.x, power_up.y) for power_up in game.power_ups],
+        len(game.power_up_notifications)
+    ]
+    if game.boss:
+        boss = game.boss
+        values.append((boss.x, boss.y, boss.health, boss.phase, boss.shoot_timer, boss.movement_timer, boss.direction))
+    if game.alien_mothership:
+        mothership = game.alien_mothership
+        values.append((mothership.x, mothership.y, mothership.health, mothership.phase, mothership.shoot_timer,
+                       mothership.direction))
+
+    crc = zlib.crc32(repr(values).encode())
+    crc = pool_checksum(game.player_bullets, crc)
+    crc = pool_checksum(game.enemy_bullets, crc)
+    crc = swarm_checksum(game.enemies, crc)
+    return crc
+
+
+class ReplayRecorder:
+    def __init__(self, seed, difficulty, collision_mode='discrete', checksum_interval=60):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.collision_mode = collision_mode
+        self.checksum_interval = checksum_interval
+        self.frames = bytearray()
+        self.checksums = []
+
+    def record(self, game, controls, pause=False):
+        self.frames.append(encode_input(controls, pause))
+        if len(self.frames) % self.checksum_interval == 0:
+            self.checksums.append((len(self.frames), state_checksum(game)))
+
+    def save(self, path):
+        payload = zlib.compress(bytes(self.frames), 9)
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, DIFFICULTIES.index(self.difficulty),
+                             COLLISION_MODES.index(self.collision_mode), self.seed, self.checksum_interval,
+                             len(self.frames), len(self.checksums), len(payload))
+
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+            for frame, checksum in self.checksums:
+                f.write(struct.pack(CHECKSUM_FORMAT, frame, checksum))
+
+
+class Replay:
+    def __init__(self, seed, difficulty, collision_mode, checksum_interval, frames, checksums):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.collision_mode = collision_mode
+        self.checksum_interval = checksum_interval
+        self.frames = frames
+        self.checksums = checksums
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        if len(data) < header_size:
+            raise ReplayError(f"{path} is too short to be a replay")
+        (magic, version, difficulty, collision_mode, seed, interval, frame_count, checksum_count,
+         payload_size) = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError(f"{path} is not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        if collision_mode >= len(COLLISION_MODES):
+            raise ReplayError(f"Unknown collision mode {collision_mode} in {path}")
+
+        try:
+            frames = zlib.decompress(data[header_size:header_size + payload_size])
+        except zlib.error:
+            raise ReplayError(f"{path} is truncated")
+        if len(frames) != frame_count:
+            raise ReplayError(f"{path} is truncated")
+
+        offset = header_size + payload_size
+        checksum_size = struct.calcsize(CHECKSUM_FORMAT)
+        if len(data) - offset < checksum_count * checksum_size:
+            raise ReplayError("truncated checksum block")
+        checksums = [struct.unpack_from(CHECKSUM_FORMAT, data, offset + i * checksum_size)
+                     for i in range(checksum_count)]
+        return cls(seed, DIFFICULTIES[difficulty], COLLISION_MODES[collision_mode], interval, frames, checksums)
+
+
+class ReplayInput:
+    def __init__(self, frames):
+        self.frames = frames
+        self.frame = 0
+        self.pauses = 0
+
+    def poll(self, game):
+        mask = self.frames[self.frame]
+        self.frame += 1
+        if mask & PAUSE:
+            self.pauses += 1
+        return decode_input(mask)
+
+
+def play_replay(path, verify=True):
+    from headless import create_headless_game
+
+    replay = Replay.load(path)
+    replay_input = ReplayInput(replay.frames)
+    game = create_headless_game(replay.difficulty, replay.seed, collision_mode=replay.collision_mode)
+    game.input_source = replay_input
+
+    expected = dict(replay.checksums)
+    verified = 0
+    start = time.perf_counter()
+    for frame in range(1, len(replay.frames) + 1):
+        game.update_game()
+        if verify and frame in expected:
+            actual = state_checksum(game)
+            if actual != expected[frame]:
+                raise ReplayDesyncError(frame, expected[frame], actual)
+            verified += 1
+
+    return {
+        'seed': replay.seed,
+        'difficulty': replay.difficulty,
+        'collision_mode': replay.collision_mode,
+        'frames': len(replay.frames),
+        'score': game.score,
+        'level': game.level,
+        'pauses': replay_input.pauses,
+        'checksums_verified': verified,
+        'elapsed': time.perf_counter() - start
+    }
+
+
+def replay_path(directory, seed):
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"replay_{time.strftime('%Y%m%d_%H%M%S')}_{seed}.gdr")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back a recorded session headless and verify its checksums.")
+    parser.add_argument('replays', nargs='+')
+    parser.add_argument('--no-verify', action='store_true')
+    args = parser.parse_args()
+
+    for path in args.replays:
+        result = play_replay(path, verify=not args.no_verify)
+        print(f"{path}: {result['frames']} frames, {result['collision_mode']} collisions, score={result['score']} "
+              f"level={result['level']} checksums={result['checksums_verified']} in {result['elapsed']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import json
+import os
+import queue
+import threading
+import time
+
+SCORE_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_FILE = 'scores.json'
+LOG_FILE = 'sessions.jsonl'
+LEGACY_FILE = 'high_score.json'
+TOP_N = 10
+MAX_LOG_SESSIONS = 1000
+
+
+def empty_index():
+    return {
+        'high_score': 0,
+        'last_id': 0,
+        'log_size': 0,
+        'log_sessions': 0,
+        'top': {},
+        'totals': {}
+    }
+
+
+def apply_session(index, session, top_n=TOP_N):
+    difficulty = session['difficulty']
+    index['high_score'] = max(index['high_score'], session['score'])
+    index['last_id'] = max(index['last_id'], session['id'])
+
+    top = index['top'].setdefault(difficulty, [])
+    top.append(session)
+    top.sort(key=lambda entry: (-entry['score'], entry['id']))
+    del top[top_n:]
+
+    totals = index['totals'].setdefault(difficulty, {'sessions': 0, 'score': 0, 'duration': 0.0, 'kills': {}})
+    totals['sessions'] += 1
+    totals['score'] += session['score']
+    totals['duration'] += session['duration']
+    for kind, count in session['kills'].items():
+        totals['kills'][kind] = totals['kills'].get(kind, 0) + count
+
+
+def write_atomic(path, text):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_sessions(f):
+    for line in f:
+        try:
+            session = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(session, dict) and 'id' in session:
+            yield session
+
+
+class ScoreStore:
+    def __init__(self, directory=SCORE_DIR, top_n=TOP_N, max_log_sessions=MAX_LOG_SESSIONS):
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.log_path = os.path.join(directory, LOG_FILE)
+        self.legacy_path = os.path.join(directory, LEGACY_FILE)
+        self.top_n = top_n
+        self.max_log_sessions = max_log_sessions
+
+        self.durable = self.load_index()
+        self.index = json.loads(json.dumps(self.durable))
+        self.high_score = self.index['high_score']
+
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def load_index(self):
+        try:
+            with open(self.index_path) as f:
+                index = dict(empty_index(), **json.load(f))
+        except (OSError, ValueError, TypeError):
+            index = empty_index()
+            try:
+                with open(self.legacy_path) as f:
+                    index['high_score'] = int(json.load(f).get('high_score', 0))
+            except (OSError, ValueError, TypeError, AttributeError):
+                pass
+
+        try:
+            with open(self.log_path, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(index['log_size'] if index['log_size'] <= size else 0)
+                tail = f.read()
+                for session in read_sessions(tail.splitlines()):
+                    if session['id'] > index['last_id']:
+                        apply_session(index, session, self.top_n)
+                        index['log_sessions'] += 1
+
+                if tail and not tail.endswith(b'\n'):
+                    size -= len(tail) - tail.rfind(b'\n') - 1
+                    f.truncate(size)
+                index['log_size'] = size
+        except OSError:
+            pass
+        return index
+
+    def record(self, session):
+        session = dict(session, id=self.index['last_id'] + 1, time=time.strftime('%Y-%m-%d %H:%M:%S'))
+        apply_session(self.index, session, self.top_n)
+        self.high_score = self.index['high_score']
+        self.queue.put(session)
+
+    def top_scores(self, difficulty, n=TOP_N):
+        return [dict(entry) for entry in self.index['top'].get(difficulty, [])[:n]]
+
+    def totals(self, difficulty):
+        return self.index['totals'].get(difficulty)
+
+    def write_loop(self):
+        while True:
+            session = self.queue.get()
+            if session is None:
+                break
+            try:
+                self.persist(session)
+            except OSError as error:
+                print(f"Warning: Could not save session stats: {error}")
+
+    def persist(self, session):
+        with open(self.log_path, 'a') as f:
+            f.write(json.dumps(session, sort_keys=True) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+
+        index = self.durable
+        apply_session(index, session, self.top_n)
+        index['log_size'] = size
+        index['log_sessions'] += 1
+
+        if index['log_sessions'] > self.max_log_sessions:
+            self.compact()
+        write_atomic(self.index_path, json.dumps(index, sort_keys=True))
+
+    def compact(self):
+        keep = self.max_log_sessions // 2
+        with open(self.log_path) as f:
+            sessions = list(read_sessions(f))[-keep:]
+
+        write_atomic(self.log_path, ''.join(json.dumps(session, sort_keys=True) + '\n' for session in sessions))
+        self.durable['log_size'] = os.path.getsize(self.log_path)
+        self.durable['log_sessions'] = len(sessions)
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
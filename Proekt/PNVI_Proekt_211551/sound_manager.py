@@ -1,50 +1,147 @@
 import pygame
 import os
+import threading
+
+SOUND_DIR = os.path.dirname(os.path.abspath(__file__))
+SOUND_EXTENSIONS = ('.wav', '.ogg', '.mp3')
+CHANNELS = 16
+RESERVED_CHANNELS = 4
+HIGH_PRIORITY = 2
+
+SOUND_FILES = {
+    'player_shoot': 'sounds/player_shoot',
+    'enemy_shoot': 'sounds/enemy_shoot',
+    'explosion': 'sounds/explosion',
+    'powerup': 'sounds/powerup',
+    'boss_hit': 'sounds/boss_hit',
+    'shield_activate': 'sounds/shield_activate',
+    'reload': 'sounds/reload',
+    'no_ammo': 'sounds/no_ammo',
+    'mothership_spawn': 'sounds/mothership_spawn',
+    'mothership_destroy': 'sounds/mothership_destroy',
+    'game_over': 'sounds/game_over'
+}
+
+SOUND_PRIORITIES = {
+    'enemy_shoot': 0,
+    'player_shoot': 1,
+    'reload': 1,
+    'no_ammo': 1,
+    'explosion': 2,
+    'powerup': 2,
+    'boss_hit': 2,
+    'shield_activate': 2,
+    'mothership_spawn': 3,
+    'mothership_destroy': 3,
+    'game_over': 3
+}
+
+
+def sound_path(base):
+    for extension in SOUND_EXTENSIONS:
+        path = os.path.join(SOUND_DIR, base + extension)
+        if os.path.exists(path):
+            return path
+    return None
 
 
 class SoundManager:
     def __init__(self):
         self.sounds = {}
+        self.pending = set()
         self.music_playing = False
+        self.lock = threading.Lock()
+        self.channels = []
+        self.channel_priorities = []
+        self.closing = False
 
+        self.loader = threading.Thread(target=self.start, daemon=True)
+        self.loader.start()
+
+    def init_mixer(self):
         try:
-            self.load_sounds()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(CHANNELS)
+            pygame.mixer.set_reserved(RESERVED_CHANNELS)
+            self.channel_priorities = [0] * CHANNELS
+            self.channels = [pygame.mixer.Channel(i) for i in range(CHANNELS)]
         except pygame.error:
             print("Warning: Could not load sound files. Game will run without audio.")
+            return False
+        return True
+
+    def start(self):
+        if self.init_mixer():
+            self.load_sounds()
 
     def load_sounds(self):
-        sound_files = {
-            'player_shoot': 'sounds/player_shoot.wav',
-            'enemy_shoot': 'sounds/enemy_shoot.wav',
-            'explosion': 'sounds/explosion.wav',
-            'powerup': 'sounds/powerup.wav',
-            'boss_hit': 'sounds/boss_hit.wav',
-            'mothership_spawn': 'sounds/mothership_spawn.wav',
-            'mothership_destroy': 'sounds/mothership_destroy.wav',
-            'shield_activate': 'sounds/shield.wav',
-            'reload': 'sounds/reload.wav',
-            'no_ammo': 'sounds/no_ammo.wav',
-            'game_over': 'sounds/game_over.wav'
-        }
-
-        for sound_name, file_path in sound_files.items():
-            try:
-                if os.path.exists(file_path):
-                    self.sounds[sound_name] = pygame.mixer.Sound(file_path)
-                    self.sounds[sound_name].set_volume(0.7)
-                else:
-                    self.sounds[sound_name] = None
-            except pygame.error:
-                self.sounds[sound_name] = None
+        for sound_name in SOUND_FILES:
+            if self.closing:
+                break
+            self.load(sound_name)
+
+    def close(self):
+        self.closing = True
+        self.loader.join()
+
+    def load(self, sound_name):
+        with self.lock:
+            if sound_name not in self.sounds:
+                self.sounds[sound_name] = self.decode(sound_name)
+            return self.sounds[sound_name]
+
+    def decode(self, sound_name):
+        path = sound_path(SOUND_FILES[sound_name]) if sound_name in SOUND_FILES else None
+        if path is None:
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+            sound.set_volume(0.7)
+            return sound
+        except pygame.error:
+            return None
 
     def play_sound(self, sound_name):
-        if sound_name in self.sounds and self.sounds[sound_name]:
-            self.sounds[sound_name].play()
+        self.pending.add(sound_name)
+
+    def find_channel(self, priority):
+        first = 0 if priority >= HIGH_PRIORITY else RESERVED_CHANNELS
+        for i in range(first, len(self.channels)):
+            if not self.channels[i].get_busy():
+                return i
+
+        lowest = None
+        for i in range(first, len(self.channels)):
+            if self.channel_priorities[i] < priority and (
+                    lowest is None or self.channel_priorities[i] < self.channel_priorities[lowest]):
+                lowest = i
+        return lowest
+
+    def flush(self):
+        if not self.pending or not self.channels:
+            self.pending.clear()
+            return
+
+        for sound_name in sorted(self.pending, key=lambda name: SOUND_PRIORITIES.get(name, 1), reverse=True):
+            sound = self.sounds.get(sound_name)
+            if sound is None and sound_name not in self.sounds:
+                sound = self.load(sound_name)
+            if sound is None:
+                continue
+
+            priority = SOUND_PRIORITIES.get(sound_name, 1)
+            i = self.find_channel(priority)
+            if i is not None:
+                self.channels[i].play(sound)
+                self.channel_priorities[i] = priority
+        self.pending.clear()
 
     def play_music(self, music_file):
         try:
-            if os.path.exists(music_file) and not self.music_playing:
-                pygame.mixer.music.load(music_file)
+            music_path = os.path.join(SOUND_DIR, music_file)
+            if os.path.exists(music_path) and not self.music_playing:
+                pygame.mixer.music.load(music_path)
                 pygame.mixer.music.set_volume(0.3)
                 pygame.mixer.music.play(-1)
                 self.music_playing = True
@@ -52,5 +149,6 @@ class SoundManager:
             pass
 
     def stop_music(self):
-        pygame.mixer.music.stop()
-        self.music_playing = False
\ No newline at end of file
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.music_playing = False
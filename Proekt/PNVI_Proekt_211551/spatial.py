@@ -0,0 +1,47 @@
+import numpy as np
+from constants import *
+
+
+class SpatialGrid:
+    def __init__(self, width=GAME_AREA_WIDTH, height=SCREEN_HEIGHT, cell_size=75):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+
+    def cell_members(self, left, top, right, bottom):
+        size = self.cell_size
+        col_start = np.clip(left // size, 0, self.cols - 1).astype(np.int64)
+        col_end = np.clip((right - 1) // size, 0, self.cols - 1).astype(np.int64)
+        row_start = np.clip(top // size, 0, self.rows - 1).astype(np.int64)
+        row_end = np.clip((bottom - 1) // size, 0, self.rows - 1).astype(np.int64)
+        members = np.arange(len(left))
+
+        cells = []
+        indices = []
+        for row_offset in range(int((row_end - row_start).max()) + 1):
+            for col_offset in range(int((col_end - col_start).max()) + 1):
+                inside = (row_start + row_offset <= row_end) & (col_start + col_offset <= col_end)
+                cells.append(((row_start + row_offset) * self.cols + col_start + col_offset)[inside])
+                indices.append(members[inside])
+        return np.concatenate(cells), np.concatenate(indices)
+
+    def pairs(self, first, second):
+        empty = np.zeros(0, dtype=np.int64)
+        if len(first[0]) == 0 or len(second[0]) == 0:
+            return empty, empty
+
+        first_cells, first_indices = self.cell_members(*first)
+        second_cells, second_indices = self.cell_members(*second)
+        order = np.argsort(second_cells, kind='stable')
+        second_cells = second_cells[order]
+        second_indices = second_indices[order]
+
+        starts = np.searchsorted(second_cells, first_cells, 'left')
+        counts = np.searchsorted(second_cells, first_cells, 'right') - starts
+        total = int(counts.sum())
+        if total == 0:
+            return empty, empty
+
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        keys = np.unique(np.repeat(first_indices, counts) * len(second[0]) + second_indices[offsets])
+        return keys // len(second[0]), keys % len(second[0])
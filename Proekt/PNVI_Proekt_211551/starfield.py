@@ -0,0 +1,75 @@
+import math
+import random
+import pygame
+from constants import *
+from graphics import SPRITE_COLORKEY
+
+STAR_THEMES = {
+    'default': [WHITE, GRAY, LIGHT_BLUE],
+    'mothership': [(0, 255, 100), (100, 255, 150), (150, 255, 200)]
+}
+
+STAR_LAYERS = [
+    {'count': 70, 'speed': 30, 'radii': [1]},
+    {'count': 50, 'speed': 60, 'radii': [1, 2]},
+    {'count': 30, 'speed': 100, 'radii': [2]}
+]
+
+TWINKLE_GROUPS = 2
+
+
+class StarField:
+    def __init__(self, width=GAME_AREA_WIDTH, height=SCREEN_HEIGHT, seed=None):
+        self.width = width
+        self.height = height
+
+        rng = random.Random(seed)
+        self.layers = []
+        for layer in STAR_LAYERS:
+            groups = [[] for _ in range(TWINKLE_GROUPS)]
+            for i in range(layer['count']):
+                star = (rng.randint(0, width), rng.randint(0, height), rng.choice(layer['radii']), rng.randrange(3))
+                groups[i % TWINKLE_GROUPS].append(star)
+            phases = [rng.uniform(0, 2 * math.pi) for _ in range(TWINKLE_GROUPS)]
+            self.layers.append((layer['speed'], groups, phases))
+
+        self.surfaces = {}
+
+    def render_group(self, stars, palette):
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(SPRITE_COLORKEY)
+        for x, y, radius, color_index in stars:
+            color = palette[color_index]
+            pygame.draw.circle(surface, color, (x, y), radius)
+            if y + radius >= self.height:
+                pygame.draw.circle(surface, color, (x, y - self.height), radius)
+            elif y - radius < 0:
+                pygame.draw.circle(surface, color, (x, y + self.height), radius)
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return surface
+
+    def layer_surfaces(self, theme):
+        surfaces = self.surfaces.get(theme)
+        if surfaces is None:
+            palette = STAR_THEMES[theme]
+            surfaces = [[self.render_group(stars, palette) for stars in groups] for speed, groups, phases in self.layers]
+            self.surfaces[theme] = surfaces
+        return surfaces
+
+    def prewarm(self):
+        for theme in STAR_THEMES:
+            self.layer_surfaces(theme)
+
+    def draw(self, screen, seconds, theme='default', density=1.0):
+        height = self.height
+        for (speed, groups, phases), surfaces in zip(self.layers, self.layer_surfaces(theme)):
+            offset = int(seconds * speed) % height
+            shown = max(1, round(len(surfaces) * density))
+            for phase, surface in zip(phases[:shown], surfaces[:shown]):
+                surface.set_alpha(int(185 + 70 * math.sin(seconds * 3 + phase)), pygame.RLEACCEL)
+                screen.blit(surface, (0, offset), (0, 0, self.width, height - offset))
+                if offset:
+                    screen.blit(surface, (0, 0), (0, height - offset, self.width, offset))
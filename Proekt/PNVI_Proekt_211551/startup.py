@@ -0,0 +1,87 @@
+import time
+
+PROBE_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+STARTUP_BUDGET_MS = 500
+PHASES = ['import', 'init', 'first_frame', 'total']
+
+
+def probe():
+    import pygame
+    from game import Game
+    imported = time.perf_counter()
+
+    game = Game()
+    initialized = time.perf_counter()
+
+    game.draw_menu()
+    game.present()
+    first_frame = time.perf_counter()
+    game.sound_manager.close()
+    pygame.quit()
+
+    print(json.dumps({
+        'import': (imported - PROBE_START) * 1000,
+        'init': (initialized - imported) * 1000,
+        'first_frame': (first_frame - initialized) * 1000,
+        'total': (first_frame - PROBE_START) * 1000
+    }))
+
+
+def run_startup(runs=10):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--probe'], capture_output=True,
+                                text=True, check=True, env=env,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {phase: {'median': statistics.median(sample[phase] for sample in samples),
+                    'max': max(sample[phase] for sample in samples)} for phase in PHASES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a fresh process from the first import to the first presented frame.")
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_MS, metavar='MS',
+                        help=f"fail when the median total exceeds this (default: {STARTUP_BUDGET_MS})")
+    parser.add_argument('--output', help="results file (default: benchmarks/startup-<commit>.json)")
+    parser.add_argument('--probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        probe()
+        return
+
+    from benchmark import RESULTS_DIR, current_commit
+    commit = current_commit()
+    phases = run_startup(args.runs)
+
+    print(f"{'phase':<12} {'median ms':>10} {'max ms':>10}")
+    for phase in PHASES:
+        print(f"{phase:<12} {phases[phase]['median']:>10.1f} {phases[phase]['max']:>10.1f}")
+
+    total = phases['total']['median']
+    within_budget = total <= args.budget
+    print(f"\n{'OK' if within_budget else 'OVER BUDGET'}: {total:.1f} ms of {args.budget:.0f} ms")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"startup-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'commit': commit, 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'), 'runs': args.runs,
+                   'budget_ms': args.budget, 'phases': phases}, f, indent=1)
+    print(f"Saved {output}")
+
+    if not within_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
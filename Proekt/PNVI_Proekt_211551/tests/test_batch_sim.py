@@ -0,0 +1,35 @@
+import pytest
+from batch_sim import apply_tuning, check_tuning_key, parse_tuning
+from headless import create_headless_game
+
+
+def test_valid_override_expands_and_applies():
+    tunings = parse_tuning(['multiplier.hard=1.5,2', 'enemy_spawn_base=40', 'player.easy.health=9'])
+    assert tunings == [
+        {'multiplier.hard': 1.5, 'enemy_spawn_base': 40.0, 'player.easy.health': 9.0},
+        {'multiplier.hard': 2.0, 'enemy_spawn_base': 40.0, 'player.easy.health': 9.0}
+    ]
+
+    game = create_headless_game('easy', 1)
+    untouched = create_headless_game('easy', 1)
+    apply_tuning(game, tunings[1])
+    assert game.difficulty_multipliers['hard'] == 2.0
+    assert game.enemy_spawn_base == 40
+    assert game.player_settings['easy']['health'] == 9
+    assert untouched.difficulty_multipliers['hard'] != 2.0
+    assert untouched.player_settings['easy']['health'] == 7
+
+
+@pytest.mark.parametrize('key', ['multiplier.insane', 'player.normal.mana', 'player.normal', 'enemy_spawn',
+                                 'power_up_rate', 'multiplier.hard.extra'])
+def test_unknown_key(key):
+    with pytest.raises(ValueError, match=f"Unknown tuning key '{key}'"):
+        check_tuning_key(key)
+    with pytest.raises(ValueError, match='Unknown tuning key'):
+        parse_tuning([f'{key}=1'])
+
+
+@pytest.mark.parametrize('assignment', ['multiplier.easy=abc', 'multiplier.easy', 'multiplier.easy=1,,2'])
+def test_malformed_value(assignment):
+    with pytest.raises(ValueError, match="Tuning 'multiplier.easy' needs comma-separated numbers"):
+        parse_tuning([assignment])
@@ -0,0 +1,99 @@
+import random
+import pygame
+import pytest
+from constants import *
+from bullets import BulletPool
+
+
+def forced(mode):
+    if mode == 'list':
+        return BulletPool(256)
+    pool = BulletPool(256)
+    pool.vector_above = 0
+    pool.scalar_below = 0
+    return pool
+
+
+def snapshot(pool):
+    order = pool.order()
+    return {name: pool.column(name)[order].tolist() for name, _ in pool.columns}
+
+
+def simulate(pool, seed, frames=120):
+    rng = random.Random(seed)
+    trace = []
+    for frame in range(frames):
+        for _ in range(rng.randint(0, 4)):
+            pool.spawn(rng.uniform(0, GAME_AREA_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                       (rng.uniform(-3, 3), rng.uniform(-12, 12)), rng.choice([RED, CYAN]), rng.randint(1, 3),
+                       rng.choice([1.0, 1.3, 1.5]))
+        pool.update()
+        pool.cull(min_y=0, max_y=SCREEN_HEIGHT)
+        if len(pool) and frame % 7 == 0:
+            serials = pool.column('serial')
+            doomed = set(rng.sample(sorted(serials.tolist()), min(3, len(pool))))
+            pool.remove([i for i, serial in enumerate(serials.tolist()) if serial in doomed])
+        trace.append(snapshot(pool))
+    return trace
+
+
+def test_spawn_sets_rect_from_size():
+    pool = BulletPool()
+    pool.spawn(100, 200, (0, -10), CYAN, 2, 1.5)
+    assert len(pool) == 1
+    rect = pygame.Rect(*(int(pool.column(name)[0]) for name in ('left', 'top', 'width', 'height')))
+    assert rect == pygame.Rect(100, 200, 9, 18)
+    assert pool.damage[0] == 2
+
+
+def test_spawn_respects_capacity():
+    pool = BulletPool(3)
+    assert all(pool.spawn(10 * i, 10, (0, 1)) for i in range(3))
+    assert not pool.spawn(50, 10, (0, 1))
+    assert len(pool) == 3
+
+
+def test_update_moves_and_rounds_half_away_from_zero():
+    pool = BulletPool()
+    pool.spawn(10.5, 20.5, (0, 0), WHITE, 1, 1.0)
+    pool.spawn(-2.5, 30.0, (0, 0), WHITE, 1, 1.0)
+    pool.update()
+    assert pool.left[0] == 11 - 3 and pool.top[0] == 21 - 6
+    assert pool.left[1] == -3 - 3
+
+
+def test_cull_keeps_serial_order():
+    pool = BulletPool()
+    for x in (100, -10, 200, GAME_AREA_WIDTH + 10, 300):
+        pool.spawn(x, 100, (0, 0))
+    pool.cull()
+    assert pool.column('x')[pool.order()].tolist() == [100, 200, 300]
+
+
+def test_pool_switches_storage_at_thresholds():
+    pool = BulletPool(256)
+    for i in range(pool.vector_above):
+        pool.spawn(i, 10, (0, 1))
+    assert not pool.vectorized
+    pool.spawn(0, 10, (0, 1))
+    assert pool.vectorized
+    pool.remove(list(range(len(pool) - pool.scalar_below + 1)))
+    assert not pool.vectorized
+    assert len(pool) == pool.scalar_below - 1
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_list_and_array_storage_agree(seed):
+    assert simulate(forced('list'), seed) == simulate(forced('array'), seed)
+
+
+def test_spawn_batch_matches_single_spawns():
+    batch = BulletPool()
+    batch.vector_above = 0
+    batch.scalar_below = 0
+    single = BulletPool()
+    x, y = [10.0, 20.0, 30.0], [5.0, 6.0, 7.0]
+    batch.spawn_batch(x, y, [0.0] * 3, [4.0] * 3, [1, 2, 3], [1.0, 1.5, 1.0], [RED, ORANGE], [0, 1, 0])
+    for i in range(3):
+        single.spawn(x[i], y[i], (0.0, 4.0), [RED, ORANGE, RED][i], i + 1, [1.0, 1.5, 1.0][i])
+    assert snapshot(batch) == snapshot(single)
@@ -0,0 +1,165 @@
+import random
+import numpy as np
+import pytest
+from constants import *
+from bullets import BulletPool, sweep_time
+from entities import EnemySwarm
+from headless import create_headless_game
+from game import BRUTE_FORCE_PAIRS
+
+
+def make_game(mode='list', collision_mode='discrete'):
+    game = create_headless_game(seed=1, collision_mode=collision_mode)
+    game.player_bullets = BulletPool()
+    game.enemies = EnemySwarm()
+    if mode == 'array':
+        for pool in (game.player_bullets, game.enemies):
+            pool.vector_above = 0
+            pool.scalar_below = 0
+    return game
+
+
+def populate(game, seed, bullet_count, enemy_count):
+    rng = random.Random(seed)
+    for _ in range(enemy_count):
+        game.enemies.spawn(rng.uniform(100, 800), rng.uniform(100, 500), rng.choice(['basic', 'heavy', 'fast']))
+    game.enemies.update(rng.uniform(0, GAME_AREA_WIDTH), 1.5)
+    for _ in range(bullet_count):
+        game.player_bullets.spawn(rng.uniform(100, 800), rng.uniform(100, 600),
+                                  (rng.uniform(-8, 8), rng.choice([-10, -40, -90])), size=rng.choice([1.0, 1.5]))
+    game.player_bullets.update()
+
+
+def sampled_overlaps(game, samples=200):
+    bullets = game.player_bullets
+    enemies = game.enemies
+    start_left, start_top = bullets.start_corners()
+    left, top = bullets.column('left'), bullets.column('top')
+    width, height = bullets.column('width'), bullets.column('height')
+    enemy_left, enemy_top, _, _ = enemies.bounds()
+    dx = enemies.column('x') - enemies.column('prev_x')
+    dy = enemies.column('y') - enemies.column('prev_y')
+    pairs = set()
+    for step in range(samples + 1):
+        t = step / samples
+        bullet_left = start_left + (left - start_left) * t
+        bullet_top = start_top + (top - start_top) * t
+        target_left = enemy_left - dx + dx * t
+        target_top = enemy_top - dy + dy * t
+        hit = ((bullet_left[:, None] < target_left + enemies.size) & (target_left < (bullet_left + width)[:, None]) &
+               (bullet_top[:, None] < target_top + enemies.size) & (target_top < (bullet_top + height)[:, None]))
+        pairs.update(zip(*(index.tolist() for index in np.nonzero(hit))))
+    return pairs
+
+
+def hit_pairs(hits):
+    return {(i, j) for i, targets in hits for j in targets}
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('collision_mode', ['discrete', 'swept'])
+def test_direct_hits_match_vector_hits(seed, collision_mode):
+    direct = make_game('list', collision_mode)
+    vector = make_game('array', collision_mode)
+    populate(direct, seed, 12, 12)
+    populate(vector, seed, 12, 12)
+    if collision_mode == 'swept':
+        assert direct.direct_swept_hits() == vector.swept_enemy_hits()
+    else:
+        assert direct.direct_discrete_hits() == vector.discrete_enemy_hits()
+
+
+def brute_force_discrete_hits(game):
+    bullets = game.player_bullets
+    left, top, right, bottom = game.enemies.bounds()
+    hits = []
+    for i in range(len(bullets)):
+        bullet_left, bullet_top = bullets.left[i], bullets.top[i]
+        bullet_right, bullet_bottom = bullet_left + bullets.width[i], bullet_top + bullets.height[i]
+        targets = [j for j in range(len(game.enemies))
+                   if bullet_left < right[j] and left[j] < bullet_right and bullet_top < bottom[j] and top[j] < bullet_bottom]
+        if targets:
+            hits.append((i, targets))
+    return hits
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_discrete_grid_matches_brute_force(seed):
+    game = make_game('array')
+    grid = game.collision_grid
+    cell = grid.cell_size
+    size = game.enemies.size
+    rng = random.Random(seed)
+    for _ in range(60):
+        game.enemies.spawn(cell * rng.randrange(1, grid.cols) - rng.uniform(0, size),
+                           cell * rng.randrange(1, grid.rows) - rng.uniform(0, size), rng.choice(['basic', 'heavy', 'fast']))
+    for _ in range(120):
+        game.player_bullets.spawn(cell * rng.randrange(1, grid.cols) + rng.uniform(-size, size),
+                                  cell * rng.randrange(1, grid.rows) + rng.uniform(-size, size), (0, 0),
+                                  size=rng.choice([1.0, 1.5]))
+    game.player_bullets.update()
+
+    bullets = game.player_bullets
+    left, top = bullets.column('left'), bullets.column('top')
+    right, bottom = left + bullets.column('width'), top + bullets.column('height')
+    straddling = (left // cell != (right - 1) // cell) | (top // cell != (bottom - 1) // cell)
+    assert len(bullets) * len(game.enemies) > BRUTE_FORCE_PAIRS
+    assert straddling.any()
+
+    hits = game.discrete_enemy_hits()
+    assert hits == brute_force_discrete_hits(game)
+    assert any(straddling[i] for i, _ in hits)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_swept_grid_matches_brute_force(seed):
+    game = make_game('array', 'swept')
+    populate(game, seed, 150, 60)
+    bullets = game.player_bullets
+    enemies = game.enemies
+    start_left, start_top = bullets.start_corners()
+    left, top, right, bottom = enemies.bounds()
+    dx = enemies.column('x') - enemies.column('prev_x')
+    dy = enemies.column('y') - enemies.column('prev_y')
+
+    expected = []
+    for i in range(len(bullets)):
+        times = []
+        for j in range(len(enemies)):
+            entry = sweep_time(start_left[i], start_top[i], bullets.width[i], bullets.height[i],
+                               bullets.left[i] - start_left[i] - dx[j], bullets.top[i] - start_top[i] - dy[j],
+                               left[j] - dx[j], top[j] - dy[j], right[j] - dx[j], bottom[j] - dy[j])
+            if entry < np.inf:
+                times.append((entry, j))
+        if times:
+            expected.append((i, [j for _, j in sorted(times)]))
+
+    assert game.swept_enemy_hits() == expected
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('mode', ['list', 'array'])
+def test_swept_hits_cover_sampled_overlaps(seed, mode):
+    game = make_game(mode, 'swept')
+    populate(game, seed, 12, 12)
+    hits = game.direct_swept_hits() if mode == 'list' else game.swept_enemy_hits()
+    assert sampled_overlaps(game) <= hit_pairs(hits)
+
+
+@pytest.mark.parametrize('mode', ['list', 'array'])
+def test_fast_bullet_hits_only_when_swept(mode):
+    game = make_game(mode)
+    game.enemies.spawn(400, 300, 'basic')
+    size = game.enemies.size
+    left, top = int(game.enemies.left[0]), int(game.enemies.top[0])
+    start = top + size + 30
+    end = top - 30
+    game.player_bullets.spawn(left + size // 2, start, (0, end - start))
+    game.player_bullets.update()
+
+    if mode == 'list':
+        assert game.direct_discrete_hits() == []
+        assert game.direct_swept_hits() == [(0, [0])]
+    else:
+        assert game.discrete_enemy_hits() == []
+        assert game.swept_enemy_hits() == [(0, [0])]
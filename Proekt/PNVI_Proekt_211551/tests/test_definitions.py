@@ -0,0 +1,79 @@
+import copy
+import json
+import pytest
+from definitions import DEFINITIONS_PATH, DefinitionError, Definitions
+
+
+@pytest.fixture
+def data():
+    with open(DEFINITIONS_PATH) as f:
+        return json.load(f)
+
+
+def test_shipped_definitions_load(data):
+    definitions = Definitions(copy.deepcopy(data))
+    assert set(definitions.spawn_table) <= set(definitions.enemy_types)
+    assert len(definitions.boss_phases) == len(data['boss']['phases'])
+
+
+def test_unknown_movement_pattern(data):
+    data['enemies']['basic']['movement']['pattern'] = 'spiral'
+    with pytest.raises(DefinitionError, match="unknown movement pattern 'spiral'"):
+        Definitions(data)
+
+
+def test_bad_movement_settings(data):
+    data['enemies']['basic']['movement']['wobble'] = 3
+    with pytest.raises(DefinitionError, match="bad 'straight' movement settings"):
+        Definitions(data)
+
+
+@pytest.mark.parametrize('enter_below', [None, 0, 1.5, 0.6])
+def test_bad_boss_thresholds(data, enter_below):
+    data['boss']['phases'][2]['enter_below'] = enter_below
+    with pytest.raises(DefinitionError, match='Boss phase 3'):
+        Definitions(data)
+
+
+def test_mothership_thresholds_must_descend(data):
+    data['mothership']['phases'][1]['above'] = 25
+    with pytest.raises(DefinitionError, match='Mothership phase 2'):
+        Definitions(data)
+
+
+def test_last_mothership_phase_has_no_threshold(data):
+    data['mothership']['phases'][2]['above'] = 5
+    with pytest.raises(DefinitionError, match='last mothership phase'):
+        Definitions(data)
+
+
+def test_phase_without_bullets(data):
+    data['boss']['phases'][0]['volley'] = []
+    with pytest.raises(DefinitionError, match='fires no bullets'):
+        Definitions(data)
+
+
+@pytest.mark.parametrize('shot', [{'offset': [0, 60]}, {'velocity': [0, 5]}])
+def test_volley_shot_missing_field(data, shot):
+    data['boss']['phases'][0]['volley'] = [shot]
+    with pytest.raises(DefinitionError, match='Missing definition field'):
+        Definitions(data)
+
+
+@pytest.mark.parametrize('shot', [{'offset': 0, 'velocity': [0, 5]}, {'offset': [0, 60], 'velocity': [5]}])
+def test_malformed_volley_shot(data, shot):
+    data['boss']['phases'][0]['volley'] = [shot]
+    with pytest.raises(DefinitionError, match='Malformed volley'):
+        Definitions(data)
+
+
+def test_malformed_spread(data):
+    del data['mothership']['phases'][2]['spread']['angle_step']
+    with pytest.raises(DefinitionError, match="'angle_step'"):
+        Definitions(data)
+
+
+def test_unknown_spawn_type(data):
+    data['waves']['spawn_table'].append('ghost')
+    with pytest.raises(DefinitionError, match='ghost'):
+        Definitions(data)
@@ -0,0 +1,81 @@
+import random
+import numpy as np
+import pytest
+from constants import *
+from definitions import definitions
+from entities import EnemySwarm
+
+
+def forced(mode):
+    swarm = EnemySwarm(256)
+    if mode == 'array':
+        swarm.vector_above = 0
+        swarm.scalar_below = 0
+    return swarm
+
+
+def snapshot(swarm):
+    return {name: swarm.column(name).tolist() for name, _ in swarm.columns}
+
+
+def shots_as_lists(shots):
+    if shots is None:
+        return None
+    return [np.asarray(values).tolist() for i, values in enumerate(shots) if i != 6]
+
+
+def simulate(swarm, seed, frames=200):
+    rng = random.Random(seed)
+    names = list(definitions.enemy_types)
+    trace = []
+    for frame in range(frames):
+        if rng.random() < 0.3:
+            swarm.spawn(rng.randint(50, GAME_AREA_WIDTH - 50), rng.randint(-50, 300), rng.choice(names))
+        shots = swarm.update(rng.uniform(0, GAME_AREA_WIDTH), rng.choice([0.8, 1.0, 1.5]))
+        swarm.cull()
+        if len(swarm) and frame % 11 == 0:
+            swarm.remove(rng.sample(range(len(swarm)), 1))
+        trace.append((snapshot(swarm), shots_as_lists(shots)))
+    return trace
+
+
+def test_spawn_uses_type_health():
+    swarm = EnemySwarm()
+    swarm.spawn(100, -50, 'heavy')
+    assert len(swarm) == 1
+    assert swarm.enemy_type(0) == 'heavy'
+    assert swarm.health[0] == definitions.enemy_types['heavy'].health
+
+
+def test_bounds_are_centered_boxes():
+    swarm = EnemySwarm()
+    swarm.spawn(100, 200, 'basic')
+    swarm.update(100, 1.0)
+    left, top, right, bottom = swarm.bounds()
+    assert right[0] - left[0] == swarm.size and bottom[0] - top[0] == swarm.size
+    assert left[0] == round(swarm.x[0]) - swarm.size // 2
+
+
+def test_cull_drops_enemies_below_the_screen():
+    swarm = EnemySwarm()
+    swarm.spawn(100, SCREEN_HEIGHT + 10, 'basic')
+    swarm.spawn(200, 100, 'basic')
+    swarm.cull()
+    assert swarm.column('x').tolist() == [200]
+
+
+@pytest.mark.parametrize('name', list(definitions.enemy_types))
+def test_scalar_step_matches_vector_move(name):
+    enemy_type = definitions.enemy_types[name]
+    rng = random.Random(name)
+    x = [rng.uniform(0, GAME_AREA_WIDTH) for _ in range(50)]
+    y = [rng.uniform(-50, SCREEN_HEIGHT) for _ in range(50)]
+    moved_x, moved_y = enemy_type.move(np.array(x), np.array(y), 400.0, enemy_type.speed * 1.5)
+    stepped = [enemy_type.step(x[i], y[i], 400.0, enemy_type.speed * 1.5) for i in range(50)]
+    assert [float(value) for value in moved_x] == [value for value, _ in stepped]
+    assert [float(value) for value in moved_y] == [value for _, value in stepped]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_list_and_array_storage_agree(seed):
+    assert simulate(forced('list'), seed) == simulate(forced('array'), seed)
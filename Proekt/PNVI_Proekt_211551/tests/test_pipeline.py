@@ -0,0 +1,46 @@
+import pygame
+import pytest
+from constants import *
+from headless import create_headless_game
+from pipeline import FramePipeline
+from starfield import StarField
+
+FRAMES = 150
+
+
+def make_game(seed, mode, dirty):
+    game = create_headless_game('hard', seed)
+    game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game.starfield = StarField(seed=seed)
+    game.dirty_rendering = dirty
+    if mode == 'array':
+        for pool in (game.player_bullets, game.enemy_bullets, game.enemies):
+            pool.vector_above = 0
+            pool.scalar_below = 0
+    return game
+
+
+@pytest.mark.parametrize('dirty', [False, True])
+@pytest.mark.parametrize('mode', ['list', 'array'])
+def test_pipelined_frames_match_serial_frames(monkeypatch, mode, dirty):
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 1000)
+    serial = make_game(4, mode, dirty)
+    piped = make_game(4, mode, dirty)
+    pipeline = FramePipeline(piped)
+
+    previous = None
+    try:
+        for frame in range(FRAMES):
+            for game in (serial, piped):
+                game.player.power_ups['triple_shot'] = 5
+            pipeline.run_frame(1, 1.0)
+            if previous is not None:
+                assert pygame.image.tobytes(piped.screen, 'RGB') == previous, frame
+            serial.step()
+            serial.draw_game(1.0)
+            previous = pygame.image.tobytes(serial.screen, 'RGB')
+    finally:
+        pipeline.close()
+
+    assert piped.score == serial.score
+    assert len(piped.player_bullets) == len(serial.player_bullets)
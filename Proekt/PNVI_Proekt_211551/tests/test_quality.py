@@ -0,0 +1,115 @@
+from headless import create_headless_game
+from quality import QUALITY_TIERS, QualityGovernor
+
+BUDGET = 0.01
+SLOW = BUDGET * 2
+FAST = BUDGET * 0.5
+
+
+def governor():
+    return QualityGovernor(budget=BUDGET, window=5, restore_after=10, max_restore_after=40)
+
+
+def feed(governor, frame_seconds, frames):
+    for _ in range(frames):
+        governor.observe(frame_seconds)
+
+
+def test_starts_at_highest_tier():
+    quality = governor()
+    assert quality.tier == 0
+    assert quality.name == 'high'
+    assert quality.particle_density == QUALITY_TIERS[0]['particle_density']
+
+
+def test_needs_a_full_window_before_degrading():
+    quality = governor()
+    feed(quality, SLOW, 4)
+    assert quality.tier == 0
+    feed(quality, SLOW, 1)
+    assert quality.tier == 1
+    assert quality.name == 'medium'
+
+
+def test_degrades_one_tier_per_window_down_to_lowest():
+    quality = governor()
+    feed(quality, SLOW, 50)
+    assert quality.tier == len(QUALITY_TIERS) - 1
+    assert quality.changes == len(QUALITY_TIERS) - 1
+    assert quality.glow_layers == 0 and not quality.background_glow
+
+
+def test_restores_after_sustained_headroom():
+    quality = governor()
+    feed(quality, SLOW, 5)
+    feed(quality, FAST, 4 + quality.restore_wait - 1)
+    assert quality.tier == 1
+    feed(quality, FAST, 1)
+    assert quality.tier == 0
+
+
+def test_frames_within_budget_but_without_headroom_do_not_restore():
+    quality = governor()
+    feed(quality, SLOW, 5)
+    feed(quality, BUDGET * 0.9, 100)
+    assert quality.tier == 1
+
+
+def test_premature_restore_doubles_the_wait():
+    quality = governor()
+    feed(quality, SLOW, 5)
+    feed(quality, FAST, 14)
+    assert quality.tier == 0
+    feed(quality, SLOW, 5)
+    assert quality.tier == 1
+    assert quality.restore_wait == 20
+
+    feed(quality, FAST, 24)
+    feed(quality, SLOW, 5)
+    assert quality.restore_wait == 40
+    feed(quality, FAST, 44)
+    feed(quality, SLOW, 5)
+    assert quality.restore_wait == 40
+
+
+def test_late_regression_keeps_the_wait():
+    quality = governor()
+    feed(quality, SLOW, 5)
+    feed(quality, FAST, 14)
+    feed(quality, FAST, quality.restore_wait)
+    feed(quality, SLOW, 5)
+    assert quality.tier == 1
+    assert quality.restore_wait == 10
+
+
+def test_reset_and_telemetry():
+    quality = governor()
+    feed(quality, SLOW, 5)
+    feed(quality, FAST, 14)
+    feed(quality, SLOW, 50)
+    assert quality.telemetry() == {'quality.tier': 2, 'quality.changes': 4, 'quality.restore_wait': 20}
+
+    quality.reset()
+    assert quality.telemetry() == {'quality.tier': 0, 'quality.changes': 0, 'quality.restore_wait': 10}
+    feed(quality, SLOW, 4)
+    assert quality.tier == 0
+
+
+def test_set_tier_applies_settings():
+    quality = governor()
+    quality.set_tier(2)
+    assert quality.name == 'low'
+    assert quality.max_particles == QUALITY_TIERS[2]['max_particles']
+    assert quality.star_density == QUALITY_TIERS[2]['star_density']
+
+
+def test_each_game_has_its_own_governor():
+    first = create_headless_game(seed=1)
+    second = create_headless_game(seed=1)
+    first.quality.set_tier(2)
+    first.reset_game(2)
+
+    assert first.quality.tier == 2
+    assert second.quality.tier == 0
+    assert first.profile_counts()['quality.tier'] == 2
+    assert second.profile_counts()['quality.tier'] == 0
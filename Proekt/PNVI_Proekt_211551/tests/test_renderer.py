@@ -0,0 +1,35 @@
+import pygame
+import pytest
+from constants import *
+from headless import create_headless_game
+from starfield import StarField
+
+FRAMES = 300
+
+
+def make_game(difficulty, seed, dirty):
+    game = create_headless_game(difficulty, seed)
+    game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game.starfield = StarField(seed=seed)
+    game.dirty_rendering = dirty
+    return game
+
+
+@pytest.mark.parametrize('difficulty, seed', [('normal', 3), ('hard', 4)])
+def test_dirty_frames_match_full_redraws(monkeypatch, difficulty, seed):
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 0)
+    full = make_game(difficulty, seed, False)
+    dirty = make_game(difficulty, seed, True)
+
+    partial = 0
+    for frame in range(FRAMES):
+        if full.state != 'playing':
+            break
+        for game in (full, dirty):
+            game.step()
+            game.draw_game(0.5 if frame % 3 else 1.0)
+            game.presented_state = game.state
+        assert pygame.image.tobytes(dirty.screen, 'RGB') == pygame.image.tobytes(full.screen, 'RGB'), frame
+        partial += not dirty.dirty_renderer.full
+
+    assert partial > FRAMES // 2
@@ -0,0 +1,97 @@
+import struct
+import pytest
+from headless import create_headless_game
+from replay import (HEADER_FORMAT, REPLAY_VERSION, Replay, ReplayDesyncError, ReplayError, ReplayRecorder,
+                    decode_input, encode_input, play_replay)
+
+FRAMES = 240
+
+
+def record(tmp_path, collision_mode='discrete', frames=FRAMES):
+    game = create_headless_game('hard', seed=7, collision_mode=collision_mode)
+    recorder = ReplayRecorder(game.seed, game.difficulty, collision_mode, checksum_interval=30)
+    for _ in range(frames):
+        game.update_game()
+        recorder.record(game, game.controls)
+    path = tmp_path / f'session_{collision_mode}.gdr'
+    recorder.save(str(path))
+    return path, recorder
+
+
+@pytest.fixture
+def replay_file(tmp_path):
+    return record(tmp_path)
+
+
+def test_input_mask_round_trip():
+    for mask in range(64):
+        assert encode_input(decode_input(mask)) == mask
+
+
+def test_save_and_load_round_trip(replay_file):
+    path, recorder = replay_file
+    replay = Replay.load(str(path))
+    assert (replay.seed, replay.difficulty, replay.checksum_interval) == (7, 'hard', 30)
+    assert replay.collision_mode == 'discrete'
+    assert replay.frames == bytes(recorder.frames)
+    assert replay.checksums == recorder.checksums
+    assert len(replay.checksums) == FRAMES // 30
+
+
+def test_play_replay_verifies_checksums(replay_file):
+    path, recorder = replay_file
+    result = play_replay(str(path))
+    assert result['frames'] == FRAMES
+    assert result['checksums_verified'] == len(recorder.checksums)
+
+
+def test_play_replay_uses_recorded_collision_mode(tmp_path):
+    path, recorder = record(tmp_path, 'swept', frames=300)
+    assert Replay.load(str(path)).collision_mode == 'swept'
+
+    result = play_replay(str(path))
+    assert result['collision_mode'] == 'swept'
+    assert result['checksums_verified'] == len(recorder.checksums) == 10
+
+
+def test_tampered_checksum_desyncs(replay_file):
+    path, _ = replay_file
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xff
+    path.write_bytes(bytes(data))
+    with pytest.raises(ReplayDesyncError) as error:
+        play_replay(str(path))
+    assert error.value.frame == FRAMES
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'short.gdr'
+    path.write_bytes(b'GDSR')
+    with pytest.raises(ReplayError, match='too short'):
+        Replay.load(str(path))
+
+    path.write_bytes(b'XXXX' + bytes(struct.calcsize(HEADER_FORMAT)))
+    with pytest.raises(ReplayError, match='not a replay'):
+        Replay.load(str(path))
+
+    path.write_bytes(struct.pack(HEADER_FORMAT, b'GDSR', 99, 0, 0, 0, 60, 0, 0, 0))
+    with pytest.raises(ReplayError, match='Unsupported replay version'):
+        Replay.load(str(path))
+
+    path.write_bytes(struct.pack(HEADER_FORMAT, b'GDSR', REPLAY_VERSION, 0, 9, 0, 60, 0, 0, 0))
+    with pytest.raises(ReplayError, match='Unknown collision mode 9'):
+        Replay.load(str(path))
+
+
+def test_truncated_payload_raises(replay_file):
+    path, _ = replay_file
+    path.write_bytes(path.read_bytes()[:struct.calcsize(HEADER_FORMAT) + 4])
+    with pytest.raises(ReplayError, match='truncated'):
+        Replay.load(str(path))
+
+
+def test_truncated_checksum_block_raises(replay_file):
+    path, _ = replay_file
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ReplayError, match='truncated checksum block'):
+        Replay.load(str(path))
@@ -0,0 +1,151 @@
+import json
+import pygame
+from constants import *
+from headless import create_headless_game
+from score_store import INDEX_FILE, LEGACY_FILE, LOG_FILE, ScoreStore
+
+
+def session(score, difficulty='normal', kills=None):
+    return {'seed': score, 'difficulty': difficulty, 'score': score, 'level': 1, 'duration': 1.5,
+            'kills': kills or {'basic': 1}}
+
+
+def log_lines(directory):
+    return (directory / LOG_FILE).read_text().splitlines()
+
+
+def test_sessions_survive_reload(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    for score in (30, 90, 60):
+        store.record(session(score))
+    store.record(session(500, 'hard'))
+    store.close()
+
+    store = ScoreStore(str(tmp_path))
+    store.close()
+    assert store.high_score == 500
+    assert [entry['score'] for entry in store.top_scores('normal')] == [90, 60, 30]
+    assert store.totals('normal')['sessions'] == 3
+    assert store.totals('normal')['score'] == 180
+    assert store.totals('normal')['kills'] == {'basic': 3}
+
+
+def test_log_is_compacted_past_max_sessions(tmp_path):
+    store = ScoreStore(str(tmp_path), max_log_sessions=4)
+    for score in range(1, 8):
+        store.record(session(score))
+    store.close()
+
+    assert len(log_lines(tmp_path)) == 4
+    assert [json.loads(line)['score'] for line in log_lines(tmp_path)] == [4, 5, 6, 7]
+    index = json.loads((tmp_path / INDEX_FILE).read_text())
+    assert index['log_sessions'] == 4
+    assert index['log_size'] == (tmp_path / LOG_FILE).stat().st_size
+
+    store = ScoreStore(str(tmp_path), max_log_sessions=4)
+    store.close()
+    assert store.totals('normal')['sessions'] == 7
+    assert store.index['last_id'] == 7
+
+
+def test_sessions_missing_from_index_are_replayed(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    store.record(session(10))
+    store.close()
+    stale_index = (tmp_path / INDEX_FILE).read_text()
+
+    store = ScoreStore(str(tmp_path))
+    store.record(session(20))
+    store.close()
+    (tmp_path / INDEX_FILE).write_text(stale_index)
+
+    store = ScoreStore(str(tmp_path))
+    store.close()
+    assert store.totals('normal')['sessions'] == 2
+    assert store.high_score == 20
+
+
+def test_torn_log_line_is_dropped(tmp_path):
+    store = ScoreStore(str(tmp_path))
+    store.record(session(10))
+    store.close()
+    (tmp_path / INDEX_FILE).unlink()
+    with open(tmp_path / LOG_FILE, 'a') as f:
+        f.write('{"id": 2, "sco')
+
+    store = ScoreStore(str(tmp_path))
+    store.close()
+    assert store.totals('normal')['sessions'] == 1
+    assert len(log_lines(tmp_path)) == 1
+
+
+def test_legacy_high_score_is_imported(tmp_path):
+    (tmp_path / LEGACY_FILE).write_text(json.dumps({'high_score': 1234}))
+    store = ScoreStore(str(tmp_path))
+    store.close()
+    assert store.high_score == 1234
+
+
+def test_lethal_hits_record_one_session(tmp_path):
+    game = create_headless_game(seed=3)
+    game.score_store = ScoreStore(str(tmp_path))
+    player = game.player
+    player.health = 1
+    for _ in range(5):
+        game.enemy_bullets.spawn(player.x, player.y, (0, 0))
+
+    game.handle_collisions()
+    game.handle_collisions()
+    game.score_store.close()
+
+    assert game.state == 'game_over'
+    assert len(log_lines(tmp_path)) == 1
+
+
+def recording_game(tmp_path, monkeypatch, *events):
+    game = create_headless_game(seed=3)
+    game.score_store = ScoreStore(str(tmp_path))
+    game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    monkeypatch.setattr(pygame.event, 'get', lambda: list(events))
+    for _ in range(30):
+        game.update_game()
+    return game
+
+
+def test_leaving_a_paused_game_records_one_session(tmp_path, monkeypatch):
+    game = recording_game(tmp_path, monkeypatch, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m))
+    game.state = 'paused'
+
+    game.handle_events()
+    assert game.state == 'menu'
+    assert game.session_recorded
+
+    game.record_session()
+    game.score_store.close()
+    assert len(log_lines(tmp_path)) == 1
+    assert json.loads(log_lines(tmp_path)[0])['duration'] == round(30 / FPS, 2)
+
+
+def test_closing_the_window_records_the_running_session(tmp_path, monkeypatch):
+    game = recording_game(tmp_path, monkeypatch, pygame.event.Event(pygame.QUIT))
+    monkeypatch.setattr(game, 'present', lambda: None)
+    monkeypatch.setattr(game, 'prewarm', lambda: None)
+    monkeypatch.setattr(pygame, 'quit', lambda: None)
+
+    game.run()
+
+    assert len(log_lines(tmp_path)) == 1
+
+
+def test_closing_the_window_after_game_over_adds_nothing(tmp_path, monkeypatch):
+    game = recording_game(tmp_path, monkeypatch, pygame.event.Event(pygame.QUIT))
+    monkeypatch.setattr(game, 'present', lambda: None)
+    monkeypatch.setattr(game, 'prewarm', lambda: None)
+    monkeypatch.setattr(game, 'draw_game_over', lambda: None)
+    monkeypatch.setattr(pygame, 'quit', lambda: None)
+    game.state = 'game_over'
+    game.record_session()
+
+    game.run()
+
+    assert len(log_lines(tmp_path)) == 1
@@ -0,0 +1,124 @@
+import pytest
+from sound_manager import CHANNELS, RESERVED_CHANNELS, SOUND_FILES, SOUND_PRIORITIES, SoundManager
+
+
+class StubChannel:
+    def __init__(self):
+        self.busy = False
+        self.played = []
+
+    def get_busy(self):
+        return self.busy
+
+    def play(self, sound):
+        self.busy = True
+        self.played.append(sound)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(SoundManager, 'start', lambda self: None)
+    manager = SoundManager()
+    manager.close()
+    manager.channels = [StubChannel() for _ in range(CHANNELS)]
+    manager.channel_priorities = [0] * CHANNELS
+    manager.sounds = {name: name for name in SOUND_FILES}
+    return manager
+
+
+def occupy(manager, priority):
+    for i, channel in enumerate(manager.channels):
+        channel.busy = True
+        manager.channel_priorities[i] = priority
+
+
+def played(manager):
+    return {i: channel.played for i, channel in enumerate(manager.channels) if channel.played}
+
+
+def test_repeated_requests_play_once_per_flush(manager):
+    for _ in range(5):
+        manager.play_sound('explosion')
+    manager.flush()
+    assert played(manager) == {0: ['explosion']}
+    assert not manager.pending
+
+    manager.play_sound('explosion')
+    manager.flush()
+    assert played(manager) == {0: ['explosion'], 1: ['explosion']}
+
+
+def test_low_priority_sounds_skip_reserved_channels(manager):
+    manager.play_sound('enemy_shoot')
+    manager.play_sound('player_shoot')
+    manager.flush()
+    assert played(manager) == {RESERVED_CHANNELS: ['player_shoot'], RESERVED_CHANNELS + 1: ['enemy_shoot']}
+
+
+def test_high_priority_sounds_use_reserved_channels(manager):
+    occupy(manager, SOUND_PRIORITIES['game_over'])
+    for i in range(RESERVED_CHANNELS):
+        manager.channels[i].busy = False
+    manager.play_sound('enemy_shoot')
+    manager.play_sound('explosion')
+    manager.flush()
+    assert played(manager) == {0: ['explosion']}
+
+
+def test_higher_priority_steals_lowest_priority_channel(manager):
+    occupy(manager, 1)
+    manager.channel_priorities[9] = 0
+    manager.play_sound('explosion')
+    manager.flush()
+    assert played(manager) == {9: ['explosion']}
+    assert manager.channel_priorities[9] == SOUND_PRIORITIES['explosion']
+
+
+def test_equal_priority_does_not_steal(manager):
+    occupy(manager, 1)
+    manager.play_sound('player_shoot')
+    manager.play_sound('enemy_shoot')
+    manager.flush()
+    assert played(manager) == {}
+
+
+def test_low_priority_never_steals_reserved_channels(manager):
+    occupy(manager, 1)
+    for i in range(RESERVED_CHANNELS):
+        manager.channel_priorities[i] = 0
+    manager.play_sound('player_shoot')
+    manager.flush()
+    assert played(manager) == {}
+
+
+def test_flush_plays_highest_priority_first(manager):
+    occupy(manager, 3)
+    manager.channels[CHANNELS - 1].busy = False
+    manager.play_sound('enemy_shoot')
+    manager.play_sound('reload')
+    manager.flush()
+    assert played(manager) == {CHANNELS - 1: ['reload']}
+
+
+def test_missing_sounds_are_skipped(manager):
+    manager.sounds['powerup'] = None
+    manager.play_sound('powerup')
+    manager.play_sound('boss_hit')
+    manager.flush()
+    assert played(manager) == {0: ['boss_hit']}
+
+
+def test_flush_without_mixer_drops_requests(manager):
+    manager.channels = []
+    manager.play_sound('explosion')
+    manager.flush()
+    assert not manager.pending
+
+
+def test_close_joins_loader(monkeypatch):
+    monkeypatch.setattr(SoundManager, 'init_mixer', lambda self: True)
+    monkeypatch.setattr(SoundManager, 'decode', lambda self, name: name)
+    manager = SoundManager()
+    manager.close()
+    assert not manager.loader.is_alive()
+    assert set(manager.sounds) <= set(SOUND_FILES)
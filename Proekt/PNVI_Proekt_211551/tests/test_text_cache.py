@@ -0,0 +1,28 @@
+from constants import *
+from text_cache import TextCache
+
+
+def test_least_recently_used_surface_is_evicted():
+    cache = TextCache()
+    first = cache.render("0", 24, WHITE)
+    second = cache.render("1", 24, WHITE)
+    for i in range(2, cache.max_entries):
+        cache.render(str(i), 24, WHITE)
+    assert len(cache.surfaces) == cache.max_entries == 256
+
+    assert cache.render("0", 24, WHITE) is first
+    cache.render("new", 24, WHITE)
+
+    assert len(cache.surfaces) == cache.max_entries
+    assert (None, 24, "1", WHITE) not in cache.surfaces
+    assert cache.render("0", 24, WHITE) is first
+    assert cache.render("1", 24, WHITE) is not second
+
+
+def test_size_and_color_are_part_of_the_key():
+    cache = TextCache()
+    surface = cache.render("Score", 24, WHITE)
+    assert cache.render("Score", 32, WHITE) is not surface
+    assert cache.render("Score", 24, YELLOW) is not surface
+    assert cache.render("Score", 24, WHITE) is surface
+    assert len(cache.fonts) == 2